@@ -5,6 +5,9 @@ Checks HTML files for accessibility issues.
 
 Usage:
     python accessibility_checker.py <project_path>
+    python accessibility_checker.py <project_path> --format jsonl|sarif
+    python accessibility_checker.py <project_path> --jobs 4
+    python accessibility_checker.py <project_path> --budget 5
 
 Checks:
     - Form labels
@@ -12,14 +15,37 @@ Checks:
     - Color contrast hints
     - Keyboard navigation
     - Semantic HTML
+
+HTML files are read through the shared parsed-document IR
+(execution/html_ir.py) when the project provides it, so a full QA sweep
+parses each page once. JSX/TSX files, or trees without execution/, fall
+back to the regex scan.
+
+Files are found by one os.scandir walk that prunes ignored directories
+(node_modules, .venv, build output, ...) before descending, and are fed
+lazily to --jobs N checker processes (default: all cores); results come
+back in walk order. Every file is checked; totals cover the whole tree.
+
+Each file gets a time budget (--budget SECONDS, default 10, 0 disables;
+ux_audit.time_budget). A file that runs past it has its remaining checks
+skipped and is reported with a "Budget exceeded" issue, so one
+pathological input cannot hang the pipeline.
+
+--format jsonl|sarif writes every issue as soon as its file is checked
+(execution/qa_emit.py) instead of the first-10-files text report.
 """
 
 import sys
+import os
 import json
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from ux_audit import FILE_BUDGET, AuditTimeout, time_budget
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -27,29 +53,118 @@ except:
     pass
 
 
-def find_html_files(project_path: Path) -> list:
-    """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
-    skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
-    
-    return files[:50]
+def _import_html_ir():
+    """Import execution/html_ir.py from the enclosing project, if any."""
+    for parent in Path(__file__).resolve().parents:
+        candidate = parent / "execution" / "html_ir.py"
+        if candidate.is_file():
+            sys.path.insert(0, str(candidate.parent))
+            try:
+                import html_ir
+                return html_ir
+            except ImportError:
+                return None
+    return None
+
+
+html_ir = _import_html_ir()
+
+try:
+    import qa_emit  # Alongside html_ir in execution/
+except ImportError:
+    qa_emit = None
+
+
+# Regex-scan patterns (files without the IR: JSX/TSX, or no execution/)
+INPUT_TAG_RE = re.compile(r'<input[^<>]*>', re.IGNORECASE)
+BUTTON_RE = re.compile(r'<button[^<>]*>[^<]*</button>', re.IGNORECASE)
+TAG_RE = re.compile(r'<[^<>]+>')
+POSITIVE_TABINDEX_RE = re.compile(r'tabindex="([1-9]\d*)"', re.IGNORECASE)
+DIV_ROLE_BUTTON_RE = re.compile(r'<div[^<>]*role="button"[^<>]*>', re.IGNORECASE)
+
+
+EXTENSIONS = ('.html', '.jsx', '.tsx')
+SKIP_DIRS = {'node_modules', '.next', 'dist', 'build', '.git', '.tmp',
+             '.venv', 'venv', '__pycache__'}
+
+
+def find_html_files(project_path: Path):
+    """Yield every HTML/JSX/TSX file, in sorted depth-first order.
+
+    One os.scandir walk; ignored directories are pruned before descending.
+    """
+    stack = [str(project_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(EXTENSIONS):
+                yield Path(entry.path)
+        stack.extend(reversed(subdirs))
 
 
-def check_accessibility(file_path: Path) -> list:
-    """Check a single file for accessibility issues."""
+def check_files(files, jobs: int = 1, budget: float = FILE_BUDGET):
+    """Yield (path, issues) for each file, in input order.
+
+    With jobs > 1 files are checked on a process pool. Paths are pulled
+    from `files` only as workers free up, so a lazy walk streams straight
+    into the pool. Each file gets `budget` seconds (see check_accessibility).
+    """
+    if jobs <= 1:
+        for f in files:
+            yield f, check_accessibility(f, budget)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for f in files:
+            pending.append((f, pool.submit(check_accessibility, f, budget)))
+            if len(pending) >= jobs * 4:
+                path, future = pending.popleft()
+                yield path, future.result()
+        while pending:
+            path, future = pending.popleft()
+            yield path, future.result()
+
+
+def check_accessibility(file_path: Path, budget: float = FILE_BUDGET) -> list:
+    """Check a single file for accessibility issues.
+
+    Checks stop once `budget` seconds pass (0 disables); the file is then
+    reported with a "Budget exceeded" issue after whatever was found so far.
+    """
     issues = []
-    
+    try:
+        with time_budget(budget):
+            _check_file(file_path, issues)
+    except AuditTimeout:
+        issues.append(f"Budget exceeded: checks skipped after {budget:g}s")
+    return issues
+
+
+def _check_file(file_path: Path, issues: list) -> None:
+    """Run the checks for one file, appending to `issues`."""
+    if html_ir is not None and file_path.suffix.lower() == '.html':
+        try:
+            issues.extend(check_accessibility_ir(html_ir.load_ir(str(file_path))))
+        except AuditTimeout:
+            raise
+        except Exception as e:
+            issues.append(f"Error reading file: {str(e)[:50]}")
+        return
+
     try:
         content = file_path.read_text(encoding='utf-8', errors='ignore')
         
         # Check for form inputs without labels
-        inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
+        inputs = INPUT_TAG_RE.findall(content)
         for inp in inputs:
             if 'type="hidden"' not in inp.lower():
                 if 'aria-label' not in inp.lower() and 'id=' not in inp.lower():
@@ -57,11 +172,11 @@ def check_accessibility(file_path: Path) -> list:
                     break
         
         # Check for buttons without accessible text
-        buttons = re.findall(r'<button[^>]*>[^<]*</button>', content, re.IGNORECASE)
+        buttons = BUTTON_RE.findall(content)
         for btn in buttons:
             # Check if button has text content or aria-label
             if 'aria-label' not in btn.lower():
-                text = re.sub(r'<[^>]+>', '', btn)
+                text = TAG_RE.sub('', btn)
                 if not text.strip():
                     issues.append("Button without accessible text")
                     break
@@ -84,7 +199,7 @@ def check_accessibility(file_path: Path) -> list:
         # Check for tabIndex misuse
         if 'tabindex=' in content.lower():
             if 'tabindex="-1"' not in content.lower() and 'tabindex="0"' not in content.lower():
-                positive_tabindex = re.findall(r'tabindex="([1-9]\d*)"', content, re.IGNORECASE)
+                positive_tabindex = POSITIVE_TABINDEX_RE.findall(content)
                 if positive_tabindex:
                     issues.append("Avoid positive tabIndex values")
         
@@ -96,20 +211,152 @@ def check_accessibility(file_path: Path) -> list:
         # Check for role usage
         if 'role="button"' in content.lower():
             # Divs with role button should have tabindex
-            div_buttons = re.findall(r'<div[^>]*role="button"[^>]*>', content, re.IGNORECASE)
+            div_buttons = DIV_ROLE_BUTTON_RE.findall(content)
             for div in div_buttons:
                 if 'tabindex' not in div.lower():
                     issues.append("role='button' without tabindex")
                     break
         
+    except AuditTimeout:
+        raise
     except Exception as e:
         issues.append(f"Error reading file: {str(e)[:50]}")
-    
+
+
+def check_accessibility_ir(ir) -> list:
+    """Same checks as check_accessibility(), over a parsed DocumentIR.
+
+    Works on real elements and attributes instead of raw text, so e.g. an
+    icon-only <button> with nested markup is still seen.
+    """
+    issues = []
+    elements = list(ir.elements())
+    attr_names = {name.lower() for _, _, attrs in elements for name in attrs}
+
+    # Check for form inputs without labels
+    for _, _, attrs in ir.elements('input'):
+        if (attrs.get('type') or '').lower() != 'hidden':
+            if 'aria-label' not in attrs and 'id' not in attrs:
+                issues.append("Input without label or aria-label")
+                break
+
+    # Check for buttons without accessible text
+    for _, attrs, text in ir.element_texts('button'):
+        if 'aria-label' not in attrs and not text.strip():
+            issues.append("Button without accessible text")
+            break
+
+    # Check for missing lang attribute
+    for _, _, attrs in ir.elements('html'):
+        if 'lang' not in attrs:
+            issues.append("Missing lang attribute on <html>")
+        break
+
+    # Check for missing skip link
+    if any(tag in ('main', 'body') for _, tag, _ in elements):
+        has_skip = any('skip' in text.lower() for _, text in ir.texts())
+        has_skip = has_skip or any(
+            (attrs.get('href') or '').startswith('#main')
+            for _, _, attrs in ir.elements('a'))
+        if not has_skip:
+            issues.append("Consider adding skip-to-main-content link")
+
+    # Check for click handlers without keyboard support
+    if 'onclick' in attr_names and not attr_names & {'onkeydown', 'onkeyup'}:
+        issues.append("onClick without keyboard handler (onKeyDown)")
+
+    # Check for tabIndex misuse
+    for _, _, attrs in elements:
+        tabindex = (attrs.get('tabindex') or '').strip()
+        if tabindex.isdigit() and int(tabindex) > 0:
+            issues.append("Avoid positive tabIndex values")
+            break
+
+    # Check for autoplay media
+    for _, _, attrs in elements:
+        if 'autoplay' in attrs and 'muted' not in attrs:
+            issues.append("Autoplay media should be muted")
+            break
+
+    # Check for role usage — divs with role button should have tabindex
+    for _, _, attrs in ir.elements('div'):
+        if (attrs.get('role') or '').lower() == 'button' and 'tabindex' not in attrs:
+            issues.append("role='button' without tabindex")
+            break
+
     return issues
 
 
+def rule_id(issue: str) -> str:
+    """Stable rule id for an issue message, e.g. 'input-without-label-or-aria-label'."""
+    return re.sub(r'[^a-z0-9]+', '-', issue.split(':')[0].lower()).strip('-')
+
+
+def stream_accessibility(files, project_path: Path, emitter, jobs: int = 1,
+                         budget: float = FILE_BUDGET) -> bool:
+    """Check files, writing each issue through the emitter as it is found.
+
+    Only counts are kept; returns whether the run passed.
+    """
+    files_checked = 0
+    files_with_issues = 0
+    total_issues = 0
+    for f, issues in check_files(files, jobs, budget):
+        files_checked += 1
+        if issues:
+            files_with_issues += 1
+            total_issues += len(issues)
+        rel_path = f.relative_to(project_path).as_posix()
+        for issue in issues:
+            emitter.finding(rel_path, rule_id(issue), "warning", issue)
+
+    passed = total_issues < 5  # Allow minor issues, as in the text report
+    emitter.close({
+        "project": str(project_path),
+        "files_checked": files_checked,
+        "files_with_issues": files_with_issues,
+        "issues_found": total_issues,
+        "passed": passed,
+    })
+    return passed
+
+
 def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    argv = sys.argv[1:]
+    fmt = "text"
+    if "--format" in argv:
+        i = argv.index("--format")
+        fmt = argv[i + 1] if i + 1 < len(argv) else ""
+        del argv[i:i + 2]
+    # --jobs N: checker processes (0 or absent = all cores)
+    jobs = 0
+    if "--jobs" in argv:
+        i = argv.index("--jobs")
+        try:
+            jobs = int(argv[i + 1])
+        except (IndexError, ValueError):
+            sys.exit(1)
+        del argv[i:i + 2]
+    jobs = jobs or os.cpu_count() or 1
+    # --budget SECONDS: per-file time budget (0 disables)
+    budget = FILE_BUDGET
+    if "--budget" in argv:
+        i = argv.index("--budget")
+        try:
+            budget = float(argv[i + 1])
+        except (IndexError, ValueError):
+            sys.exit(1)
+        del argv[i:i + 2]
+    project_path = Path(argv[0] if argv else ".").resolve()
+
+    if fmt != "text":
+        if qa_emit is None or fmt not in qa_emit.FORMATS:
+            print(f"[!] --format {fmt} needs execution/qa_emit.py (formats: text, jsonl, sarif)", file=sys.stderr)
+            sys.exit(1)
+        emitter = qa_emit.make_emitter(fmt, "accessibility_checker")
+        passed = stream_accessibility(find_html_files(project_path), project_path, emitter,
+                                      jobs, budget)
+        sys.exit(0 if passed else 1)
     
     print(f"\n{'='*60}")
     print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
@@ -118,11 +365,21 @@ def main():
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-"*60)
     
-    # Find HTML files
-    files = find_html_files(project_path)
-    print(f"Found {len(files)} HTML/JSX/TSX files")
+    # Check each file as the walk finds it
+    files_checked = 0
+    all_issues = []
+    
+    for f, issues in check_files(find_html_files(project_path), jobs, budget):
+        files_checked += 1
+        if issues:
+            all_issues.append({
+                "file": str(f.name),
+                "issues": issues
+            })
+    
+    print(f"Checked {files_checked} HTML/JSX/TSX files")
     
-    if not files:
+    if not files_checked:
         output = {
             "script": "accessibility_checker",
             "project": str(project_path),
@@ -134,17 +391,6 @@ def main():
         print(json.dumps(output, indent=2))
         sys.exit(0)
     
-    # Check each file
-    all_issues = []
-    
-    for f in files:
-        issues = check_accessibility(f)
-        if issues:
-            all_issues.append({
-                "file": str(f.name),
-                "issues": issues
-            })
-    
     # Summary
     print("\n" + "="*60)
     print("ACCESSIBILITY ISSUES")
@@ -168,7 +414,7 @@ def main():
     output = {
         "script": "accessibility_checker",
         "project": str(project_path),
-        "files_checked": len(files),
+        "files_checked": files_checked,
         "files_with_issues": len(all_issues),
         "issues_found": total_issues,
         "passed": passed
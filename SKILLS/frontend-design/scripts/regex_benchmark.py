@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Regex Benchmark - Catastrophic-backtracking guard for the audit scripts
+
+Feeds synthetic inputs of growing size to every compiled pattern in
+ux_audit.py (UXAuditor checks, keyword scanner, structure fallbacks) and
+accessibility_checker.py (check_accessibility regex scan), plus the two
+whole-file entry points, and flags anything whose run time grows faster
+than linearly with input size.
+
+Usage:
+    python regex_benchmark.py
+    python regex_benchmark.py --sizes 8000 32000 128000 --json
+    python regex_benchmark.py --corpus ../../.. --only ux_audit
+
+Input families (all on a single line, like minified output):
+    minified     real .html/.css from --corpus, newlines stripped, repeated
+    repeat-head  the pattern's first literal repeated (e.g. 'onScroll onScroll ...')
+    repeat-chain the pattern's literals minus the last one, repeated
+                 (e.g. '<div class= <div class= ...' for <div.*class=.*text)
+    unclosed     '<tag attr=' fragments that never close ('>' never comes)
+    runs         long digit / hex / whitespace / comma runs
+
+Scaling is the log-log slope between the two largest sizes: ~1 is linear,
+~2 quadratic. A pattern is flagged when the slope exceeds --max-slope and
+the largest run is above the timing noise floor, or when a single run
+exceeds --timeout (runaway; interrupted).
+
+Exit code is 1 if anything is flagged.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import signal
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import ux_audit
+import accessibility_checker
+
+
+# Runs faster than this are timing noise, not scaling evidence
+NOISE_FLOOR = 0.05
+
+# Patterns UXAuditor only tries at keyword hits, once per line
+# (KeywordHits.line_match) — a bare findall would overstate their cost
+LINE_MATCHED = {
+    "EASE_IN_ENTRY_RE": "ease_in",
+    "EASE_OUT_EXIT_RE": "ease_out",
+    "SCROLL_LAYOUT_RE": "on_scroll",
+}
+
+# Fallback corpus when --corpus has no front-end files
+SAMPLE_PAGE = (
+    '<!DOCTYPE html><html lang="en"><head><style>.hero{background:linear-gradient(#0a0a0a,#111);'
+    'transition: opacity 300ms ease-out;box-shadow: 0 4px 12px rgba(0,0,0,0.2);font-family: Inter, sans-serif}'
+    '</style></head><body><nav><a href="/">Home</a><a href="/about">About</a><a href="/contact">Contact</a>'
+    '</nav><main id="main"><h1 class="text-4xl tracking-tight">Title</h1><p class="text-gray-600 leading-relaxed">'
+    'Body text for the page.</p><button class="bg-primary hover:bg-red-700" onclick="go()">Go</button>'
+    '<img src="a.webp" alt="A"><input id="email" type="email" placeholder="Email"></main></body></html>'
+)
+
+
+class Runaway(BaseException):
+    pass
+
+
+def _alarm(signum, frame):
+    raise Runaway()
+
+
+# ---------------------------------------------------------------------------
+# Pattern catalogue
+# ---------------------------------------------------------------------------
+
+def collect_patterns() -> list:
+    """(name, compiled_pattern) for every module-level pattern in both scripts."""
+    patterns = [("ux_audit.KEYWORD_SCANNER", ux_audit.KEYWORD_SCANNER.pattern)]
+    for module in (ux_audit, accessibility_checker):
+        for name, value in sorted(vars(module).items()):
+            if isinstance(value, re.Pattern):
+                patterns.append((f"{module.__name__}.{name}", value))
+    return patterns
+
+
+def literals(pattern: re.Pattern) -> list:
+    """Literal fragments of a pattern's source, in order."""
+    source = re.sub(r'\\[dswbDSWB]|\[[^\]]*\]|\{[^}]*\}|\(\?[:=!]|[()|*+?]', ' ', pattern.pattern)
+    return [frag.replace('\\', '') for frag in re.findall(r'[^\s.^$]{2,}', source)] or ['<a']
+
+
+# ---------------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------------
+
+def load_corpus(corpus: Path) -> str:
+    parts = []
+    for suffix in ('*.html', '*.css'):
+        for path in sorted(corpus.rglob(suffix)):
+            if any(part in ('node_modules', '.git', '.tmp') for part in path.parts):
+                continue
+            parts.append(path.read_text(encoding='utf-8', errors='replace'))
+            if sum(map(len, parts)) > 1_000_000:
+                break
+    text = ''.join(parts) or SAMPLE_PAGE
+    return re.sub(r'\s*\n\s*', ' ', text)
+
+
+def fill(unit: str, size: int) -> str:
+    return (unit * (size // max(1, len(unit)) + 1))[:size]
+
+
+def families(pattern: re.Pattern, corpus: str, unit_size: int) -> dict:
+    """{family: unit} — fill() repeats each unit to the requested size."""
+    lits = literals(pattern)
+    return {
+        # Same slice at every size, so only the length changes
+        "minified": corpus[:unit_size],
+        "repeat-head": lits[0] + ' ',
+        "repeat-chain": ' '.join(lits[:-1] or lits) + ' ',
+        "unclosed": '<div class="a" role="button" <img src=x <input id=y <button ',
+        "runs": '#' + 'a1' * 64 + ' ' + '9' * 128 + ' ' * 64 + '(' + ',' * 64,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+def time_call(fn, timeout: float, repeat: int) -> float:
+    """Best-of-repeat wall time; raises Runaway after `timeout` seconds."""
+    best = math.inf
+    use_alarm = hasattr(signal, 'setitimer')
+    for _ in range(repeat):
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        started = time.perf_counter()
+        try:
+            fn()
+        finally:
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def measure(fn_for_text, unit: str, sizes: list, timeout: float, repeat: int) -> dict:
+    times = []
+    for size in sizes:
+        text = fill(unit, size)
+        try:
+            times.append(time_call(lambda: fn_for_text(text), timeout, repeat))
+        except Runaway:
+            return {"times": times, "runaway_at": size, "slope": None}
+    slope = 0.0
+    if len(times) >= 2 and times[-1] >= NOISE_FLOOR:
+        slope = math.log(times[-1] / max(times[-2], 1e-9)) / math.log(sizes[-1] / sizes[-2])
+    return {"times": times, "runaway_at": None, "slope": round(slope, 2)}
+
+
+def file_runner(suffix: str, check):
+    """Write text to a temp file with `suffix` and run a whole-file check."""
+    def run(text):
+        with tempfile.NamedTemporaryFile('w', suffix=suffix, delete=False, encoding='utf-8') as f:
+            f.write(text)
+        try:
+            check(Path(f.name))
+        finally:
+            os.unlink(f.name)
+    return run
+
+
+def pattern_runner(name: str, pattern: re.Pattern):
+    """How the audit scripts apply `pattern` to a whole file."""
+    group = LINE_MATCHED.get(name.rsplit('.', 1)[-1])
+    if group is None:
+        return pattern.findall
+    scanner = ux_audit.KEYWORD_SCANNER
+    return lambda text: scanner.scan(text).line_match(group, pattern)
+
+
+def entry_points() -> list:
+    """(name, runner) for the whole-file audit functions."""
+    html_ir = ux_audit.html_ir
+    if html_ir is not None:
+        # Parse benchmark inputs fresh; don't fill .tmp/html_ir/ with them
+        load_ir = html_ir.load_ir
+        html_ir.load_ir = lambda path, use_cache=True, cache_dir=None: load_ir(path, use_cache=False)
+
+    def ux(path):
+        ux_audit.UXAuditor(budget=0).audit_file(str(path))
+
+    def a11y(path):
+        accessibility_checker.check_accessibility(path, budget=0)
+    return [
+        ("UXAuditor.audit_file[.css]", file_runner('.css', ux)),
+        ("UXAuditor.audit_file[.html]", file_runner('.html', ux)),
+        ("check_accessibility[.jsx]", file_runner('.jsx', a11y)),
+        ("check_accessibility[.html]", file_runner('.html', a11y)),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag audit regexes that scale super-linearly.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16000, 64000, 256000],
+                        help="Input sizes in characters, ascending (default: 16000 64000 256000)")
+    parser.add_argument("--corpus", default=".", help="Directory with real pages for the minified family")
+    parser.add_argument("--only", help="Only benchmark names containing this substring")
+    parser.add_argument("--max-slope", type=float, default=1.4,
+                        help="Flag log-log slopes above this (default: 1.4)")
+    parser.add_argument("--timeout", type=float, default=5.0,
+                        help="Seconds before a single run counts as runaway (default: 5)")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing (default: 3)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    if hasattr(signal, 'SIGALRM'):
+        signal.signal(signal.SIGALRM, _alarm)
+
+    corpus = load_corpus(Path(args.corpus).resolve())
+    sizes = sorted(args.sizes)
+    results = []
+
+    for name, pattern in collect_patterns():
+        if args.only and args.only not in name:
+            continue
+        runner = pattern_runner(name, pattern)
+        for family, unit in families(pattern, corpus, sizes[0]).items():
+            result = measure(runner, unit, sizes, args.timeout, args.repeat)
+            results.append({"name": name, "family": family, **result})
+
+    for name, runner in entry_points():
+        if args.only and args.only not in name:
+            continue
+        for family, unit in families(ux_audit.KEYWORD_SCANNER.pattern, corpus, sizes[0]).items():
+            if family == "repeat-head":
+                unit = '<div class=text onScroll IntersectionObserver '
+            result = measure(runner, unit, sizes, args.timeout, 1)
+            results.append({"name": name, "family": family, **result})
+
+    flagged = [r for r in results if r["runaway_at"] or r["slope"] > args.max_slope]
+
+    if args.json:
+        print(json.dumps({"sizes": sizes, "max_slope": args.max_slope,
+                          "results": results, "flagged": flagged}))
+    else:
+        print(f"\n[REGEX BENCHMARK] {len(results)} pattern/input runs, sizes {sizes}")
+        print("-" * 72)
+        for r in sorted(results, key=lambda r: -(r["times"][-1] if r["times"] else math.inf))[:10]:
+            last = f"{r['times'][-1] * 1000:8.1f} ms" if r["times"] else "     n/a"
+            slope = "  n/a" if r["slope"] is None else f"{r['slope']:>5}"
+            print(f"  {last}  slope {slope}  {r['family']:<12} {r['name']}")
+        print("-" * 72)
+        if flagged:
+            print(f"[!] NON-LINEAR ({len(flagged)}):")
+            for r in flagged:
+                if r["runaway_at"]:
+                    print(f"  - {r['name']} [{r['family']}]: runaway at {r['runaway_at']} chars (> {args.timeout}s)")
+                else:
+                    times = ", ".join(f"{t * 1000:.1f}" for t in r["times"])
+                    print(f"  - {r['name']} [{r['family']}]: slope {r['slope']} ({times} ms)")
+        else:
+            print("[+] All patterns scale linearly")
+
+    sys.exit(1 if flagged else 0)
+
+
+if __name__ == "__main__":
+    main()
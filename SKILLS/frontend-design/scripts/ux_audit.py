@@ -87,58 +87,659 @@ Analyzes code for compliance with:
    - Form labels
 
 Total: 80+ checks across all design principles
+
+Structural facts (links, form fields, headings, paragraphs, images) come
+from the shared parsed-document IR (execution/html_ir.py) for .html files
+when the project provides it; other files use the regex fallbacks.
+With the IR, the contrast check (4.5) computes real WCAG ratios from
+resolved text/background colors (execution/contrast.py) instead of
+guessing from class names.
+
+Keyword-presence checks share one precompiled multi-keyword scan
+(KeywordScanner): a single pass over the file records every hit offset of
+every keyword, and the checks query those hits. The remaining structural
+patterns are module-level compiled regexes with at most one unbounded
+span, so no check backtracks across the whole file.
+
+Directories can be audited on several cores with --jobs N (0 = all
+cores). Per-file results are merged in walk order, so the report and the
+--json output are identical to the serial run.
+
+--profile times every named rule in audit_file (wall time, findings,
+files), prints the --top N (default 15) slowest and writes them all to
+.tmp/ux_audit_profile.json, to find checks that degrade on big files.
+
+Each file gets a time budget (--budget SECONDS, default 10, 0 disables).
+A file that runs past it has its remaining checks skipped and the rule
+that was running reported, so one pathological input cannot hang the
+audit. regex_benchmark.py checks every pattern for super-linear scaling.
+
+--format jsonl|sarif writes each finding as soon as its file is audited
+(execution/qa_emit.py) instead of the capped text report, keeping only
+totals in memory; the last line/log properties carry the summary.
 """
 
 import sys
 import os
 import re
 import json
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 
+
+def _import_html_ir():
+    """Import execution/html_ir.py from the enclosing project, if any."""
+    for parent in Path(__file__).resolve().parents:
+        candidate = parent / "execution" / "html_ir.py"
+        if candidate.is_file():
+            sys.path.insert(0, str(candidate.parent))
+            try:
+                import html_ir
+                return html_ir
+            except ImportError:
+                return None
+    return None
+
+
+html_ir = _import_html_ir()
+
+try:
+    import qa_emit  # Alongside html_ir in execution/
+except ImportError:
+    qa_emit = None
+
+try:
+    import contrast  # WCAG ratios from resolved colors (execution/contrast.py)
+except ImportError:
+    contrast = None
+
+
+# Regex fallbacks for extract_structure (non-HTML files, no IR available)
+NAV_ITEM_RE = re.compile(r'<NavLink|<Link|<a\s+href|nav-item', re.IGNORECASE)
+NAV_TEXT_RE = re.compile(r'<NavLink|<Link|<a\s+href[^<>]*>([^<]+)</a>', re.IGNORECASE)
+FORM_FIELD_RE = re.compile(r'<input|<select|<textarea', re.IGNORECASE)
+COMPLEX_ELEMENT_RE = re.compile(r'<input|<select|<textarea|<option', re.IGNORECASE)
+HEADING_TAG_RE = re.compile(r'<(h[1-6])', re.IGNORECASE)
+PARAGRAPH_RE = re.compile(r'<p[^<>]*>([^<]+)</p>', re.IGNORECASE)
+IMG_WITHOUT_ALT_RE = re.compile(r'<img(?![^<>]*alt=)[^<>]*>')
+
+
+def extract_structure(filepath: str, content: str) -> dict:
+    """Structural facts the audit needs, from the IR or regex fallbacks.
+
+    Keys:
+      nav_items        number of navigation links
+      nav_texts        link texts, in document order
+      form_fields      <input>/<select>/<textarea> count
+      complex_elements form_fields plus <option>
+      headings         heading tags in order, e.g. ['h1', 'h2']
+      paragraphs       text of each <p>
+      missing_alt      True if any <img> lacks alt
+      ir               the parsed DocumentIR (None on the regex fallback)
+    """
+    if html_ir is not None and filepath.lower().endswith('.html'):
+        ir = html_ir.load_ir(filepath)
+        anchors = [(attrs, text) for _, attrs, text in ir.element_texts('a')
+                   if 'href' in attrs]
+        nav_classes = sum(1 for _, cls in ir.classes() if 'nav-item' in cls)
+        tags = [tag for _, tag, _ in ir.elements()]
+        form_fields = sum(1 for t in tags if t in ('input', 'select', 'textarea'))
+        return {
+            "nav_items": len(anchors) + nav_classes,
+            "nav_texts": [text for _, text in anchors if text],
+            "form_fields": form_fields,
+            "complex_elements": form_fields + tags.count('option'),
+            "headings": [t for t in tags if re.fullmatch(r'h[1-6]', t)],
+            "paragraphs": [text for _, _, text in ir.element_texts('p')],
+            "missing_alt": any(attrs.get('alt') is None
+                               for _, _, attrs in ir.elements('img')),
+            "ir": ir,
+        }
+
+    form_fields = len(FORM_FIELD_RE.findall(content))
+    return {
+        "nav_items": len(NAV_ITEM_RE.findall(content)),
+        "nav_texts": [t for t in NAV_TEXT_RE.findall(content)],
+        "form_fields": form_fields,
+        "complex_elements": len(COMPLEX_ELEMENT_RE.findall(content)),
+        "headings": [h.lower() for h in HEADING_TAG_RE.findall(content)],
+        "paragraphs": PARAGRAPH_RE.findall(content),
+        "missing_alt": bool(IMG_WITHOUT_ALT_RE.search(content)),
+        "ir": None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Keyword scanner — every keyword-presence check in one pass
+# ---------------------------------------------------------------------------
+
+# Literal keyword groups: {name: (terms, ignore_case)}. All terms are
+# compiled into a single trie-shaped alternation and found in one scan of
+# the file; checks then ask which groups hit, how often and where.
+KEYWORDS = {
+    # Pre-calculated flags
+    "long_text": (("<p", "article"), True),
+    "div_open": (("<div",), True),
+    "span_open": (("<span",), True),
+    "form": (("<form", "<input", "password", "credit", "card", "payment"), True),
+
+    # 1. Psychology laws
+    "multi_step": (("step", "wizard", "stage"), True),
+    "button": (("button",), True),
+    "primary": (("primary",), True),  # also covers bg-primary, variant="primary"
+
+    # 1.5 Emotional design
+    "hero": (("hero", "<h1", "banner"), True),
+    "gradient": (("gradient", "linear-gradient", "radial-gradient", "conic-gradient"), False),
+    "animation": (("@keyframes", "transition:", "animate-"), False),
+    "background": (("background:", "bg-"), False),
+    "click_handler": (("onClick", "@click", "onclick"), False),
+    "feedback": (("transition", "animate", "hover:", "focus:", "disabled", "loading", "spinner"), True),
+    "state_change": (("setState", "useState", "disabled", "loading"), False),
+    "reflective": (("about", "story", "mission", "values", "why we", "our journey", "testimonials"), True),
+
+    # 1.6 Trust building
+    "security": (("ssl", "secure", "encrypt", "lock", "padlock", "https"), True),
+    "checkout": (("checkout", "payment"), True),
+    "social_proof": (("review", "testimonial", "rating", "star", "trust", "trusted by", "customer", "logo"), True),
+    "footer": (("footer", "<footer"), True),
+    "authority": (("certif", "award", "media", "press", "featured", "as seen in"), True),
+
+    # 1.7 Cognitive load
+    "progressive": (("step", "wizard", "stage", "accordion", "collapsible", "tab", "more...", "advanced", "show more"), True),
+    "border": (("border:", "border-"), False),
+    "labels": (("<label", "placeholder", "aria-label"), True),
+
+    # 1.8 Persuasion
+    "defaults": (("checked", "selected", "default"), False),
+    "radio": (("type=\"radio", "type='radio"), True),
+    "price": (("price", "pricing", "cost"), True),
+    "dollar": (("$",), False),
+    "anchor": (("original", "was", "strike", "del"), True),
+    "save": (("save ",), True),
+    "social": (("join", "subscriber", "member", "user"), True),
+    "progress": (("progress", "complete", "%", "bar"), True),
+    "step_number": (("step ",), True),
+
+    # 2. Typography
+    "text_element": (("<p", "<span", "<h1", "<h2", "<h3", "<h4", "<h5", "<h6"), True),
+    "line_height": (("leading-", "line-height:"), False),
+    "heading_or_large": (("<h1", "<h2", "<h3", "<h4", "<h5", "<h6",
+                          "text-xl", "text-2xl", "text-3xl", "text-4xl", "text-5xl", "text-6xl"), True),
+    "uppercase": (("uppercase",), True),
+    "tracking": (("tracking-", "letter-spacing:"), False),
+    "display_text": (("text-4xl", "text-5xl", "text-6xl", "text-7xl", "text-8xl", "text-9xl"), False),
+    "tracking_tight": (("tracking-tight",), False),
+    "font_size": (("font-size:", "text-xs", "text-sm", "text-base", "text-lg", "text-xl", "text-2xl"), False),
+    "fluid_type": (("clamp(", "responsive:"), False),
+    "subheading": (("<h2", "<h3", "<h4", "<h5", "<h6"), True),
+
+    # 3. Visual effects
+    "backdrop": (("backdrop-filter", "blur("), False),
+    "motion": (("@keyframes", "transition:"), False),
+    "expensive_prop": (("width", "height", "top", "left", "right", "bottom", "margin", "padding"), False),
+    "reduced_motion": (("prefers-reduced-motion",), False),
+    "gradient_any_case": (("gradient",), True),
+    "border_decl": (("border:",), False),
+    "text_shadow": (("text-shadow:",), False),
+    "images": (("<img", "background-image:", "bg-[url"), False),
+    "overlay": (("overlay", "rgba(0", "::after", "::before"), False),
+    "will_change": (("will-change:",), False),
+
+    # 4. Color system
+    "purple": (("#8B5CF6", "#A855F7", "#9333EA", "#7C3AED", "#6D28D9",
+                "#8B5CF6", "#A78BFA", "#C4B5FD", "#DDD6FE", "#EDE9FE",
+                "#8b5cf6", "#a855f7", "#9333ea", "#7c3aed", "#6d28d9",
+                "purple", "violet", "fuchsia", "magenta", "lavender"), True),
+    "hsl": (("hsl(",), False),
+    "dark": (("dark:",), False),
+    "light_bg": (("bg-gray-50", "bg-slate-50", "bg-zinc-50"), False),
+    "bg_white": (("bg-white",), False),
+    "dark_bg": (("bg-gray-9", "bg-slate-9", "bg-zinct-9"), False),
+    "bg_black": (("bg-black",), False),
+    "blue": (("bg-blue", "text-blue", "from-blue"), False),
+    "food": (("restaurant", "food", "cooking", "recipe", "menu", "dish", "meal"), True),
+    "color_var": (("--color-", "color-", "primary-", "secondary-"), False),
+
+    # 5. Animation guide
+    "transition_any_case": (("transition",), True),
+    "fade_in": (("fade-in",), False),
+    "fade_out": (("fade-out",), False),
+    "ease_in": (("ease-in",), False),
+    "ease_out": (("ease-out",), False),
+    "interactive": (("<button", "onClick", "@click"), False),
+    "hover_focus": (("hover:", "focus:", ":hover", ":focus"), False),
+    "async": (("async", "await", "fetch", "axios", "loading", "isLoading"), False),
+    "loading_indicator": (("skeleton", "spinner", "progress", "loading"), False),
+    "circle_open": (("<circle",), False),
+    "routing": (("router", "navigate", "useHistory"), False),
+    "link_component": (("Link",), False),
+    "page_transition": (("AnimatePresence", "motion."), False),
+    "transition": (("transition",), False),
+    "fade": (("fade",), False),
+    "scroll_anim": (("onScroll", "IntersectionObserver"), False),
+    "on_scroll": (("onScroll",), False),
+    "scroll": (("scroll",), False),
+
+    # 6. Motion graphics
+    "lottie": (("lottie", "Lottie", "@lottie-react"), False),
+    "lottie_lower": (("lottie",), False),
+    "gsap": (("gsap", "ScrollTrigger"), False),  # also covers from(...gsap
+    "gsap_cleanup": (("kill(", "revert("), False),
+    "use_effect": (("useEffect",), False),
+    "svg_animation": (("<animate", "<animateTransform", "stroke-dasharray", "stroke-dashoffset"), False),
+    "transform_3d": (("transform3d", "perspective(", "rotate3d", "translate3d"), False),
+    "particles": (("particle", "Three.js"), False),
+    "canvas": (("canvas",), False),
+    "animation_frame": (("requestAnimationFrame",), False),
+    "intersection_observer": (("IntersectionObserver",), False),
+    "scroll_driven": (("view-timeline",), False),
+    "throttle": (("throttle", "debounce", "requestAnimationFrame"), False),
+    "functional_animation": (("hover:", "focus:", "disabled", "loading", "error", "success"), False),
+}
+
+
+def _trie_regex(node: dict) -> str:
+    """Regex for a character trie; prefers the longest term at a position."""
+    branches = [re.escape(ch) + _trie_regex(child)
+                for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    return f'(?:{body})?' if '' in node else body
+
+
+class KeywordScanner:
+    """Find every term of every keyword group in a single pass.
+
+    The terms are folded into one lowercase trie alternation inside a
+    lookahead and run over the lowercased file, so the scan reports the
+    longest term starting at each offset without consuming it (overlapping
+    hits are kept). Every shorter term matching at the same offset is a
+    prefix of that longest match, which is how all hits at an offset are
+    recovered; case-sensitive terms are then confirmed against the
+    original text.
+    """
+
+    def __init__(self, groups: dict):
+        self.groups = {}      # {name: ((declared_term, key), ...)}
+        self.ignore_case = {}  # {name: bool}
+        self.terms = set()    # {key}; key = (term, ignore_case), term lowered if ignore_case
+        trie = {}
+
+        for name, (terms, ignore_case) in groups.items():
+            entries = {}
+            for term in terms:
+                key = (term.lower() if ignore_case else term, ignore_case)
+                entries.setdefault(key, term)
+                node = trie
+                for ch in term.lower():
+                    node = node.setdefault(ch, {})
+                node[''] = {}
+            self.groups[name] = tuple((term, key) for key, term in entries.items())
+            self.ignore_case[name] = ignore_case
+            self.terms.update(entries)
+
+        alternation = f'(?=({_trie_regex(trie)}))'
+        self.pattern = re.compile(alternation)
+        # For text whose lowercase form changes length (offsets would drift)
+        self.pattern_ignore_case = re.compile(alternation, re.IGNORECASE)
+        self._keys_by_match = {}
+
+    def _keys_for(self, matched: str) -> tuple:
+        """Term keys matching at an offset whose longest hit is `matched`."""
+        keys = self._keys_by_match.get(matched)
+        if keys is None:
+            keys = []
+            for n in range(1, len(matched) + 1):
+                prefix = matched[:n]
+                if (prefix.lower(), True) in self.terms:
+                    keys.append((prefix.lower(), True))
+                if (prefix, False) in self.terms:
+                    keys.append((prefix, False))
+            keys = self._keys_by_match[matched] = tuple(keys)
+        return keys
+
+    def scan(self, content: str) -> 'KeywordHits':
+        lowered = content.lower()
+        if len(lowered) == len(content):
+            text, pattern = lowered, self.pattern
+        else:
+            text, pattern = content, self.pattern_ignore_case
+
+        offsets = {}
+        for match in pattern.finditer(text):
+            start = match.start()
+            for key in self._keys_for(content[start:match.end(1)]):
+                offsets.setdefault(key, []).append(start)
+        return KeywordHits(self, content, offsets)
+
+
+class KeywordHits:
+    """Result of one KeywordScanner pass over a file."""
+
+    def __init__(self, scanner: KeywordScanner, content: str, offsets: dict):
+        self.scanner = scanner
+        self.content = content
+        self.offsets = offsets   # {key: [offset, ...]} in document order
+
+    def any(self, name: str) -> bool:
+        """True if any term of the group occurs."""
+        return any(key in self.offsets for _, key in self.scanner.groups[name])
+
+    def first(self, name: str):
+        """First term of the group, in declared order, that occurs."""
+        for term, key in self.scanner.groups[name]:
+            if key in self.offsets:
+                return term
+        return None
+
+    def findall(self, name: str) -> list:
+        """Matched text of the group's terms, like re.findall on 'a|b|c'.
+
+        Matches are leftmost and non-overlapping; at one offset the first
+        declared term wins, as it would in the equivalent alternation.
+        """
+        found = []
+        for order, (term, key) in enumerate(self.scanner.groups[name]):
+            for offset in self.offsets.get(key, ()):
+                found.append((offset, order, len(term)))
+        found.sort()
+
+        matches = []
+        end = 0
+        for offset, _, length in found:
+            if offset >= end:
+                matches.append(self.content[offset:offset + length])
+                end = offset + length
+        return matches
+
+    def count(self, name: str) -> int:
+        return len(self.findall(name))
+
+    def match_at(self, name: str, pattern) -> bool:
+        """True if `pattern` matches, anchored, at any hit of the group."""
+        return any(pattern.match(self.content, offset)
+                   for _, key in self.scanner.groups[name]
+                   for offset in self.offsets.get(key, ()))
+
+    def line_match(self, name: str, pattern) -> bool:
+        """True if `pattern` matches, anchored, at a hit of the group.
+
+        For patterns shaped like 'term.*rest', where a match that fails
+        from one hit also fails from every later hit on the same line:
+        only the first hit on each line is tried, so a minified file full
+        of hits costs one pass instead of one pass per hit.
+        """
+        content = self.content
+        for _, key in self.scanner.groups[name]:
+            line_end = -1
+            for offset in self.offsets.get(key, ()):
+                if offset < line_end:
+                    continue
+                if pattern.match(content, offset):
+                    return True
+                line_end = content.find('\n', offset)
+                if line_end == -1:
+                    break
+        return False
+
+    def on_line(self, name: str, *steps) -> bool:
+        """True if a group term is followed, on the same line, by each step.
+
+        Equivalent to re.search('term.*step1.*step2') for literal steps; a
+        step given as a tuple matches any of its alternatives. A chain that
+        fails from one hit fails from every later hit on the same line, so
+        each line is searched at most once per term.
+        """
+        ignore_case = self.scanner.ignore_case[name]
+        steps = [(step,) if isinstance(step, str) else step for step in steps]
+        if ignore_case:
+            steps = [tuple(alt.lower() for alt in step) for step in steps]
+
+        content = self.content
+        for term, key in self.scanner.groups[name]:
+            line_end = -1
+            for offset in self.offsets.get(key, ()):
+                if offset < line_end:
+                    continue
+                line_end = content.find('\n', offset)
+                if line_end == -1:
+                    line_end = len(content)
+                rest = content[offset + len(term):line_end]
+                if ignore_case:
+                    rest = rest.lower()
+                position = 0
+                for step in steps:
+                    hits = [(found, len(alt)) for alt in step
+                            if (found := rest.find(alt, position)) != -1]
+                    if not hits:
+                        break
+                    found, length = min(hits)
+                    position = found + length
+                else:
+                    return True
+        return False
+
+
+KEYWORD_SCANNER = KeywordScanner(KEYWORDS)
+
+
+# Structural patterns (precompiled; single unbounded span at most, so each
+# runs in time linear in the text it scans). Patterns used with match_at()
+# are only tried, anchored, at the scanner hits of their leading keyword.
+SMALL_HEIGHT_RE = re.compile(r'height:\s*([0-3]\d)px')
+SMALL_HEIGHT_CLASS_RE = re.compile(r'h-[1-9]\b|h-10\b')
+COLOR_LITERAL_RE = re.compile(r'#[0-9a-fA-F]{3,6}|rgb|hsl')
+DEFAULT_VALUE_RE = re.compile(r'value=["\'][^\n]*["\']')
+DOLLAR_AMOUNT_RE = re.compile(r'\$\d')
+SAVE_PERCENT_RE = re.compile(r'save \d+%', re.IGNORECASE)
+SOCIAL_COUNT_RE = re.compile(r'\d[+kmb]|\d,\d')
+STEP_NUMBER_RE = re.compile(r'step \d', re.IGNORECASE)
+FONT_FACE_RE = re.compile(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', re.IGNORECASE)
+GOOGLE_FONTS_RE = re.compile(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', re.IGNORECASE)
+FONT_FAMILY_RE = re.compile(r'font-family:\s*([^;]+)', re.IGNORECASE)
+LINE_LENGTH_RE = re.compile(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch')
+LINE_HEIGHT_VALUE_RE = re.compile(r'(?:leading-|line-height:\s*)([\d.]+)')
+DISPLAY_FONT_SIZE_RE = re.compile(r'font-size:\s*[3-9]\dpx')
+NEGATIVE_TRACKING_RE = re.compile(r'letter-spacing:\s*-[0-9]')
+FONT_WEIGHT_RE = re.compile(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', re.IGNORECASE)
+FONT_SIZE_VALUE_RE = re.compile(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)')
+TRANSLUCENT_BG_RE = re.compile(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+')
+BOX_SHADOW_RE = re.compile(r'box-shadow:\s*([^;]+)')
+SHADOW_Y_OFFSET_RE = re.compile(r'\d+px\s+[1-9]\d*px')
+GLOW_OFFSET_RE = re.compile(r'0\s+0\s')
+RGBA_ALPHA_RE = re.compile(r'rgba?\([^)]+,\s*([\d.]+)\)')
+WILL_CHANGE_RE = re.compile(r'will-change:\s*([^;]+)')
+HEX_COLOR_RE = re.compile(r'#[0-9a-fA-F]{3,6}')
+HEX6_COLOR_RE = re.compile(r'#[0-9a-fA-F]{6}')
+BG_DECLARATION_RE = re.compile(r'(?:background|bg-|bg\[)([^;}\s]+)')
+TEXT_DECLARATION_RE = re.compile(r'(?:color|text-)([^;}\s]+)')
+HSL_HUE_RE = re.compile(r'hsl\((\d+),\s*\d+%,\s*\d+%\)')
+PURE_BLACK_RE = re.compile(r'color:\s*#000000|#000\b')
+PURE_WHITE_RE = re.compile(r'background:\s*#ffffff|#fff\b')
+BLUE_HEX_RE = re.compile(r'#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}')
+DURATION_RE = re.compile(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)')
+EASE_IN_ENTRY_RE = re.compile(r'ease-in\s+.*entry')
+EASE_OUT_EXIT_RE = re.compile(r'ease-out\s+.*exit')
+LINK_HREF_RE = re.compile(r'<a\s+href')
+SCROLL_LAYOUT_RE = re.compile(r'onScroll.*[^\w](width|height|top|left)')
+PERSPECTIVE_RE = re.compile(r'perspective:\s*\d+px|perspective\s*\(')
+
+
+# ---------------------------------------------------------------------------
+# Per-file time budget
+# ---------------------------------------------------------------------------
+
+# Seconds one file may spend in audit_file before its remaining checks are
+# skipped and reported (--budget; 0 disables)
+FILE_BUDGET = 10.0
+
+
+class AuditTimeout(Exception):
+    """A file ran past its time budget."""
+
+
+def _raise_timeout(signum, frame):
+    raise AuditTimeout()
+
+
+@contextmanager
+def time_budget(seconds: float):
+    """Raise AuditTimeout in the block once `seconds` of wall time pass.
+
+    Uses SIGALRM, which also interrupts a regex stuck backtracking (the
+    regex engine polls for signals). Without it (Windows, non-main
+    threads) nothing is armed here and the caller's cooperative check
+    between rules is the only guard.
+    """
+    armed = (seconds > 0 and hasattr(signal, 'setitimer')
+             and threading.current_thread() is threading.main_thread())
+    if not armed:
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+# [Category] filename: message
+FINDING_RE = re.compile(r'\[([^\]]+)\] (.*)', re.DOTALL)
+
+
 class UXAuditor:
-    def __init__(self):
+    def __init__(self, profile: bool = False, budget: float = FILE_BUDGET,
+                 emitter=None):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
+        # Streaming (--format jsonl/sarif): each file's findings are written
+        # through the qa_emit emitter and dropped, keeping only the counts
+        self.emitter = emitter
+        self.issue_count = 0
+        self.warning_count = 0
+        # Per-rule timing (--profile): {rule: [seconds, findings, files]}
+        self.profile = {} if profile else None
+        self._lap = None
+        # Per-file time budget: files abandoned as [{file, rule, budget}]
+        self.budget = budget
+        self.timeouts = []
+        self._current_rule = None
+        self._deadline = None
+
+    def _rule(self, name) -> None:
+        """Mark the start of rule `name`, closing the running one.
+
+        audit_file calls this at the top of each rule, so a rule's time is
+        everything up to the next rule's mark; None closes the last one.
+        Past the file's deadline the running rule is blamed and the file
+        abandoned. With --profile, the rule's time and findings (issues
+        and warnings it added) are recorded.
+        """
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise AuditTimeout()
+        self._current_rule = name
+        if self.profile is None:
+            return
+        now = time.perf_counter()
+        findings = len(self.issues) + len(self.warnings)
+        if self._lap:
+            rule, started, before = self._lap
+            stats = self.profile.setdefault(rule, [0.0, 0, 0])
+            stats[0] += now - started
+            stats[1] += findings - before
+            stats[2] += 1
+        self._lap = (name, now, findings) if name else None
     
     def audit_file(self, filepath: str) -> None:
         try:
             with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
                 content = f.read()
         except: return
-        
+
         self.files_checked += 1
         filename = os.path.basename(filepath)
 
+        if self.budget > 0:
+            self._deadline = time.perf_counter() + self.budget
+        try:
+            with time_budget(self.budget):
+                self._check_file(filepath, filename, content)
+        except AuditTimeout:
+            rule = self._current_rule
+            self._deadline = None
+            self._rule(None)
+            self.timeouts.append({"file": filepath, "rule": rule, "budget": self.budget})
+            self.warnings.append(f"[Budget] {filename}: '{rule}' exceeded the {self.budget:g}s per-file budget; remaining checks skipped")
+        finally:
+            self._deadline = None
+
+        if self.emitter:
+            self._stream(filepath)
+
+    def _stream(self, filepath: str) -> None:
+        """Write the findings collected for one file, then drop them."""
+        prefix = os.path.basename(filepath) + ': '
+        for findings, level in ((self.issues, 'error'), (self.warnings, 'warning')):
+            for text in findings:
+                rule, message = FINDING_RE.match(text).groups()
+                if message.startswith(prefix):
+                    message = message[len(prefix):]
+                self.emitter.finding(filepath, rule, level, message)
+        self.issue_count += len(self.issues)
+        self.warning_count += len(self.warnings)
+        self.issues.clear()
+        self.warnings.clear()
+
+    def _check_file(self, filepath: str, filename: str, content: str) -> None:
         # Pre-calculate common flags
-        has_long_text = bool(re.search(r'<p|<div.*class=.*text|article|<span.*text', content, re.IGNORECASE))
-        has_form = bool(re.search(r'<form|<input|password|credit|card|payment', content, re.IGNORECASE))
-        complex_elements = len(re.findall(r'<input|<select|<textarea|<option', content, re.IGNORECASE))
+        self._rule("Structure extraction")
+        structure = extract_structure(filepath, content)
+        self._rule("Keyword scan")
+        kw = KEYWORD_SCANNER.scan(content)
+        has_long_text = (kw.any('long_text') or kw.on_line('div_open', 'class=', 'text')
+                         or kw.on_line('span_open', 'text'))
+        has_form = kw.any('form')
+        complex_elements = structure["complex_elements"]
 
         # --- 1. PSYCHOLOGY LAWS ---
         # Hick's Law
-        nav_items = len(re.findall(r'<NavLink|<Link|<a\s+href|nav-item', content, re.IGNORECASE))
+        self._rule("1 Hick's Law")
+        nav_items = structure["nav_items"]
         if nav_items > 7:
             self.issues.append(f"[Hick's Law] {filename}: {nav_items} nav items (Max 7)")
-        
+
         # Fitts' Law
-        if re.search(r'height:\s*([0-3]\d)px', content) or re.search(r'h-[1-9]\b|h-10\b', content):
+        self._rule("1 Fitts' Law")
+        if SMALL_HEIGHT_RE.search(content) or SMALL_HEIGHT_CLASS_RE.search(content):
             self.warnings.append(f"[Fitts' Law] {filename}: Small targets (< 44px)")
-        
+
         # Miller's Law
-        form_fields = len(re.findall(r'<input|<select|<textarea', content, re.IGNORECASE))
-        if form_fields > 7 and not re.search(r'step|wizard|stage', content, re.IGNORECASE):
+        self._rule("1 Miller's Law")
+        form_fields = structure["form_fields"]
+        if form_fields > 7 and not kw.any('multi_step'):
             self.warnings.append(f"[Miller's Law] {filename}: Complex form ({form_fields} fields)")
-            
+
         # Von Restorff
-        if 'button' in content.lower() and not re.search(r'primary|bg-primary|Button.*primary|variant=["\']primary', content, re.IGNORECASE):
+        self._rule("1 Von Restorff")
+        if kw.any('button') and not kw.any('primary'):
             self.warnings.append(f"[Von Restorff] {filename}: No primary CTA")
 
         # Serial Position Effect - Important items at beginning/end
+        self._rule("1 Serial Position")
         if nav_items > 3:
             # Check if last nav item is important (contact, login, etc.)
-            nav_content = re.findall(r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', content, re.IGNORECASE)
+            nav_content = structure["nav_texts"]
             if nav_content and len(nav_content) > 2:
                 last_item = nav_content[-1].lower() if nav_content else ''
                 if not any(x in last_item for x in ['contact', 'login', 'sign', 'get started', 'cta', 'button']):
@@ -147,108 +748,119 @@ class UXAuditor:
         # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
 
         # Visceral: First impressions (aesthetics, gradients, animations)
-        has_hero = bool(re.search(r'hero|<h1|banner', content, re.IGNORECASE))
+        self._rule("1.5 Visceral")
+        has_hero = kw.any('hero')
         if has_hero:
             # Check for visual appeal elements
-            has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient', content))
-            has_animation = bool(re.search(r'@keyframes|transition:|animate-', content))
+            has_gradient = kw.any('gradient')
+            has_animation = kw.any('animation')
             has_visual_interest = has_gradient or has_animation
 
-            if not has_visual_interest and not re.search(r'background:|bg-', content):
+            if not has_visual_interest and not kw.any('background'):
                 self.warnings.append(f"[Visceral] {filename}: Hero section lacks visual appeal. Consider gradients or subtle animations.")
 
         # Behavioral: Instant feedback and usability
-        if 'onClick' in content or '@click' in content or 'onclick' in content:
-            has_feedback = re.search(r'transition|animate|hover:|focus:|disabled|loading|spinner', content, re.IGNORECASE)
-            has_state_change = re.search(r'setState|useState|disabled|loading', content)
+        self._rule("1.5 Behavioral")
+        if kw.any('click_handler'):
+            has_feedback = kw.any('feedback')
+            has_state_change = kw.any('state_change')
 
             if not has_feedback and not has_state_change:
                 self.warnings.append(f"[Behavioral] {filename}: Interactive elements lack immediate feedback. Add hover/focus/disabled states.")
 
         # Reflective: Brand story, values, identity
-        has_reflective = bool(re.search(r'about|story|mission|values|why we|our journey|testimonials', content, re.IGNORECASE))
+        self._rule("1.5 Reflective")
+        has_reflective = kw.any('reflective')
         if has_long_text and not has_reflective:
             self.warnings.append(f"[Reflective] {filename}: Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.")
 
         # --- 1.6 TRUST BUILDING (Enhanced) ---
 
         # Security signals
+        self._rule("1.6 Security signals")
         if has_form:
-            security_signals = re.findall(r'ssl|secure|encrypt|lock|padlock|https', content, re.IGNORECASE)
-            if len(security_signals) == 0 and not re.search(r'checkout|payment', content, re.IGNORECASE):
+            if not kw.any('security') and not kw.any('checkout'):
                 self.warnings.append(f"[Trust] {filename}: Form without security indicators. Add 'SSL Secure' or lock icon.")
 
         # Social proof elements
-        social_proof = re.findall(r'review|testimonial|rating|star|trust|trusted by|customer|logo', content, re.IGNORECASE)
-        if len(social_proof) > 0:
+        self._rule("1.6 Social proof")
+        if kw.any('social_proof'):
             self.passed_count += 1
         else:
             if has_long_text:
                 self.warnings.append(f"[Trust] {filename}: No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.")
 
         # Authority indicators
-        has_footer = bool(re.search(r'footer|<footer', content, re.IGNORECASE))
+        self._rule("1.6 Authority")
+        has_footer = kw.any('footer')
         if has_footer:
-            authority = re.findall(r'certif|award|media|press|featured|as seen in', content, re.IGNORECASE)
-            if len(authority) == 0:
+            if not kw.any('authority'):
                 self.warnings.append(f"[Trust] {filename}: Footer lacks authority signals. Add certifications, awards, or media mentions.")
 
         # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
 
         # Progressive disclosure
+        self._rule("1.7 Progressive disclosure")
         if complex_elements > 5:
-            has_progressive = re.search(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', content, re.IGNORECASE)
+            has_progressive = kw.any('progressive')
             if not has_progressive:
                 self.warnings.append(f"[Cognitive Load] {filename}: Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.")
 
         # Visual noise check
-        has_many_colors = len(re.findall(r'#[0-9a-fA-F]{3,6}|rgb|hsl', content)) > 15
-        has_many_borders = len(re.findall(r'border:|border-', content)) > 10
+        self._rule("1.7 Visual noise")
+        has_many_colors = len(COLOR_LITERAL_RE.findall(content)) > 15
+        has_many_borders = kw.count('border') > 10
         if has_many_colors and has_many_borders:
             self.warnings.append(f"[Cognitive Load] {filename}: High visual noise detected. Many colors and borders increase cognitive load.")
 
         # Familiar patterns
+        self._rule("1.7 Familiar patterns")
         if has_form:
-            has_standard_labels = bool(re.search(r'<label|placeholder|aria-label', content, re.IGNORECASE))
+            has_standard_labels = kw.any('labels')
             if not has_standard_labels:
                 self.issues.append(f"[Cognitive Load] {filename}: Form inputs without labels. Use <label> for accessibility and clarity.")
 
         # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
 
         # Smart defaults
+        self._rule("1.8 Smart defaults")
         if has_form:
-            has_defaults = bool(re.search(r'checked|selected|default|value=["\'].*["\']', content))
-            radio_inputs = len(re.findall(r'type=["\']radio', content, re.IGNORECASE))
+            has_defaults = kw.any('defaults') or bool(DEFAULT_VALUE_RE.search(content))
+            radio_inputs = kw.count('radio')
             if radio_inputs > 0 and not has_defaults:
                 self.warnings.append(f"[Persuasion] {filename}: Radio buttons without default selection. Pre-select recommended option.")
 
         # Anchoring (showing original price)
-        if re.search(r'price|pricing|cost|\$\d+', content, re.IGNORECASE):
-            has_anchor = bool(re.search(r'original|was|strike|del|save \d+%', content, re.IGNORECASE))
+        self._rule("1.8 Anchoring")
+        if kw.any('price') or kw.match_at('dollar', DOLLAR_AMOUNT_RE):
+            has_anchor = kw.any('anchor') or kw.match_at('save', SAVE_PERCENT_RE)
             if not has_anchor:
                 self.warnings.append(f"[Persuasion] {filename}: Prices without anchoring. Show original price to frame discount value.")
 
         # Social proof live indicators
-        has_social = bool(re.search(r'join|subscriber|member|user', content, re.IGNORECASE))
+        self._rule("1.8 Social proof numbers")
+        has_social = kw.any('social')
         if has_social:
-            has_count = bool(re.findall(r'\d+[+kmb]|\d+,\d+', content))
+            has_count = bool(SOCIAL_COUNT_RE.search(content))
             if not has_count:
                 self.warnings.append(f"[Persuasion] {filename}: Social proof without specific numbers. Use 'Join 10,000+' format.")
 
         # Progress indicators
+        self._rule("1.8 Progress indicators")
         if has_form:
-            has_progress = bool(re.search(r'progress|step \d+|complete|%|bar', content, re.IGNORECASE))
+            has_progress = kw.any('progress') or kw.match_at('step_number', STEP_NUMBER_RE)
             if complex_elements > 5 and not has_progress:
                 self.warnings.append(f"[Persuasion] {filename}: Long form without progress indicator. Add progress bar or 'Step X of Y'.")
 
         # --- 2. TYPOGRAPHY SYSTEM (Complete Coverage) ---
 
         # 2.1 Font Pairing - Too many font families
+        self._rule("2.1 Font pairing")
         font_families = set()
         # Check for @font-face, Google Fonts, font-family declarations
-        font_faces = re.findall(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', content, re.IGNORECASE)
-        google_fonts = re.findall(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', content, re.IGNORECASE)
-        font_family_css = re.findall(r'font-family:\s*([^;]+)', content, re.IGNORECASE)
+        font_faces = FONT_FACE_RE.findall(content)
+        google_fonts = GOOGLE_FONTS_RE.findall(content)
+        font_family_css = FONT_FAMILY_RE.findall(content)
 
         for font in font_faces: font_families.add(font.strip().lower())
         for font in google_fonts:
@@ -265,37 +877,41 @@ class UXAuditor:
             self.issues.append(f"[Typography] {filename}: {len(font_families)} font families detected. Limit to 2-3 for cohesion.")
 
         # 2.2 Line Length - Character-based width
-        if has_long_text and not re.search(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', content):
+        self._rule("2.2 Line length")
+        if has_long_text and not LINE_LENGTH_RE.search(content):
             self.warnings.append(f"[Typography] {filename}: No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].")
 
         # 2.3 Line Height - Proper leading ratios
+        self._rule("2.3 Line height")
         # Check for text without proper line-height
-        text_elements = len(re.findall(r'<p|<span|<div.*text|<h[1-6]', content, re.IGNORECASE))
-        if text_elements > 0 and not re.search(r'leading-|line-height:', content):
+        has_text_elements = kw.any('text_element') or kw.on_line('div_open', 'text')
+        if has_text_elements and not kw.any('line_height'):
             self.warnings.append(f"[Typography] {filename}: Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3")
 
         # Check for heading-specific line height issues
-        if re.search(r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', content, re.IGNORECASE):
+        if kw.any('heading_or_large'):
             # Extract line-height values
-            line_heights = re.findall(r'(?:leading-|line-height:\s*)([\d.]+)', content)
+            line_heights = LINE_HEIGHT_VALUE_RE.findall(content)
             for lh in line_heights:
                 if float(lh) > 1.5:
                     self.warnings.append(f"[Typography] {filename}: Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).")
 
         # 2.4 Letter Spacing (Tracking)
+        self._rule("2.4 Letter spacing")
         # Uppercase without tracking
-        if re.search(r'uppercase|text-transform:\s*uppercase', content, re.IGNORECASE):
-            if not re.search(r'tracking-|letter-spacing:', content):
+        if kw.any('uppercase'):
+            if not kw.any('tracking'):
                 self.warnings.append(f"[Typography] {filename}: Uppercase text without tracking. ALL CAPS needs +5-10% spacing.")
 
         # Large text (display/hero) should have negative tracking
-        if re.search(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', content):
-            if not re.search(r'tracking-tight|letter-spacing:\s*-[0-9]', content):
+        if kw.any('display_text') or DISPLAY_FONT_SIZE_RE.search(content):
+            if not (kw.any('tracking_tight') or NEGATIVE_TRACKING_RE.search(content)):
                 self.warnings.append(f"[Typography] {filename}: Large display text without tracking-tight. Big text needs -1% to -4% spacing.")
 
         # 2.5 Weight and Emphasis - Contrast levels
+        self._rule("2.5 Font weights")
         # Check for adjacent weight levels (poor contrast)
-        weights = re.findall(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', content, re.IGNORECASE)
+        weights = FONT_WEIGHT_RE.findall(content)
         weight_values = []
         for w in weights:
             val = w[0] or w[1]
@@ -319,12 +935,14 @@ class UXAuditor:
             self.warnings.append(f"[Typography] {filename}: {len(unique_weights)} font weights. Limit to 3-4 per page.")
 
         # 2.6 Responsive Typography - Fluid sizing with clamp()
-        has_font_sizes = bool(re.search(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', content))
-        if has_font_sizes and not re.search(r'clamp\(|responsive:', content):
+        self._rule("2.6 Fluid typography")
+        has_font_sizes = kw.any('font_size')
+        if has_font_sizes and not kw.any('fluid_type'):
             self.warnings.append(f"[Typography] {filename}: Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)")
 
         # 2.7 Hierarchy - Heading structure
-        headings = re.findall(r'<(h[1-6])', content, re.IGNORECASE)
+        self._rule("2.7 Heading hierarchy")
+        headings = structure["headings"]
         if headings:
             # Check for skipped levels (h1 -> h3)
             for i in range(len(headings) - 1):
@@ -338,8 +956,9 @@ class UXAuditor:
                 self.warnings.append(f"[Typography] {filename}: No h1 found. Each page should have one primary heading.")
 
         # 2.8 Modular Scale - Consistent sizing
+        self._rule("2.8 Modular scale")
         # Extract font-size values
-        font_sizes = re.findall(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', content)
+        font_sizes = FONT_SIZE_VALUE_RE.findall(content)
         size_values = []
         for size, unit in font_sizes:
             if unit == 'rem' or unit == 'em':
@@ -363,8 +982,9 @@ class UXAuditor:
                     break
 
         # 2.9 Readability - Content chunking
+        self._rule("2.9 Readability")
         # Check for very long paragraphs (>5 lines estimated)
-        paragraphs = re.findall(r'<p[^>]*>([^<]+)</p>', content, re.IGNORECASE)
+        paragraphs = structure["paragraphs"]
         for p in paragraphs:
             word_count = len(p.split())
             if word_count > 100:  # ~5-6 lines
@@ -372,38 +992,40 @@ class UXAuditor:
 
         # Check for missing subheadings in long content
         if len(paragraphs) > 5:
-            subheadings = len(re.findall(r'<h[2-6]', content, re.IGNORECASE))
-            if subheadings == 0:
+            if not kw.any('subheading'):
                 self.warnings.append(f"[Typography] {filename}: Long content without subheadings. Add h2/h3 to break up text.")
 
         # --- 3. VISUAL EFFECTS (visual-effects.md) ---
-        
+
         # Glassmorphism Check
-        if 'backdrop-filter' in content or 'blur(' in content:
-            if not re.search(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', content):
+        self._rule("3 Glassmorphism")
+        if kw.any('backdrop'):
+            if not TRANSLUCENT_BG_RE.search(content):
                 self.warnings.append(f"[Visual] {filename}: Blur used without semi-transparent background (Glassmorphism fail)")
-        
+
         # GPU Acceleration / Performance
-        if re.search(r'@keyframes|transition:', content):
-            expensive_props = re.findall(r'width|height|top|left|right|bottom|margin|padding', content)
+        self._rule("3 GPU acceleration")
+        if kw.any('motion'):
+            expensive_props = kw.findall('expensive_prop')
             if expensive_props:
-                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible.")
-            
+                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(sorted(set(expensive_props)))}). Use transform/opacity where possible.")
+
             # Reduced Motion
-            if not re.search(r'prefers-reduced-motion', content):
+            if not kw.any('reduced_motion'):
                 self.warnings.append(f"[Accessibility] {filename}: Animations found without prefers-reduced-motion check")
 
         # Natural Shadows
-        shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
+        self._rule("3 Natural shadows")
+        shadows = BOX_SHADOW_RE.findall(content)
         for shadow in shadows:
             # Check if natural (Y > X) or multiple layers
-            if ',' not in shadow and not re.search(r'\d+px\s+[1-9]\d*px', shadow): # Simple heuristic for Y-offset
+            if ',' not in shadow and not SHADOW_Y_OFFSET_RE.search(shadow): # Simple heuristic for Y-offset
                  self.warnings.append(f"[Visual] {filename}: Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.")
 
         # --- 3.1 NEOMORPHISM CHECK ---
+        self._rule("3.1 Neomorphism")
         # Check for neomorphism patterns (dual shadows with opposite directions)
-        neo_shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in neo_shadows:
+        for shadow in shadows:
             # Neomorphism has two shadows: positive offset + negative offset
             if ',' in shadow and '-' in shadow:
                 # Check for inset pattern (pressed state)
@@ -411,11 +1033,12 @@ class UXAuditor:
                     self.warnings.append(f"[Visual] {filename}: Neomorphism inset detected. Ensure adequate contrast for accessibility.")
 
         # --- 3.2 SHADOW HIERARCHY ---
+        self._rule("3.2 Shadow hierarchy")
         # Count shadow levels to check for elevation consistency
         shadow_count = len(shadows)
         if shadow_count > 0:
             # Check for shadow opacity levels (should indicate hierarchy)
-            opacities = re.findall(r'rgba?\([^)]+,\s*([\d.]+)\)', content)
+            opacities = RGBA_ALPHA_RE.findall(content)
             shadow_opacities = [float(o) for o in opacities if float(o) < 0.5]
             if shadow_count >= 3 and len(shadow_opacities) > 0:
                 # Check if there's variety in shadow opacities for different elevations
@@ -424,69 +1047,75 @@ class UXAuditor:
                     self.warnings.append(f"[Visual] {filename}: All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.")
 
         # --- 3.3 GRADIENT CHECKS ---
+        self._rule("3.3 Gradients")
         # Check for gradient usage
-        has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient|conic-gradient', content))
+        has_gradient = kw.any('gradient')
         if has_gradient:
             # Warn about mesh/aurora gradients (can be overused)
-            gradient_count = len(re.findall(r'gradient', content, re.IGNORECASE))
+            gradient_count = kw.count('gradient_any_case')
             if gradient_count > 5:
                 self.warnings.append(f"[Visual] {filename}: Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration.")
         else:
             # Check if hero section exists without gradient
-            if has_hero and not re.search(r'background:|bg-', content):
+            if has_hero and not kw.any('background'):
                 self.warnings.append(f"[Visual] {filename}: Hero section without visual interest. Consider gradient for depth.")
 
         # --- 3.4 BORDER EFFECTS ---
+        self._rule("3.4 Border effects")
         # Check for gradient borders or animated borders
-        has_border = bool(re.search(r'border:|border-', content))
+        has_border = kw.any('border')
         if has_border:
             # Check for overly complex borders
-            border_count = len(re.findall(r'border:', content))
+            border_count = kw.count('border_decl')
             if border_count > 8:
                 self.warnings.append(f"[Visual] {filename}: Many border declarations ({border_count}). Simplify for cleaner look.")
 
         # --- 3.5 GLOW EFFECTS ---
+        self._rule("3.5 Glow effects")
         # Check for text-shadow or multiple box-shadow layers (glow effects)
-        text_shadows = re.findall(r'text-shadow:', content)
+        text_shadows = kw.findall('text_shadow')
         for ts in text_shadows:
             # Multiple text-shadow layers indicate glow
             if ',' in ts:
                 self.warnings.append(f"[Visual] {filename}: Text glow effect detected. Ensure readability is maintained.")
 
         # Check for box-shadow glow (multiple layers with 0 offset)
-        glow_shadows = re.findall(r'box-shadow:\s*[^;]*0\s+0\s+', content)
+        glow_shadows = [shadow for shadow in shadows if GLOW_OFFSET_RE.search(shadow)]
         if len(glow_shadows) > 2:
             self.warnings.append(f"[Visual] {filename}: Multiple glow effects detected. Use sparingly for emphasis only.")
 
         # --- 3.6 OVERLAY TECHNIQUES ---
+        self._rule("3.6 Overlays")
         # Check for image overlays (for readability)
-        has_images = bool(re.search(r'<img|background-image:|bg-\[url', content))
+        has_images = kw.any('images')
         if has_images and has_long_text:
-            has_overlay = bool(re.search(r'overlay|rgba\(0|gradient.*transparent|::after|::before', content))
+            has_overlay = kw.any('overlay') or kw.on_line('gradient', 'transparent')
             if not has_overlay:
                 self.warnings.append(f"[Visual] {filename}: Text over image without overlay. Add gradient overlay for readability.")
 
         # --- 3.7 PERFORMANCE: will-change ---
+        self._rule("3.7 will-change")
         # Check for will-change usage
-        if re.search(r'will-change:', content):
-            will_change_props = re.findall(r'will-change:\s*([^;]+)', content)
+        if kw.any('will_change'):
+            will_change_props = WILL_CHANGE_RE.findall(content)
             for prop in will_change_props:
                 prop = prop.strip().lower()
                 if prop in ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']:
                     self.issues.append(f"[Performance] {filename}: will-change on '{prop}' (layout property). Use only for transform/opacity.")
 
         # Check for excessive will-change usage
-        will_change_count = len(re.findall(r'will-change:', content))
+        will_change_count = kw.count('will_change')
         if will_change_count > 3:
             self.warnings.append(f"[Performance] {filename}: Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations.")
 
         # --- 3.8 EFFECT SELECTION ---
+        self._rule("3.8 Effect selection")
         # Check for effect overuse (too many visual effects)
         effect_count = (
             (1 if has_gradient else 0) +
             shadow_count +
-            len(re.findall(r'backdrop-filter|blur\(', content)) +
-            len(re.findall(r'text-shadow:', content))
+            kw.count('backdrop') +
+            kw.count('text_shadow')
         )
         if effect_count > 10:
             self.warnings.append(f"[Visual] {filename}: Many visual effects ({effect_count}). Ensure effects serve purpose, not decoration.")
@@ -498,33 +1127,31 @@ class UXAuditor:
         # --- 4. COLOR SYSTEM (color-system.md) ---
 
         # 4.1 PURPLE BAN - Critical check from color-system.md
-        purple_hexes = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
-                        '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
-                        '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
-                        'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
-        for purple in purple_hexes:
-            if purple.lower() in content.lower():
-                self.issues.append(f"[Color] {filename}: PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
-                break
+        self._rule("4.1 Purple ban")
+        purple = kw.first('purple')
+        if purple:
+            self.issues.append(f"[Color] {filename}: PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
 
         # 4.2 60-30-10 Rule check
+        self._rule("4.2 60-30-10 rule")
         # Count color usage to estimate ratio
-        color_hex_count = len(re.findall(r'#[0-9a-fA-F]{3,6}', content))
-        hsl_count = len(re.findall(r'hsl\(', content))
+        color_hex_count = len(HEX_COLOR_RE.findall(content))
+        hsl_count = kw.count('hsl')
         total_colors = color_hex_count + hsl_count
         if total_colors > 3:
             # Check for dominant colors (should be ~60%)
-            bg_declarations = re.findall(r'(?:background|bg-|bg\[)([^;}\s]+)', content)
-            text_declarations = re.findall(r'(?:color|text-)([^;}\s]+)', content)
+            bg_declarations = BG_DECLARATION_RE.findall(content)
+            text_declarations = TEXT_DECLARATION_RE.findall(content)
             if len(bg_declarations) > 0 and len(text_declarations) > 0:
                 # Just warn if too many distinct colors
-                unique_hexes = set(re.findall(r'#[0-9a-fA-F]{6}', content))
+                unique_hexes = set(HEX6_COLOR_RE.findall(content))
                 if len(unique_hexes) > 5:
                     self.warnings.append(f"[Color] {filename}: {len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).")
 
         # 4.3 Color Scheme Pattern Detection
+        self._rule("4.3 Color scheme")
         # Detect monochromatic (same hue, different lightness)
-        hsl_matches = re.findall(r'hsl\((\d+),\s*\d+%,\s*\d+%\)', content)
+        hsl_matches = HSL_HUE_RE.findall(content)
         if len(hsl_matches) >= 3:
             hues = [int(h) for h in hsl_matches]
             hue_range = max(hues) - min(hues)
@@ -532,108 +1159,132 @@ class UXAuditor:
                 self.warnings.append(f"[Color] {filename}: Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast.")
 
         # 4.4 Dark Mode Compliance
+        self._rule("4.4 Dark mode")
         # Check for pure black (#000000) or pure white (#FFFFFF) text (forbidden)
-        if re.search(r'color:\s*#000000|#000\b', content):
+        if PURE_BLACK_RE.search(content):
             self.warnings.append(f"[Color] {filename}: Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.")
-        if re.search(r'background:\s*#ffffff|#fff\b', content) and re.search(r'dark:\s*|dark:', content):
+        if PURE_WHITE_RE.search(content) and kw.any('dark'):
             self.warnings.append(f"[Color] {filename}: Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.")
 
-        # 4.5 WCAG Contrast Pattern Check
-        # Look for potential low-contrast combinations
-        light_bg_light_text = bool(re.search(r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', content))
-        dark_bg_dark_text = bool(re.search(r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', content))
-        if light_bg_light_text or dark_bg_dark_text:
-            self.warnings.append(f"[Color] {filename}: Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
+        # 4.5 WCAG Contrast Check
+        self._rule("4.5 Contrast")
+        if structure["ir"] is not None and contrast is not None:
+            # Real ratios from resolved foreground/background colors
+            findings = contrast.check_ir(structure["ir"], page_path=os.path.abspath(filepath))
+            if findings:
+                worst = min(findings, key=lambda f: f.ratio)
+                self.warnings.append(f"[Color] {filename}: {len(findings)} text run(s) below WCAG AA contrast. Worst: L{worst.line} {worst.message()}")
+        else:
+            # No resolved colors: look for potential low-contrast combinations
+            light_bg_light_text = kw.any('light_bg') or kw.on_line(
+                'bg_white', ('text-gray-1', 'text-gray-2', 'text-slate-1', 'text-slate-2'))
+            dark_bg_dark_text = kw.any('dark_bg') or kw.on_line(
+                'bg_black', ('text-gray-8', 'text-gray-9', 'text-slate-8', 'text-slate-9'))
+            if light_bg_light_text or dark_bg_dark_text:
+                self.warnings.append(f"[Color] {filename}: Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
 
         # 4.6 Color Psychology Context Check
+        self._rule("4.6 Color psychology")
         # Warn if blue used for food/restaurant context
-        has_blue = bool(re.search(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', content))
-        has_food_context = bool(re.search(r'restaurant|food|cooking|recipe|menu|dish|meal', content, re.IGNORECASE))
-        if has_blue and has_food_context:
+        has_food_context = kw.any('food')
+        if has_food_context and (kw.any('blue') or BLUE_HEX_RE.search(content)):
             self.warnings.append(f"[Color] {filename}: Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).")
 
         # 4.7 HSL-Based Palette Detection
+        self._rule("4.7 HSL palette")
         # Check if using HSL for palette (recommended in color-system.md)
-        has_color_vars = bool(re.search(r'--color-|color-|primary-|secondary-', content))
-        if has_color_vars and not re.search(r'hsl\(', content):
+        has_color_vars = kw.any('color_var')
+        if has_color_vars and not kw.any('hsl'):
             self.warnings.append(f"[Color] {filename}: Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).")
 
         # --- 5. ANIMATION GUIDE (animation-guide.md) ---
 
         # 5.1 Duration Appropriateness
+        self._rule("5.1 Duration")
         # Check for excessively long or short animations
-        durations = re.findall(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', content)
+        durations = DURATION_RE.findall(content)
         for duration, unit in durations:
             duration_ms = float(duration) * (1000 if unit == 's' else 1)
             if duration_ms < 50:
                 self.warnings.append(f"[Animation] {filename}: Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
-            elif duration_ms > 1000 and 'transition' in content.lower():
+            elif duration_ms > 1000 and kw.any('transition_any_case'):
                 self.warnings.append(f"[Animation] {filename}: Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
 
         # 5.2 Easing Function Correctness
+        self._rule("5.2 Easing")
         # Check for incorrect easing patterns
-        if re.search(r'ease-in\s+.*entry|fade-in.*ease-in', content):
+        if kw.line_match('ease_in', EASE_IN_ENTRY_RE) or kw.on_line('fade_in', 'ease-in'):
             self.warnings.append(f"[Animation] {filename}: Entry animation with ease-in. Entry should use ease-out for snappy feel.")
-        if re.search(r'ease-out\s+.*exit|fade-out.*ease-out', content):
+        if kw.line_match('ease_out', EASE_OUT_EXIT_RE) or kw.on_line('fade_out', 'ease-out'):
             self.warnings.append(f"[Animation] {filename}: Exit animation with ease-out. Exit should use ease-in for natural feel.")
 
         # 5.3 Micro-interaction Feedback Patterns
+        self._rule("5.3 Micro-interactions")
         # Check for interactive elements without hover/focus states
-        interactive_elements = len(re.findall(r'<button|<a\s+href|onClick|@click', content))
-        has_hover_focus = bool(re.search(r'hover:|focus:|:hover|:focus', content))
+        interactive_elements = kw.count('interactive') + len(LINK_HREF_RE.findall(content))
+        has_hover_focus = kw.any('hover_focus')
         if interactive_elements > 2 and not has_hover_focus:
             self.warnings.append(f"[Animation] {filename}: Interactive elements without hover/focus states. Add micro-interactions for feedback.")
 
         # 5.4 Loading State Indicators
+        self._rule("5.4 Loading states")
         # Check for loading patterns
-        has_async = bool(re.search(r'async|await|fetch|axios|loading|isLoading', content))
-        has_loading_indicator = bool(re.search(r'skeleton|spinner|progress|loading|<circle.*animate', content))
+        has_async = kw.any('async')
+        has_loading_indicator = kw.any('loading_indicator') or kw.on_line('circle_open', 'animate')
         if has_async and not has_loading_indicator:
             self.warnings.append(f"[Animation] {filename}: Async operations without loading indicator. Add skeleton or spinner for perceived performance.")
 
         # 5.5 Page Transition Patterns
+        self._rule("5.5 Page transitions")
         # Check for page/view transitions
-        has_routing = bool(re.search(r'router|navigate|Link.*to|useHistory', content))
-        has_page_transition = bool(re.search(r'AnimatePresence|motion\.|transition.*page|fade.*route', content))
+        has_routing = kw.any('routing') or kw.on_line('link_component', 'to')
+        has_page_transition = (kw.any('page_transition') or kw.on_line('transition', 'page')
+                               or kw.on_line('fade', 'route'))
         if has_routing and not has_page_transition:
             self.warnings.append(f"[Animation] {filename}: Routing detected without page transitions. Consider fade/slide for context continuity.")
 
         # 5.6 Scroll Animation Performance
+        self._rule("5.6 Scroll animation")
         # Check for scroll-driven animations
-        has_scroll_anim = bool(re.search(r'onScroll|scroll.*trigger|IntersectionObserver', content))
+        has_scroll_anim = kw.any('scroll_anim') or kw.on_line('scroll', 'trigger')
         if has_scroll_anim:
             # Check if using expensive properties in scroll handlers
-            if re.search(r'onScroll.*[^\w](width|height|top|left)', content):
+            if kw.line_match('on_scroll', SCROLL_LAYOUT_RE):
                 self.issues.append(f"[Animation] {filename}: Scroll handler animating layout properties. Use transform/opacity for 60fps.")
 
         # --- 6. MOTION GRAPHICS (motion-graphics.md) ---
 
         # 6.1 Lottie Animation Checks
-        has_lottie = bool(re.search(r'lottie|Lottie|@lottie-react', content))
+        self._rule("6.1 Lottie")
+        has_lottie = kw.any('lottie')
         if has_lottie:
             # Check for reduced motion fallback
-            has_lottie_fallback = bool(re.search(r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', content))
+            has_lottie_fallback = (kw.on_line('reduced_motion', 'lottie')
+                                   or kw.on_line('lottie_lower', ('isPaused', 'stop')))
             if not has_lottie_fallback:
                 self.warnings.append(f"[Motion] {filename}: Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.")
 
         # 6.2 GSAP Memory Leak Risks
-        has_gsap = bool(re.search(r'gsap|ScrollTrigger|from\(.*gsap', content))
+        self._rule("6.2 GSAP cleanup")
+        has_gsap = kw.any('gsap')
         if has_gsap:
             # Check for cleanup patterns
-            has_gsap_cleanup = bool(re.search(r'kill\(|revert\(|useEffect.*return.*gsap', content))
+            has_gsap_cleanup = kw.any('gsap_cleanup') or kw.on_line('use_effect', 'return', 'gsap')
             if not has_gsap_cleanup:
                 self.issues.append(f"[Motion] {filename}: GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.")
 
         # 6.3 SVG Animation Performance
-        svg_animations = re.findall(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset', content)
-        if len(svg_animations) > 3:
+        self._rule("6.3 SVG animation")
+        svg_animations = kw.count('svg_animation')
+        if svg_animations > 3:
             self.warnings.append(f"[Motion] {filename}: Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.")
 
         # 6.4 3D Transform Performance
-        has_3d_transform = bool(re.search(r'transform3d|perspective\(|rotate3d|translate3d', content))
+        self._rule("6.4 3D transforms")
+        has_3d_transform = kw.any('transform_3d')
         if has_3d_transform:
             # Check for perspective on parent
-            has_perspective_parent = bool(re.search(r'perspective:\s*\d+px|perspective\s*\(', content))
+            has_perspective_parent = bool(PERSPECTIVE_RE.search(content))
             if not has_perspective_parent:
                 self.warnings.append(f"[Motion] {filename}: 3D transform without perspective parent. Add perspective: 1000px for realistic depth.")
 
@@ -641,66 +1292,201 @@ class UXAuditor:
             self.warnings.append(f"[Motion] {filename}: 3D transforms detected. Test on mobile; can impact performance on low-end devices.")
 
         # 6.5 Particle Effect Warnings
+        self._rule("6.5 Particles")
         # Check for canvas/WebGL particle systems
-        has_particles = bool(re.search(r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js', content))
+        has_particles = (kw.any('particles') or kw.on_line('canvas', 'loop')
+                         or kw.on_line('animation_frame', 'draw'))
         if has_particles:
             self.warnings.append(f"[Motion] {filename}: Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.")
 
         # 6.6 Scroll-Driven Animation Performance
-        has_scroll_driven = bool(re.search(r'IntersectionObserver.*animate|scroll.*progress|view-timeline', content))
+        self._rule("6.6 Scroll-driven animation")
+        has_scroll_driven = (kw.any('scroll_driven') or kw.on_line('intersection_observer', 'animate')
+                             or kw.on_line('scroll', 'progress'))
         if has_scroll_driven:
             # Check for throttling/debouncing
-            has_throttle = bool(re.search(r'throttle|debounce|requestAnimationFrame', content))
+            has_throttle = kw.any('throttle')
             if not has_throttle:
                 self.issues.append(f"[Motion] {filename}: Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.")
 
         # 6.7 Motion Decision Tree - Context Check
+        self._rule("6.7 Motion purpose")
         # Check if animation serves purpose (not just decoration)
         total_animations = (
-            len(re.findall(r'@keyframes|transition:|animate-', content)) +
+            kw.count('animation') +
             (1 if has_lottie else 0) +
             (1 if has_gsap else 0)
         )
         if total_animations > 5:
             # Check if animations are functional
-            functional_animations = len(re.findall(r'hover:|focus:|disabled|loading|error|success', content))
+            functional_animations = kw.count('functional_animation')
             if functional_animations < total_animations / 2:
                 self.warnings.append(f"[Motion] {filename}: Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration.")
 
         # --- 7. ACCESSIBILITY ---
-        if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
+        self._rule("7 Alt text")
+        if structure["missing_alt"]:
             self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
 
-    def audit_directory(self, directory: str) -> None:
+        self._rule(None)
+
+    def find_files(self, directory: str) -> list:
         extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
+        paths = []
         for root, dirs, files in os.walk(directory):
             dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
             for file in files:
                 if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+                    paths.append(os.path.join(root, file))
+        return paths
+
+    def audit_directory(self, directory: str, jobs: int = 1) -> None:
+        """Audit every front-end file under directory.
+
+        With jobs > 1 files are fanned out to a process pool. Per-file
+        results are merged in walk order, so the report is identical to
+        the serial run.
+        """
+        paths = self.find_files(directory)
+        if jobs <= 1 or len(paths) <= 1:
+            for path in paths:
+                self.audit_file(path)
+            return
+
+        chunksize = max(1, len(paths) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            worker = partial(_audit_worker, profile=self.profile is not None,
+                             budget=self.budget)
+            for path, result in zip(paths, pool.map(worker, paths, chunksize=chunksize)):
+                self.merge(result)
+                if self.emitter:
+                    self._stream(path)
+
+    def merge(self, other: 'UXAuditor') -> None:
+        """Append another auditor's results to this one."""
+        self.files_checked += other.files_checked
+        self.issues.extend(other.issues)
+        self.warnings.extend(other.warnings)
+        self.passed_count += other.passed_count
+        self.timeouts.extend(other.timeouts)
+        if self.profile is not None and other.profile:
+            for rule, (seconds, findings, files) in other.profile.items():
+                stats = self.profile.setdefault(rule, [0.0, 0, 0])
+                stats[0] += seconds
+                stats[1] += findings
+                stats[2] += files
+
+    def get_profile(self) -> list:
+        """Per-rule timings, slowest first."""
+        rules = [
+            {"rule": rule, "seconds": round(seconds, 6), "findings": findings,
+             "files": files, "avg_ms": round(seconds * 1000 / files, 3) if files else 0.0}
+            for rule, (seconds, findings, files) in (self.profile or {}).items()
+        ]
+        return sorted(rules, key=lambda r: (-r["seconds"], r["rule"]))
+
+    def get_summary(self) -> dict:
+        """Totals for a streamed run (findings themselves were emitted)."""
+        issues = self.issue_count + len(self.issues)
+        return {
+            "files_checked": self.files_checked,
+            "issues": issues,
+            "warnings": self.warning_count + len(self.warnings),
+            "passed_checks": self.passed_count,
+            "timeouts": len(self.timeouts),
+            "compliant": issues == 0,
+        }
 
     def get_report(self):
-        return {
+        report = {
             "files_checked": self.files_checked,
             "issues": self.issues,
             "warnings": self.warnings,
             "passed_checks": self.passed_count,
             "compliant": len(self.issues) == 0
         }
+        if self.timeouts:
+            report["timeouts"] = self.timeouts
+        return report
+
+
+# --profile output (relative to the working directory)
+PROFILE_FILE = os.path.join('.tmp', 'ux_audit_profile.json')
+
+
+def _audit_worker(filepath: str, profile: bool = False,
+                  budget: float = FILE_BUDGET) -> UXAuditor:
+    """Process-pool worker: audit one file in a fresh auditor."""
+    auditor = UXAuditor(profile, budget)
+    auditor.audit_file(filepath)
+    return auditor
+
+
+def print_profile(rules: list, top: int, out) -> None:
+    total = sum(r["seconds"] for r in rules) or 1.0
+    print(f"\n[PROFILE] Top {min(top, len(rules))} of {len(rules)} rules by wall time", file=out)
+    print("-" * 50, file=out)
+    for r in rules[:top]:
+        print(f"  {r['seconds'] * 1000:9.1f} ms {r['seconds'] / total:6.1%}  "
+              f"{r['avg_ms']:7.3f} ms/file  {r['findings']:4d} findings  {r['rule']}", file=out)
+
 
 def main():
     if len(sys.argv) < 2: sys.exit(1)
     
     path = sys.argv[1]
     is_json = "--json" in sys.argv
+
+    # --jobs N: audit a directory on N worker processes (0 = all cores)
+    jobs = 1
+    if "--jobs" in sys.argv:
+        try:
+            jobs = int(sys.argv[sys.argv.index("--jobs") + 1])
+        except (IndexError, ValueError):
+            sys.exit(1)
+        jobs = jobs or os.cpu_count() or 1
+
+    # --profile [--top N]: per-rule wall time, written to PROFILE_FILE
+    profile = "--profile" in sys.argv
+    top = 15
+    if "--top" in sys.argv:
+        try:
+            top = int(sys.argv[sys.argv.index("--top") + 1])
+        except (IndexError, ValueError):
+            sys.exit(1)
     
-    auditor = UXAuditor()
+    # --budget SECONDS: per-file time budget (0 disables)
+    budget = FILE_BUDGET
+    if "--budget" in sys.argv:
+        try:
+            budget = float(sys.argv[sys.argv.index("--budget") + 1])
+        except (IndexError, ValueError):
+            sys.exit(1)
+
+    # --format jsonl|sarif: write each finding as it is found (execution/qa_emit.py)
+    fmt = "text"
+    if "--format" in sys.argv:
+        try:
+            fmt = sys.argv[sys.argv.index("--format") + 1]
+        except IndexError:
+            sys.exit(1)
+    emitter = None
+    if fmt != "text":
+        if qa_emit is None or fmt not in qa_emit.FORMATS:
+            print(f"[!] --format {fmt} needs execution/qa_emit.py (formats: text, jsonl, sarif)", file=sys.stderr)
+            sys.exit(1)
+        emitter = qa_emit.make_emitter(fmt, "ux_audit")
+
+    auditor = UXAuditor(profile, budget, emitter)
     if os.path.isfile(path): auditor.audit_file(path)
-    else: auditor.audit_directory(path)
+    else: auditor.audit_directory(path, jobs)
     
     report = auditor.get_report()
     
-    if is_json:
+    if emitter:
+        report = auditor.get_summary()
+        emitter.close(report)
+    elif is_json:
         print(json.dumps(report))
     else:
         # Use ASCII-safe output for Windows console compatibility
@@ -712,10 +1498,25 @@ def main():
         if report['warnings']:
             print(f"[*] WARNINGS ({len(report['warnings'])}):")
             for w in report['warnings'][:15]: print(f"  - {w}")
+        if report.get('timeouts'):
+            print(f"[!] OVER BUDGET ({len(report['timeouts'])}):")
+            for t in report['timeouts']: print(f"  - {t['file']}: '{t['rule']}' (> {t['budget']:g}s)")
         print(f"[+] PASSED CHECKS: {report['passed_checks']}")
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
+    if profile:
+        rules = auditor.get_profile()
+        os.makedirs(os.path.dirname(PROFILE_FILE), exist_ok=True)
+        with open(PROFILE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"files_checked": auditor.files_checked,
+                       "total_seconds": round(sum(r["seconds"] for r in rules), 6),
+                       "rules": rules}, f, indent=2)
+        # Keep stdout parseable in --json / --format modes
+        out = sys.stderr if is_json or emitter else sys.stdout
+        print_profile(rules, top, out)
+        print(f"[PROFILE] Written to {PROFILE_FILE}", file=out)
+
     sys.exit(0 if report['compliant'] else 1)
 
 if __name__ == "__main__":
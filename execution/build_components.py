@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+build_components.py — Build-time Component Inlining (Layer 3 Execution)
+
+Pages render empty placeholders (<div id="navbar-placeholder"></div>) and
+a loadComponent() script fetch()es src/components/navbar.html and
+footer.html after DOMContentLoaded: two network round trips and a layout
+shift on every first paint, and nothing at all when the page is opened
+from file://. This script resolves the placeholders at build time and
+writes fully assembled static pages.
+
+How it works:
+  1. Each placeholder is replaced by its component, indented to match
+     and wrapped in marker comments:
+       <!-- component: src/components/navbar.html -->
+       <nav id="axiara-navbar" ...>...</nav>
+       <!-- /component: src/components/navbar.html -->
+     Re-runs refresh everything between the markers, so after editing a
+     component one run updates every page that uses it.
+  2. The runtime loader (the loadComponent() function and the
+     DOMContentLoaded listener calling it) is removed. Anything else in
+     the same <script> (e.g. the contact form handler) is kept. The
+     loader was also what initialised Lucide icons, so pages that load
+     Lucide get a lucide.createIcons() call in its place.
+
+Components are read with generate_page_shell.load_component (same files,
+same inline defaults), once per build however many pages use them.
+
+Run this before execution/build_tailwind.py: the component markup is then
+part of each page, so its classes are compiled with the page's theme.
+
+Usage:
+  python3 execution/build_components.py
+  python3 execution/build_components.py index.html services/
+  python3 execution/build_components.py --check      # exit 1 if out of date
+
+Source of truth:
+  - src/components/navbar.html, src/components/footer.html
+  - directives/build-page.md (Standard Page Structure)
+
+No external dependencies beyond Python standard library.
+"""
+
+import argparse
+import functools
+import os
+import re
+import sys
+
+from generate_page_shell import (DEFAULT_FOOTER, DEFAULT_NAVBAR, FOOTER_PATH,
+                                 NAVBAR_PATH, load_component)
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Placeholder element id → (component file, inline default)
+PLACEHOLDERS = {
+    "navbar-placeholder": (NAVBAR_PATH, DEFAULT_NAVBAR),
+    "footer-placeholder": (FOOTER_PATH, DEFAULT_FOOTER),
+}
+
+# Snapshots that are not built from the components
+EXCLUDE_DIRS = ("axiara-deploy-v1", "src/components")
+
+PLACEHOLDER_RE = re.compile(
+    r'^([ \t]*)<div id="(' + "|".join(PLACEHOLDERS) + r')"\s*>\s*</div>[ \t]*$', re.M)
+
+# A previously inlined component, markers included
+INLINED_RE = re.compile(
+    r'^([ \t]*)<!-- component: ([\w./-]+) -->\n.*?^[ \t]*<!-- /component: \2 -->[ \t]*$',
+    re.M | re.S)
+
+# Inline <script> blocks; the loader script is cut short in some pages,
+# so an unterminated block runs to the end of the file
+SCRIPT_RE = re.compile(r'^([ \t]*)<script>(.*?)(</script>[ \t]*\n?|\Z)', re.M | re.S)
+
+# The loader's own comment line just before its <script>
+LOADER_COMMENT_RE = re.compile(r'^[ \t]*<!-- Component Loader[^>]*-->[ \t]*\n\Z', re.M)
+
+LOADER_FUNCTION_RE = re.compile(r'^[ \t]*(?:async\s+)?function\s+loadComponent\s*\(', re.M)
+LOADER_LISTENER_RE = re.compile(
+    r'^[ \t]*document\.addEventListener\(\s*[\'"]DOMContentLoaded[\'"]\s*,'
+    r'\s*(?:\(\)\s*=>|function\s*\(\))\s*\{', re.M)
+
+JS_COMMENT_RE = re.compile(r'//[^\n]*|/\*.*?\*/', re.S)
+BLOCK_TAIL_RE = re.compile(r'\)?;?[ \t]*\n?')
+
+LUCIDE_SRC_RE = re.compile(r'<script[^>]+src="[^"]*lucide[^"]*"')
+
+
+def resolve_project_root() -> str:
+    """Resolve the project root (one level up from execution/)."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(script_dir)
+
+
+# ---------------------------------------------------------------------------
+# Components
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def read_component(placeholder: str, project_root: str) -> str:
+    """Component HTML for a placeholder id, read once per build."""
+    path, default = PLACEHOLDERS[placeholder]
+    return load_component(path, project_root, default)
+
+
+def component_for_path(path: str) -> str:
+    """Placeholder id of the component stored at `path`, or ""."""
+    for placeholder, (component_path, _) in PLACEHOLDERS.items():
+        if component_path == path:
+            return placeholder
+    return ""
+
+
+def render_component(placeholder: str, indent: str, project_root: str) -> str:
+    path = PLACEHOLDERS[placeholder][0]
+    body = "".join(f"{indent}{line}\n" if line.strip() else "\n"
+                   for line in read_component(placeholder, project_root).split("\n"))
+    return (f"{indent}<!-- component: {path} -->\n"
+            f"{body}"
+            f"{indent}<!-- /component: {path} -->")
+
+
+# ---------------------------------------------------------------------------
+# Runtime Loader Removal
+# ---------------------------------------------------------------------------
+
+def block_end(js: str, start: int) -> int:
+    """End of the {...} block opened at or after `start` (plus a closing ');'),
+    or len(js) when the block is never closed."""
+    depth = 0
+    for i in range(js.index("{", start), len(js)):
+        if js[i] == "{":
+            depth += 1
+        elif js[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return BLOCK_TAIL_RE.match(js, i + 1).end()
+    return len(js)
+
+
+def strip_loader(js: str) -> str:
+    """Remove the loadComponent() function and the listeners that call it."""
+    m = LOADER_FUNCTION_RE.search(js)
+    if m:
+        js = js[:m.start()] + js[block_end(js, m.end()):]
+    pos = 0
+    while True:
+        m = LOADER_LISTENER_RE.search(js, pos)
+        if not m:
+            return js
+        end = block_end(js, m.end() - 1)
+        if "loadComponent(" in js[m.end():end]:
+            js = js[:m.start()] + js[end:]
+            pos = m.start()
+        else:
+            pos = end
+
+
+def inline_components(html: str, project_root: str) -> str:
+    """The page with placeholders resolved and the runtime loader removed."""
+    html = INLINED_RE.sub(
+        lambda m: (render_component(component_for_path(m.group(2)), m.group(1), project_root)
+                   if component_for_path(m.group(2)) else m.group(0)), html)
+    html = PLACEHOLDER_RE.sub(
+        lambda m: render_component(m.group(2), m.group(1), project_root), html)
+
+    for m in SCRIPT_RE.finditer(html):
+        if not LOADER_FUNCTION_RE.search(m.group(2)):
+            continue
+        indent, closed = m.group(1), bool(m.group(3))
+        js = strip_loader(m.group(2))
+        before = html[:m.start()]
+        after = html[m.end():]
+
+        if JS_COMMENT_RE.sub("", js).strip():
+            script = f"{indent}<script>{js.rstrip()}\n{indent}</script>\n\n"
+        else:
+            script = ""
+            before = LOADER_COMMENT_RE.sub("", before)
+        if LUCIDE_SRC_RE.search(html) and "createIcons" not in before + js + after:
+            script += (f"{indent}<!-- Lucide Icons -->\n"
+                       f"{indent}<script>lucide.createIcons();</script>\n")
+        if not closed and "</html>" not in after:
+            after = "\n</body>\n</html>\n"
+        html = before + script + after
+        break
+
+    return html
+
+
+# ---------------------------------------------------------------------------
+# Pages
+# ---------------------------------------------------------------------------
+
+def find_pages(targets: list, project_root: str) -> list:
+    """HTML files for the targets, minus the components and snapshots."""
+    from validate_html import collect_targets
+    excluded = tuple(os.path.join(project_root, d) + os.sep for d in EXCLUDE_DIRS)
+    return [p for p in collect_targets(targets, project_root) if not p.startswith(excluded)]
+
+
+def build_page(path: str, project_root: str, write: bool = True) -> bool:
+    """Assemble one page in place. True if it changed (or would change)."""
+    with open(path, "r", encoding="utf-8") as f:
+        html = f.read()
+    new = inline_components(html, project_root)
+    if new == html:
+        return False
+    if write:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(new)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Inline the navbar and footer components into the Axiara pages.",
+        epilog="Example: python3 execution/build_components.py && "
+               "python3 execution/build_tailwind.py"
+    )
+    parser.add_argument(
+        "targets", nargs="*", default=["."],
+        help="HTML file(s), directories or glob patterns, relative to project "
+             "root (default: .)"
+    )
+    parser.add_argument(
+        "--check", action="store_true",
+        help="Only report pages that are out of date; exit 1 if any"
+    )
+    args = parser.parse_args()
+
+    project_root = resolve_project_root()
+    pages = find_pages(args.targets, project_root)
+    changed = [os.path.relpath(path, project_root)
+               for path in pages if build_page(path, project_root, write=not args.check)]
+
+    if args.check:
+        if changed:
+            print(f"[ERROR] {len(changed)} page(s) need execution/build_components.py:")
+            for rel in changed:
+                print(f"     {rel}")
+            sys.exit(1)
+        print(f"[OK] {len(pages)} page(s) up to date")
+        return
+
+    print(f"[OK] Assembled {len(changed)} of {len(pages)} page(s)")
+    for rel in changed:
+        print(f"     {rel}")
+
+
+if __name__ == "__main__":
+    main()
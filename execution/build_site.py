@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+build_site.py — Selective Page Rebuild (Layer 3 Execution)
+
+Rebuilds exactly the pages downstream of what changed, instead of
+re-running every build step over every page (or a hand-kept list of
+pages, as propagate_footer.py used to).
+
+The dependency graph comes from execution/site_deps.py and records what
+each page carries a copy of:
+  src/components/navbar.html   inlined (build_components markers or
+  src/components/footer.html   placeholder) or embedded copies
+  token:fonts-url              the Google Fonts URL from generate_page_shell.py
+  token:css-path               where the pages link axiara.css
+
+What changed is found by fingerprinting the components and tokens and
+comparing with the last build (.tmp/site_deps.json), or given as files /
+--since REF. Token changes are always found by fingerprint: a page
+depends on a token while it still carries the token's old value.
+
+Rebuilding a page:
+  - inlined components and placeholders: execution/build_components.py
+  - embedded footer copies: execution/propagate_footer.py
+  - token values: the old value is replaced by the current one
+    (absolute "/src/..." links stay absolute, relative ones stay relative)
+Embedded navbar copies cannot be refreshed safely (the page copy and the
+component differ in layout); they are listed so they can be swapped for
+<div id="navbar-placeholder"></div>.
+
+Usage:
+  python3 execution/build_site.py --dry-run     # show the invalidation set
+  python3 execution/build_site.py
+  python3 execution/build_site.py src/components/footer.html --dry-run
+  python3 execution/build_site.py --since origin/main
+  python3 execution/build_site.py --all
+
+No external dependencies beyond Python standard library.
+"""
+
+import argparse
+import os
+import posixpath
+import re
+
+from build_components import inline_components
+from propagate_footer import FOOTER_MARKER, FOOTER_SOURCE, replace_footer
+from site_deps import (EMBEDDED_COMPONENTS, BUILD_STATE, build_embed_index, changed_nodes,
+                       current_tokens, dependents, fingerprint, git_changed_files, link_path,
+                       load_build_state, previous_tokens, resolve_project_root,
+                       save_build_state)
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Snapshots and component test harnesses (src/test_*.html) that are not rebuilt
+EXCLUDE_PATHS = ("axiara-deploy-v1/", "src/test_")
+
+NAVBAR_SOURCE = EMBEDDED_COMPONENTS["axiara-navbar"]
+NAVBAR_MARKER = f"<!-- component: {NAVBAR_SOURCE} -->"
+
+LINK_HREF_RE = re.compile(r'(<link\b[^>]*?\bhref=")([^"]+)(")')
+
+
+# ---------------------------------------------------------------------------
+# Invalidation
+# ---------------------------------------------------------------------------
+
+def invalidation_set(index: dict, changed: list) -> dict:
+    """{page: [changed nodes it depends on]} for every page downstream of `changed`."""
+    plan = {}
+    for page in sorted(dependents(index, changed)):
+        if page.startswith(EXCLUDE_PATHS) or not page.lower().endswith(".html"):
+            continue
+        plan[page] = [node for node in changed if page in index.get(node, ())]
+    return plan
+
+
+# ---------------------------------------------------------------------------
+# Rebuild
+# ---------------------------------------------------------------------------
+
+def apply_tokens(html: str, page: str, old: dict, new: dict) -> str:
+    """Replace the old token values a page carries with the current ones."""
+    if old["token:fonts-url"] != new["token:fonts-url"]:
+        html = html.replace(f'href="{old["token:fonts-url"]}"', f'href="{new["token:fonts-url"]}"')
+
+    old_css, new_css = old["token:css-path"], new["token:css-path"]
+    if old_css != new_css:
+        def swap(m):
+            url = m.group(2)
+            if link_path(page, url) != old_css:
+                return m.group(0)
+            if url.startswith("/"):
+                url = "/" + new_css
+            else:
+                url = posixpath.relpath(new_css, posixpath.dirname(page) or ".")
+            return m.group(1) + url + m.group(3)
+        html = LINK_HREF_RE.sub(swap, html)
+    return html
+
+
+def rebuild_page(page: str, project_root: str, footer: str, old_tokens: dict) -> bool:
+    """Run the build steps on one page. True if it changed."""
+    path = os.path.join(project_root, page)
+    with open(path, "r", encoding="utf-8") as f:
+        html = f.read()
+
+    new = inline_components(html, project_root)
+    if footer and FOOTER_MARKER not in new:
+        new = replace_footer(new, footer) or new
+    new = apply_tokens(new, page, old_tokens, current_tokens())
+
+    if new == html:
+        return False
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(new)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the pages downstream of changed components and tokens.",
+        epilog="Example: python3 execution/build_site.py --dry-run"
+    )
+    parser.add_argument(
+        "files", nargs="*",
+        help="Changed files, relative to project root (default: everything "
+             f"that differs from the last build, {BUILD_STATE})"
+    )
+    parser.add_argument(
+        "--since", metavar="REF",
+        help="Use every file changed since this git ref"
+    )
+    parser.add_argument(
+        "--all", action="store_true",
+        help="Treat every component and token as changed"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Only print the invalidation set; change nothing"
+    )
+    args = parser.parse_args()
+
+    project_root = resolve_project_root()
+    previous = load_build_state(project_root)
+    current = fingerprint(project_root)
+
+    if args.all:
+        changed = list(current)
+    elif args.files or args.since:
+        changed = list(args.files)
+        if args.since:
+            changed += git_changed_files(args.since, project_root)
+        changed += [node for node in changed_nodes(previous, current)
+                    if node.startswith("token:")]
+    else:
+        changed = changed_nodes(previous, current)
+
+    old_tokens = previous_tokens(previous)
+    index = build_embed_index(project_root, tokens=old_tokens)
+    plan = invalidation_set(index, list(dict.fromkeys(changed)))
+
+    label = "[DRY RUN]" if args.dry_run else "[INFO]"
+    if not previous and not (args.files or args.since or args.all):
+        print(f"[INFO] No build state yet ({BUILD_STATE}); treating everything as changed")
+    print(f"{label} {len(changed)} changed → {len(plan)} page(s) to rebuild")
+    for node in dict.fromkeys(changed):
+        print(f"     changed: {node}")
+    for page, nodes in plan.items():
+        print(f"     {page}  ({', '.join(nodes)})")
+    if args.dry_run:
+        return
+
+    footer = ""
+    footer_path = os.path.join(project_root, FOOTER_SOURCE)
+    if os.path.isfile(footer_path):
+        with open(footer_path, "r", encoding="utf-8") as f:
+            footer = f.read().strip()
+
+    rebuilt = [page for page in plan
+               if rebuild_page(page, project_root, footer, old_tokens)]
+    save_build_state(project_root, current)
+
+    print(f"[OK] Rewrote {len(rebuilt)} page(s)")
+    for page in rebuilt:
+        print(f"     {page}")
+    for page, nodes in plan.items():
+        if NAVBAR_SOURCE not in nodes:
+            continue
+        with open(os.path.join(project_root, page), "r", encoding="utf-8") as f:
+            if NAVBAR_MARKER in f.read():
+                continue
+        print(f"  [WARN] {page} embeds its own copy of the navbar; replace it with "
+              f'<div id="navbar-placeholder"></div> to keep it in sync')
+    if rebuilt:
+        print("     Next: python3 execution/build_tailwind.py  (utilities for these pages)")
+
+
+if __name__ == "__main__":
+    main()
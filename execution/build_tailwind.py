@@ -0,0 +1,1611 @@
+#!/usr/bin/env python3
+"""
+build_tailwind.py — Offline Tailwind Build (Layer 3 Execution)
+
+Replaces the Tailwind Play CDN (https://cdn.tailwindcss.com) with one
+static stylesheet built ahead of time. The CDN ships a JIT compiler to
+every visitor and generates CSS in the browser on each page view; this
+script does that work once, at build time, for exactly the classes the
+site uses.
+
+How it works:
+  1. Scan every page for class usage: class="" attributes plus string
+     literals in inline scripts (classList.add('translate-y-0') etc.)
+  2. Resolve the theme: Tailwind v3 defaults + src/tailwind.config.js +
+     each page's inline `tailwind.config = {...}` (extra colors, keyframes)
+  3. Generate only the utilities in use — variants (hover:, md:,
+     group-hover:, selection:, ...), opacity modifiers (bg-white/5),
+     negative values and arbitrary values (w-[400px]) included — after
+     Tailwind's preflight reset
+  4. Write src/css/tailwind.css
+  5. With --strip, rewrite the pages: drop the CDN script and the inline
+     config, link the stylesheet at the end of <head> (where the CDN
+     injected its styles, so the cascade is unchanged)
+
+One stylesheet, many page configs:
+  Page configs are merged into the shared theme (src/tailwind.config.js
+  wins, then the first page to define a name). A page whose own config
+  gives a class different CSS — e.g. two pages with different
+  `pulse-glow` keyframes — keeps those few rules in a small
+  <style data-tailwind-build> block after the link. Stripped configs are
+  kept in src/tailwind.pages.json so later builds see the same theme.
+
+Classes that are not Tailwind utilities (.btn, .glass-card, ... from
+axiara.css) are ignored; --verbose lists them.
+
+Usage:
+  python3 execution/build_tailwind.py
+  python3 execution/build_tailwind.py --strip
+  python3 execution/build_tailwind.py services/ industries/ --verbose
+
+Output:
+  src/css/tailwind.css
+
+Source of truth:
+  - src/tailwind.config.js (theme)
+  - Tailwind CSS v3 core plugins and default theme
+
+No external dependencies beyond Python standard library.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from typing import NamedTuple
+
+from contrast import CONFIG_START_RE, flatten_theme, parse_color, parse_js_object
+from html_ir import load_ir
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+OUTPUT_CSS = "src/css/tailwind.css"
+TAILWIND_CONFIG = "src/tailwind.config.js"
+PAGE_CONFIGS = "src/tailwind.pages.json"   # Inline configs moved out by --strip
+
+# Frozen deployment snapshots: scanned by nobody, rewritten by nobody
+EXCLUDE_DIRS = ("axiara-deploy-v1",)
+
+CDN_SCRIPT_RE = re.compile(
+    r"[ \t]*(?:<!--[^>]*Tailwind[^>]*-->[ \t]*\n[ \t]*)?"
+    r"<script[^>]*\bsrc=[\"']https://cdn\.tailwindcss\.com[^\"']*[\"'][^>]*>\s*</script>[ \t]*\n?",
+    re.IGNORECASE)
+INLINE_CONFIG_RE = re.compile(
+    r"[ \t]*<script>\s*tailwind\.config\s*=.*?</script>[ \t]*\n?", re.DOTALL)
+BUILD_STYLE_RE = re.compile(
+    r"[ \t]*<style data-tailwind-build>.*?</style>[ \t]*\n?", re.DOTALL)
+HEAD_END_RE = re.compile(r"([ \t]*)</head>", re.IGNORECASE)
+
+JS_STRING_RE = re.compile(r"""(['"`])((?:\\.|(?!\1)[^\\\n])*)\1""")
+JS_TOKEN_SPLIT_RE = re.compile(r"""[\s"'`<>=]+""")   # Markup built in strings: '<div class="w-2">'
+
+
+
+def resolve_project_root() -> str:
+    """Resolve the project root (one level up from execution/)."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(script_dir)
+
+
+# ---------------------------------------------------------------------------
+# Default Theme (Tailwind CSS v3)
+# ---------------------------------------------------------------------------
+
+def _spacing() -> dict:
+    scale = {"0": "0px", "px": "1px"}
+    for step in (0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 5, 6, 7, 8, 9, 10, 11, 12, 14,
+                 16, 20, 24, 28, 32, 36, 40, 44, 48, 52, 56, 60, 64, 72, 80, 96):
+        scale[f"{step:g}"] = f"{step / 4:g}rem"
+    return scale
+
+
+def _tailwind_colors() -> dict:
+    from contrast import TAILWIND_COLORS
+    colors = dict(TAILWIND_COLORS)
+    colors.update({"inherit": "inherit", "current": "currentColor"})
+    return colors
+
+
+def _numbered(values, unit="", divide=1) -> dict:
+    return {str(v): f"{v / divide:g}{unit}" for v in values}
+
+
+DEFAULT_THEME = {
+    "screens": {"sm": "640px", "md": "768px", "lg": "1024px", "xl": "1280px", "2xl": "1536px"},
+    "colors": _tailwind_colors(),
+    "spacing": _spacing(),
+    "fontFamily": {
+        "sans": 'ui-sans-serif, system-ui, sans-serif, "Apple Color Emoji", "Segoe UI Emoji", "Segoe UI Symbol", "Noto Color Emoji"',
+        "serif": 'ui-serif, Georgia, Cambria, "Times New Roman", Times, serif',
+        "mono": 'ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace',
+    },
+    "fontSize": {
+        "xs": ("0.75rem", "1rem"), "sm": ("0.875rem", "1.25rem"), "base": ("1rem", "1.5rem"),
+        "lg": ("1.125rem", "1.75rem"), "xl": ("1.25rem", "1.75rem"), "2xl": ("1.5rem", "2rem"),
+        "3xl": ("1.875rem", "2.25rem"), "4xl": ("2.25rem", "2.5rem"), "5xl": ("3rem", "1"),
+        "6xl": ("3.75rem", "1"), "7xl": ("4.5rem", "1"), "8xl": ("6rem", "1"), "9xl": ("8rem", "1"),
+    },
+    "fontWeight": {"thin": "100", "extralight": "200", "light": "300", "normal": "400",
+                   "medium": "500", "semibold": "600", "bold": "700", "extrabold": "800",
+                   "black": "900"},
+    "letterSpacing": {"tighter": "-0.05em", "tight": "-0.025em", "normal": "0em",
+                      "wide": "0.025em", "wider": "0.05em", "widest": "0.1em"},
+    "lineHeight": {"none": "1", "tight": "1.25", "snug": "1.375", "normal": "1.5",
+                   "relaxed": "1.625", "loose": "2",
+                   **{str(n): f"{n / 4:g}rem" for n in range(3, 11)}},
+    "borderRadius": {"none": "0px", "sm": "0.125rem", "DEFAULT": "0.25rem", "md": "0.375rem",
+                     "lg": "0.5rem", "xl": "0.75rem", "2xl": "1rem", "3xl": "1.5rem",
+                     "full": "9999px"},
+    "borderWidth": {"DEFAULT": "1px", "0": "0px", "2": "2px", "4": "4px", "8": "8px"},
+    "maxWidth": {"0": "0rem", "none": "none", "xs": "20rem", "sm": "24rem", "md": "28rem",
+                 "lg": "32rem", "xl": "36rem", "2xl": "42rem", "3xl": "48rem", "4xl": "56rem",
+                 "5xl": "64rem", "6xl": "72rem", "7xl": "80rem", "full": "100%",
+                 "min": "min-content", "max": "max-content", "fit": "fit-content",
+                 "prose": "65ch", "screen-sm": "640px", "screen-md": "768px",
+                 "screen-lg": "1024px", "screen-xl": "1280px", "screen-2xl": "1536px"},
+    "opacity": _numbered(range(0, 101, 5), divide=100),
+    "zIndex": {**_numbered(range(0, 51, 10)), "auto": "auto"},
+    "order": {**_numbered(range(1, 13)), "first": "-9999", "last": "9999", "none": "0"},
+    "scale": _numbered((0, 50, 75, 90, 95, 100, 105, 110, 125, 150), divide=100),
+    "rotate": _numbered((0, 1, 2, 3, 6, 12, 45, 90, 180), unit="deg"),
+    "blur": {"none": "", "sm": "4px", "DEFAULT": "8px", "md": "12px", "lg": "16px",
+             "xl": "24px", "2xl": "40px", "3xl": "64px"},
+    "boxShadow": {
+        "sm": "0 1px 2px 0 rgb(0 0 0 / 0.05)",
+        "DEFAULT": "0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)",
+        "md": "0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
+        "lg": "0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
+        "xl": "0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)",
+        "2xl": "0 25px 50px -12px rgb(0 0 0 / 0.25)",
+        "inner": "inset 0 2px 4px 0 rgb(0 0 0 / 0.05)",
+        "none": "none",
+    },
+    "transitionDuration": {**_numbered((0, 75, 100, 150, 200, 300, 500, 700, 1000), unit="ms"),
+                           "DEFAULT": "150ms"},
+    "transitionDelay": _numbered((0, 75, 100, 150, 200, 300, 500, 700, 1000), unit="ms"),
+    "transitionTimingFunction": {"DEFAULT": "cubic-bezier(0.4, 0, 0.2, 1)", "linear": "linear",
+                                 "in": "cubic-bezier(0.4, 0, 1, 1)",
+                                 "out": "cubic-bezier(0, 0, 0.2, 1)",
+                                 "in-out": "cubic-bezier(0.4, 0, 0.2, 1)"},
+    "backgroundImage": {"none": "none"},
+    "backgroundSize": {"auto": "auto", "cover": "cover", "contain": "contain"},
+    "aspectRatio": {"auto": "auto", "square": "1 / 1", "video": "16 / 9"},
+    "animation": {"none": "none", "spin": "spin 1s linear infinite",
+                  "ping": "ping 1s cubic-bezier(0, 0, 0.2, 1) infinite",
+                  "pulse": "pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite",
+                  "bounce": "bounce 1s infinite"},
+    "keyframes": {
+        "spin": {"to": {"transform": "rotate(360deg)"}},
+        "ping": {"75%, 100%": {"transform": "scale(2)", "opacity": "0"}},
+        "pulse": {"50%": {"opacity": ".5"}},
+        "bounce": {"0%, 100%": {"transform": "translateY(-25%)",
+                                "animationTimingFunction": "cubic-bezier(0.8,0,1,1)"},
+                   "50%": {"transform": "none",
+                           "animationTimingFunction": "cubic-bezier(0,0,0.2,1)"}},
+    },
+}
+
+# Theme sections whose nested keys flatten to dashed names (axiara.crimson → axiara-crimson)
+FLAT_SECTIONS = ("colors", "backgroundImage")
+
+SIZE_KEYWORDS = {"auto": "auto", "full": "100%", "min": "min-content",
+                 "max": "max-content", "fit": "fit-content"}
+
+TRANSFORM = ("translate(var(--tw-translate-x), var(--tw-translate-y)) rotate(var(--tw-rotate)) "
+             "skewX(var(--tw-skew-x)) skewY(var(--tw-skew-y)) "
+             "scaleX(var(--tw-scale-x)) scaleY(var(--tw-scale-y))")
+FILTER = ("var(--tw-blur) var(--tw-brightness) var(--tw-contrast) var(--tw-grayscale) "
+          "var(--tw-hue-rotate) var(--tw-invert) var(--tw-saturate) var(--tw-sepia) "
+          "var(--tw-drop-shadow)")
+BACKDROP_FILTER = ("var(--tw-backdrop-blur) var(--tw-backdrop-brightness) "
+                   "var(--tw-backdrop-contrast) var(--tw-backdrop-grayscale) "
+                   "var(--tw-backdrop-hue-rotate) var(--tw-backdrop-invert) "
+                   "var(--tw-backdrop-opacity) var(--tw-backdrop-saturate) "
+                   "var(--tw-backdrop-sepia)")
+SHADOW = "var(--tw-ring-offset-shadow, 0 0 #0000), var(--tw-ring-shadow, 0 0 #0000), var(--tw-shadow)"
+EASE = "cubic-bezier(0.4, 0, 0.2, 1)"
+TRANSITION_PROPERTIES = {
+    "DEFAULT": "color, background-color, border-color, text-decoration-color, fill, stroke, "
+               "opacity, box-shadow, transform, filter, backdrop-filter",
+    "all": "all",
+    "colors": "color, background-color, border-color, text-decoration-color, fill, stroke",
+    "opacity": "opacity",
+    "shadow": "box-shadow",
+    "transform": "transform",
+    "none": "none",
+}
+
+# Between-children selector for space-* and divide-*
+BETWEEN = " > :not([hidden]) ~ :not([hidden])"
+
+SIDES = {"t": ("top",), "r": ("right",), "b": ("bottom",), "l": ("left",),
+         "x": ("left", "right"), "y": ("top", "bottom")}
+
+
+# ---------------------------------------------------------------------------
+# Base Layer — Tailwind preflight and --tw-* defaults
+# ---------------------------------------------------------------------------
+
+TW_DEFAULTS = """\
+  --tw-border-spacing-x: 0;
+  --tw-border-spacing-y: 0;
+  --tw-translate-x: 0;
+  --tw-translate-y: 0;
+  --tw-rotate: 0;
+  --tw-skew-x: 0;
+  --tw-skew-y: 0;
+  --tw-scale-x: 1;
+  --tw-scale-y: 1;
+  --tw-pan-x:  ;
+  --tw-pan-y:  ;
+  --tw-pinch-zoom:  ;
+  --tw-scroll-snap-strictness: proximity;
+  --tw-gradient-from-position:  ;
+  --tw-gradient-via-position:  ;
+  --tw-gradient-to-position:  ;
+  --tw-ordinal:  ;
+  --tw-slashed-zero:  ;
+  --tw-numeric-figure:  ;
+  --tw-numeric-spacing:  ;
+  --tw-numeric-fraction:  ;
+  --tw-ring-inset:  ;
+  --tw-ring-offset-width: 0px;
+  --tw-ring-offset-color: #fff;
+  --tw-ring-color: rgb(59 130 246 / 0.5);
+  --tw-ring-offset-shadow: 0 0 #0000;
+  --tw-ring-shadow: 0 0 #0000;
+  --tw-shadow: 0 0 #0000;
+  --tw-shadow-colored: 0 0 #0000;
+  --tw-blur:  ;
+  --tw-brightness:  ;
+  --tw-contrast:  ;
+  --tw-grayscale:  ;
+  --tw-hue-rotate:  ;
+  --tw-invert:  ;
+  --tw-saturate:  ;
+  --tw-sepia:  ;
+  --tw-drop-shadow:  ;
+  --tw-backdrop-blur:  ;
+  --tw-backdrop-brightness:  ;
+  --tw-backdrop-contrast:  ;
+  --tw-backdrop-grayscale:  ;
+  --tw-backdrop-hue-rotate:  ;
+  --tw-backdrop-invert:  ;
+  --tw-backdrop-opacity:  ;
+  --tw-backdrop-saturate:  ;
+  --tw-backdrop-sepia:  ;
+"""
+
+PREFLIGHT = """\
+*, ::before, ::after { box-sizing: border-box; border-width: 0; border-style: solid; border-color: #e5e7eb; }
+::before, ::after { --tw-content: ''; }
+html, :host { line-height: 1.5; -webkit-text-size-adjust: 100%; -moz-tab-size: 4; tab-size: 4; font-family: {sans}; font-feature-settings: normal; font-variation-settings: normal; -webkit-tap-highlight-color: transparent; }
+body { margin: 0; line-height: inherit; }
+hr { height: 0; color: inherit; border-top-width: 1px; }
+abbr:where([title]) { text-decoration: underline dotted; }
+h1, h2, h3, h4, h5, h6 { font-size: inherit; font-weight: inherit; }
+a { color: inherit; text-decoration: inherit; }
+b, strong { font-weight: bolder; }
+code, kbd, samp, pre { font-family: {mono}; font-feature-settings: normal; font-variation-settings: normal; font-size: 1em; }
+small { font-size: 80%; }
+sub, sup { font-size: 75%; line-height: 0; position: relative; vertical-align: baseline; }
+sub { bottom: -0.25em; }
+sup { top: -0.5em; }
+table { text-indent: 0; border-color: inherit; border-collapse: collapse; }
+button, input, optgroup, select, textarea { font-family: inherit; font-feature-settings: inherit; font-variation-settings: inherit; font-size: 100%; font-weight: inherit; line-height: inherit; letter-spacing: inherit; color: inherit; margin: 0; padding: 0; }
+button, select { text-transform: none; }
+button, input:where([type='button']), input:where([type='reset']), input:where([type='submit']) { -webkit-appearance: button; background-color: transparent; background-image: none; }
+:-moz-focusring { outline: auto; }
+:-moz-ui-invalid { box-shadow: none; }
+progress { vertical-align: baseline; }
+::-webkit-inner-spin-button, ::-webkit-outer-spin-button { height: auto; }
+[type='search'] { -webkit-appearance: textfield; outline-offset: -2px; }
+::-webkit-search-decoration { -webkit-appearance: none; }
+::-webkit-file-upload-button { -webkit-appearance: button; font: inherit; }
+summary { display: list-item; }
+blockquote, dl, dd, h1, h2, h3, h4, h5, h6, hr, figure, p, pre { margin: 0; }
+fieldset { margin: 0; padding: 0; }
+legend { padding: 0; }
+ol, ul, menu { list-style: none; margin: 0; padding: 0; }
+dialog { padding: 0; }
+textarea { resize: vertical; }
+input::placeholder, textarea::placeholder { opacity: 1; color: #9ca3af; }
+button, [role="button"] { cursor: pointer; }
+:disabled { cursor: default; }
+img, svg, video, canvas, audio, iframe, embed, object { display: block; vertical-align: middle; }
+img, video { max-width: 100%; height: auto; }
+[hidden]:where(:not([hidden="until-found"])) { display: none; }
+"""
+
+
+def base_layer(theme) -> str:
+    fonts = theme.sections["fontFamily"]
+    preflight = (PREFLIGHT.replace("{sans}", font_family(fonts.get("sans", "sans-serif")))
+                 .replace("{mono}", font_family(fonts.get("mono", "monospace"))))
+    return (f"*, ::before, ::after {{\n{TW_DEFAULTS}}}\n\n"
+            f"::backdrop {{\n{TW_DEFAULTS}}}\n\n" + preflight)
+
+
+# ---------------------------------------------------------------------------
+# Theme
+# ---------------------------------------------------------------------------
+
+def read_config(text: str) -> dict:
+    """The config object from a tailwind.config.js or inline config script."""
+    m = CONFIG_START_RE.search(text)
+    return parse_js_object(text, m.end() - 1) if m else {}
+
+
+def theme_layers(config: dict) -> list:
+    """(replace, {section: values}) layers a config applies to the theme."""
+    theme = config.get("theme") or {}
+    replaced = {k: v for k, v in theme.items() if k != "extend" and isinstance(v, dict)}
+    extended = {k: v for k, v in (theme.get("extend") or {}).items() if isinstance(v, dict)}
+    return [(True, replaced), (False, extended)]
+
+
+def _section_values(section: str, values: dict) -> dict:
+    return flatten_theme(values) if section in FLAT_SECTIONS else dict(values)
+
+
+class Theme:
+    """A resolved Tailwind theme and its compiled-utility memo.
+
+    Args:
+        configs: Parsed config objects, applied in order over the defaults
+        shared: Merge mode for the site-wide theme — later configs only add
+                names nobody defined yet (first definition wins)
+    """
+
+    def __init__(self, configs: list, shared: bool = False):
+        self.sections = {k: dict(v) for k, v in DEFAULT_THEME.items()}
+        for i, config in enumerate(configs):
+            for replace, layer in theme_layers(config):
+                for section, values in layer.items():
+                    values = _section_values(section, values)
+                    current = self.sections.setdefault(section, {})
+                    if shared and i > 0:
+                        for key, value in values.items():
+                            current.setdefault(key, value)
+                    elif replace:
+                        self.sections[section] = values
+                    else:
+                        current.update(values)
+        self._memo = {}
+
+    def get(self, section: str, key: str):
+        return self.sections.get(section, {}).get(key)
+
+    def compile(self, candidate: str):
+        """The Rule for a class name, or None if it is not a utility."""
+        if candidate not in self._memo:
+            self._memo[candidate] = compile_candidate(self, candidate)
+        return self._memo[candidate]
+
+
+# ---------------------------------------------------------------------------
+# Values
+# ---------------------------------------------------------------------------
+
+LENGTH_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:px|rem|em|%|vh|vw|svh|lvh|dvh|ch|ex|vmin|vmax|pt)?"
+                       r"|(?:calc|min|max|clamp|var)\(.*\)")
+FRACTION_RE = re.compile(r"(\d+)/(\d+)")
+
+
+def arbitrary(key: str):
+    """'[400px]' → '400px'; underscores become spaces outside url()."""
+    if not (key.startswith("[") and key.endswith("]")) or len(key) < 3:
+        return None
+    inner = key[1:-1]
+    parts = re.split(r"(url\([^)]*\))", inner)
+    return "".join(p if p.startswith("url(") else p.replace("_", " ") for p in parts)
+
+
+def is_length(value: str) -> bool:
+    return bool(LENGTH_RE.fullmatch(value))
+
+
+def is_color(value: str) -> bool:
+    return (value.startswith("#") or value.startswith(("rgb", "hsl"))
+            or value in ("transparent", "currentColor"))
+
+
+def fraction(key: str):
+    m = FRACTION_RE.fullmatch(key)
+    if not m or int(m.group(2)) == 0:
+        return None
+    percent = ("%f" % (int(m.group(1)) / int(m.group(2)) * 100)).rstrip("0").rstrip(".")
+    return f"{percent}%"
+
+
+def negate(value: str) -> str:
+    if re.fullmatch(r"0(?:\.0+)?[a-z%]*", value):
+        return value
+    if re.match(r"[\d.]", value):
+        return "-" + value
+    return f"calc({value} * -1)"
+
+
+def font_family(value) -> str:
+    if isinstance(value, list):
+        value = value[0] if value and isinstance(value[0], list) else value
+        return ", ".join(v for v in value if isinstance(v, str))
+    return value
+
+
+def split_modifier(key: str, theme: Theme):
+    """'axiara-white/10' → ('axiara-white', '0.1'); no modifier → (key, None)."""
+    base, sep, modifier = key.rpartition("/")
+    if not sep or not base:
+        return key, None
+    if modifier in theme.sections["opacity"]:
+        return base, theme.sections["opacity"][modifier]
+    value = arbitrary(modifier)
+    return (base, value) if value else (key, None)
+
+
+def color_value(theme: Theme, key: str):
+    """(css_color, opacity_modifier) for a color key, or (None, None)."""
+    key, modifier = split_modifier(key, theme)
+    value = theme.get("colors", key)
+    if value is None:
+        value = arbitrary(key)
+        if value is None or not is_color(value):
+            return None, None
+    if not isinstance(value, str):
+        return None, None
+    return value, modifier
+
+
+def rgb_channels(value: str):
+    color = parse_color(value)
+    if color is None or value in ("transparent",):
+        return None, None
+    r, g, b, a = color
+    return f"{round(r)} {round(g)} {round(b)}", a
+
+
+def color_decls(theme: Theme, key: str, prop, opacity_var: str = None):
+    """Declarations painting `prop` (a name or tuple) with a theme color."""
+    value, modifier = color_value(theme, key)
+    if value is None:
+        return None
+    props = prop if isinstance(prop, tuple) else (prop,)
+    channels, alpha = rgb_channels(value)
+    if channels is not None and modifier is not None:
+        return tuple((p, f"rgb({channels} / {modifier})") for p in props)
+    if channels is not None and alpha == 1.0 and opacity_var:
+        return ((opacity_var, "1"),) + tuple(
+            (p, f"rgb({channels} / var({opacity_var}))") for p in props)
+    return tuple((p, value) for p in props)
+
+
+def plain_color(theme: Theme, key: str):
+    """A color as one CSS value (modifier applied), for gradients and shadows."""
+    value, modifier = color_value(theme, key)
+    if value is None:
+        return None
+    channels, _ = rgb_channels(value)
+    if channels is not None and modifier is not None:
+        return f"rgb({channels} / {modifier})"
+    return value
+
+
+def transparent_of(value: str) -> str:
+    channels, _ = rgb_channels(value)
+    return f"rgb({channels or '255 255 255'} / 0)"
+
+
+def spacing(theme: Theme, key: str, extra: dict = None, fractions: bool = False):
+    if extra and key in extra:
+        return extra[key]
+    value = theme.get("spacing", key)
+    if value is None and fractions:
+        value = fraction(key)
+    if value is None:
+        value = arbitrary(key)
+    return value
+
+
+def themed(theme: Theme, section: str, key: str, default_key: str = "DEFAULT"):
+    value = theme.get(section, key if key else default_key)
+    if value is None and key:
+        value = arbitrary(key)
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Utility Plugins — in Tailwind's core plugin order (sets cascade order)
+# ---------------------------------------------------------------------------
+
+class Match(NamedTuple):
+    decls: tuple
+    sub: int = 0            # Order within the plugin (p before px before pl)
+    child: str = ""         # Appended to the class selector (space-*, divide-*)
+    keyframes: tuple = ()   # Keyframe names the rule needs
+
+
+PLUGINS = []   # (name, fn) — fn(theme, name, negative) → Match | None
+
+
+def plugin(fn):
+    PLUGINS.append((fn.__name__, fn))
+    return fn
+
+
+def static_plugin(name: str, table: dict):
+    """Register a plugin of fixed class → declarations."""
+    parsed = {cls: tuple(tuple(part.strip() for part in decl.split(":", 1))
+                         for decl in decls.split(";") if decl.strip())
+              for cls, decls in table.items()}
+
+    def fn(theme, util, negative):
+        if negative or util not in parsed:
+            return None
+        return Match(parsed[util])
+    fn.__name__ = name
+    PLUGINS.append((name, fn))
+
+
+def prefixed(util: str, prefixes):
+    """('px', '4') for 'px-4' given prefixes ('p', 'px', ...); longest first."""
+    for prefix in sorted(prefixes, key=len, reverse=True):
+        if util.startswith(prefix + "-"):
+            return prefix, util[len(prefix) + 1:]
+        if util == prefix:
+            return prefix, ""
+    return None, None
+
+
+static_plugin("accessibility", {
+    "sr-only": "position: absolute; width: 1px; height: 1px; padding: 0; margin: -1px; "
+               "overflow: hidden; clip: rect(0, 0, 0, 0); white-space: nowrap; border-width: 0",
+    "not-sr-only": "position: static; width: auto; height: auto; padding: 0; margin: 0; "
+                   "overflow: visible; clip: auto; white-space: normal",
+})
+static_plugin("pointerEvents", {"pointer-events-none": "pointer-events: none",
+                                "pointer-events-auto": "pointer-events: auto"})
+static_plugin("visibility", {"visible": "visibility: visible", "invisible": "visibility: hidden",
+                             "collapse": "visibility: collapse"})
+static_plugin("position", {p: f"position: {p}" for p in
+                           ("static", "fixed", "absolute", "relative", "sticky")})
+
+
+@plugin
+def inset(theme, util, negative):
+    order = ("inset", "inset-x", "inset-y", "top", "right", "bottom", "left")
+    prefix, key = prefixed(util, order)
+    if not key:
+        return None
+    value = spacing(theme, key, {"auto": "auto", "full": "100%"}, fractions=True)
+    if value is None:
+        return None
+    value = negate(value) if negative else value
+    props = {"inset": ("inset",), "inset-x": ("left", "right"), "inset-y": ("top", "bottom")}
+    return Match(tuple((p, value) for p in props.get(prefix, (prefix,))), order.index(prefix))
+
+
+static_plugin("isolation", {"isolate": "isolation: isolate", "isolation-auto": "isolation: auto"})
+
+
+@plugin
+def zIndex(theme, util, negative):
+    prefix, key = prefixed(util, ("z",))
+    value = key and themed(theme, "zIndex", key)
+    if not value:
+        return None
+    return Match((("z-index", negate(value) if negative else value),))
+
+
+@plugin
+def order(theme, util, negative):
+    prefix, key = prefixed(util, ("order",))
+    value = key and themed(theme, "order", key)
+    if not value:
+        return None
+    return Match((("order", negate(value) if negative else value),))
+
+
+@plugin
+def gridColumn(theme, util, negative):
+    prefix, key = prefixed(util, ("col",))
+    if negative or not key:
+        return None
+    if key == "auto":
+        return Match((("grid-column", "auto"),))
+    if key == "span-full":
+        return Match((("grid-column", "1 / -1"),))
+    m = re.fullmatch(r"span-(\d+)", key)
+    if m:
+        n = m.group(1)
+        return Match((("grid-column", f"span {n} / span {n}"),))
+    m = re.fullmatch(r"(start|end)-(\d+|auto)", key)
+    if m:
+        return Match(((f"grid-column-{m.group(1)}", m.group(2)),), 1 if m.group(1) == "start" else 2)
+    return None
+
+
+@plugin
+def gridRow(theme, util, negative):
+    prefix, key = prefixed(util, ("row",))
+    if negative or not key:
+        return None
+    if key == "span-full":
+        return Match((("grid-row", "1 / -1"),))
+    m = re.fullmatch(r"span-(\d+)", key)
+    if m:
+        n = m.group(1)
+        return Match((("grid-row", f"span {n} / span {n}"),))
+    m = re.fullmatch(r"(start|end)-(\d+|auto)", key)
+    if m:
+        return Match(((f"grid-row-{m.group(1)}", m.group(2)),), 1 if m.group(1) == "start" else 2)
+    return None
+
+
+@plugin
+def margin(theme, util, negative):
+    order = ("m", "mx", "my", "ms", "me", "mt", "mr", "mb", "ml")
+    prefix, key = prefixed(util, order)
+    if not key:
+        return None
+    value = spacing(theme, key, {"auto": "auto"})
+    if value is None:
+        return None
+    value = negate(value) if negative else value
+    side = prefix[1:]
+    props = ("margin",) if not side else tuple(f"margin-{s}" for s in SIDES.get(side, ()))
+    if side in ("s", "e"):
+        props = ("margin-inline-start",) if side == "s" else ("margin-inline-end",)
+    return Match(tuple((p, value) for p in props), order.index(prefix))
+
+
+static_plugin("boxSizing", {"box-border": "box-sizing: border-box",
+                            "box-content": "box-sizing: content-box"})
+static_plugin("display", {
+    **{d: f"display: {d}" for d in ("block", "inline-block", "inline", "flex", "inline-flex",
+                                    "table", "inline-table", "table-row", "table-cell",
+                                    "flow-root", "grid", "inline-grid", "contents",
+                                    "list-item")},
+    "hidden": "display: none",
+})
+
+
+@plugin
+def aspectRatio(theme, util, negative):
+    prefix, key = prefixed(util, ("aspect",))
+    value = key and themed(theme, "aspectRatio", key)
+    if negative or not value:
+        return None
+    return Match((("aspect-ratio", value.replace("/", " / ") if "/" in value and " " not in value else value),))
+
+
+def _size(theme, util, negative, prefix_name, prop, extra):
+    prefix, key = prefixed(util, (prefix_name,))
+    if negative or not key:
+        return None
+    value = spacing(theme, key, extra, fractions=True)
+    return Match(((prop, value),)) if value is not None else None
+
+
+@plugin
+def height(theme, util, negative):
+    return _size(theme, util, negative, "h", "height",
+                 {**SIZE_KEYWORDS, "screen": "100vh", "svh": "100svh", "lvh": "100lvh",
+                  "dvh": "100dvh"})
+
+
+@plugin
+def maxHeight(theme, util, negative):
+    return _size(theme, util, negative, "max-h", "max-height",
+                 {"none": "none", "full": "100%", "screen": "100vh", "min": "min-content",
+                  "max": "max-content", "fit": "fit-content"})
+
+
+@plugin
+def minHeight(theme, util, negative):
+    return _size(theme, util, negative, "min-h", "min-height",
+                 {"full": "100%", "screen": "100vh", "svh": "100svh", "dvh": "100dvh",
+                  "min": "min-content", "max": "max-content", "fit": "fit-content"})
+
+
+@plugin
+def width(theme, util, negative):
+    return _size(theme, util, negative, "w", "width",
+                 {**SIZE_KEYWORDS, "screen": "100vw", "svw": "100svw", "dvw": "100dvw"})
+
+
+@plugin
+def minWidth(theme, util, negative):
+    return _size(theme, util, negative, "min-w", "min-width",
+                 {"full": "100%", "min": "min-content", "max": "max-content",
+                  "fit": "fit-content"})
+
+
+@plugin
+def maxWidth(theme, util, negative):
+    prefix, key = prefixed(util, ("max-w",))
+    value = key and themed(theme, "maxWidth", key)
+    if negative or not value:
+        return None
+    return Match((("max-width", value),))
+
+
+static_plugin("flex", {"flex-1": "flex: 1 1 0%", "flex-auto": "flex: 1 1 auto",
+                       "flex-initial": "flex: 0 1 auto", "flex-none": "flex: none"})
+static_plugin("flexShrink", {"flex-shrink": "flex-shrink: 1", "flex-shrink-0": "flex-shrink: 0",
+                             "shrink": "flex-shrink: 1", "shrink-0": "flex-shrink: 0"})
+static_plugin("flexGrow", {"flex-grow": "flex-grow: 1", "flex-grow-0": "flex-grow: 0",
+                           "grow": "flex-grow: 1", "grow-0": "flex-grow: 0"})
+static_plugin("borderCollapse", {"border-collapse": "border-collapse: collapse",
+                                 "border-separate": "border-collapse: separate"})
+static_plugin("transformOrigin", {f"origin-{k}": f"transform-origin: {v}" for k, v in {
+    "center": "center", "top": "top", "top-right": "top right", "right": "right",
+    "bottom-right": "bottom right", "bottom": "bottom", "bottom-left": "bottom left",
+    "left": "left", "top-left": "top left"}.items()})
+
+
+@plugin
+def translate(theme, util, negative):
+    prefix, key = prefixed(util, ("translate-x", "translate-y"))
+    if not key:
+        return None
+    value = spacing(theme, key, {"full": "100%"}, fractions=True)
+    if value is None:
+        return None
+    axis = prefix[-1]
+    return Match(((f"--tw-translate-{axis}", negate(value) if negative else value),
+                  ("transform", TRANSFORM)), 0 if axis == "x" else 1)
+
+
+@plugin
+def rotate(theme, util, negative):
+    prefix, key = prefixed(util, ("rotate",))
+    value = key and themed(theme, "rotate", key)
+    if not value:
+        return None
+    return Match((("--tw-rotate", negate(value) if negative else value), ("transform", TRANSFORM)))
+
+
+@plugin
+def scale(theme, util, negative):
+    prefix, key = prefixed(util, ("scale", "scale-x", "scale-y"))
+    value = key and themed(theme, "scale", key)
+    if not value:
+        return None
+    value = negate(value) if negative else value
+    axes = {"scale": "xy", "scale-x": "x", "scale-y": "y"}[prefix]
+    return Match(tuple((f"--tw-scale-{a}", value) for a in axes) + (("transform", TRANSFORM),),
+                 ("scale", "scale-x", "scale-y").index(prefix))
+
+
+static_plugin("transform", {"transform": f"transform: {TRANSFORM}",
+                            "transform-cpu": f"transform: {TRANSFORM}",
+                            "transform-none": "transform: none"})
+
+
+@plugin
+def animation(theme, util, negative):
+    prefix, key = prefixed(util, ("animate",))
+    value = key and themed(theme, "animation", key)
+    if negative or not value:
+        return None
+    name = value.split()[0]
+    keyframes = (name,) if name in theme.sections.get("keyframes", {}) else ()
+    return Match((("animation", value),), keyframes=keyframes)
+
+
+static_plugin("cursor", {f"cursor-{c}": f"cursor: {c}" for c in (
+    "auto", "default", "pointer", "wait", "text", "move", "help", "not-allowed", "none",
+    "grab", "grabbing")})
+static_plugin("userSelect", {f"select-{v}": f"user-select: {v}" for v in ("none", "text", "all", "auto")})
+static_plugin("resize", {"resize-none": "resize: none", "resize-y": "resize: vertical",
+                         "resize-x": "resize: horizontal", "resize": "resize: both"})
+static_plugin("listStylePosition", {"list-inside": "list-style-position: inside",
+                                    "list-outside": "list-style-position: outside"})
+static_plugin("listStyleType", {"list-none": "list-style-type: none",
+                                "list-disc": "list-style-type: disc",
+                                "list-decimal": "list-style-type: decimal"})
+
+
+@plugin
+def gridTemplateColumns(theme, util, negative):
+    prefix, key = prefixed(util, ("grid-cols",))
+    if negative or not key:
+        return None
+    value = f"repeat({key}, minmax(0, 1fr))" if key.isdigit() else (
+        "none" if key == "none" else arbitrary(key))
+    return Match((("grid-template-columns", value),)) if value else None
+
+
+@plugin
+def gridTemplateRows(theme, util, negative):
+    prefix, key = prefixed(util, ("grid-rows",))
+    if negative or not key:
+        return None
+    value = f"repeat({key}, minmax(0, 1fr))" if key.isdigit() else (
+        "none" if key == "none" else arbitrary(key))
+    return Match((("grid-template-rows", value),)) if value else None
+
+
+static_plugin("flexDirection", {"flex-row": "flex-direction: row",
+                                "flex-row-reverse": "flex-direction: row-reverse",
+                                "flex-col": "flex-direction: column",
+                                "flex-col-reverse": "flex-direction: column-reverse"})
+static_plugin("flexWrap", {"flex-wrap": "flex-wrap: wrap", "flex-wrap-reverse": "flex-wrap: wrap-reverse",
+                           "flex-nowrap": "flex-wrap: nowrap"})
+static_plugin("alignItems", {f"items-{k}": f"align-items: {v}" for k, v in {
+    "start": "flex-start", "end": "flex-end", "center": "center", "baseline": "baseline",
+    "stretch": "stretch"}.items()})
+static_plugin("justifyContent", {f"justify-{k}": f"justify-content: {v}" for k, v in {
+    "normal": "normal", "start": "flex-start", "end": "flex-end", "center": "center",
+    "between": "space-between", "around": "space-around", "evenly": "space-evenly",
+    "stretch": "stretch"}.items()})
+
+
+@plugin
+def gap(theme, util, negative):
+    order = ("gap", "gap-x", "gap-y")
+    prefix, key = prefixed(util, order)
+    value = key and spacing(theme, key)
+    if negative or not value:
+        return None
+    prop = {"gap": "gap", "gap-x": "column-gap", "gap-y": "row-gap"}[prefix]
+    return Match(((prop, value),), order.index(prefix))
+
+
+@plugin
+def space(theme, util, negative):
+    prefix, key = prefixed(util, ("space-x", "space-y"))
+    value = key and spacing(theme, key)
+    if not value:
+        return None
+    value = negate(value) if negative else value
+    if prefix == "space-x":
+        return Match((("--tw-space-x-reverse", "0"),
+                      ("margin-right", f"calc({value} * var(--tw-space-x-reverse))"),
+                      ("margin-left", f"calc({value} * calc(1 - var(--tw-space-x-reverse)))")),
+                     0, BETWEEN)
+    return Match((("--tw-space-y-reverse", "0"),
+                  ("margin-top", f"calc({value} * calc(1 - var(--tw-space-y-reverse)))"),
+                  ("margin-bottom", f"calc({value} * var(--tw-space-y-reverse))")),
+                 1, BETWEEN)
+
+
+@plugin
+def divideWidth(theme, util, negative):
+    prefix, key = prefixed(util, ("divide-x", "divide-y"))
+    if negative or prefix is None:
+        return None
+    value = themed(theme, "borderWidth", key)
+    if value is None:
+        return None
+    if prefix == "divide-x":
+        return Match((("--tw-divide-x-reverse", "0"),
+                      ("border-right-width", f"calc({value} * var(--tw-divide-x-reverse))"),
+                      ("border-left-width", f"calc({value} * calc(1 - var(--tw-divide-x-reverse)))")),
+                     0, BETWEEN)
+    return Match((("--tw-divide-y-reverse", "0"),
+                  ("border-top-width", f"calc({value} * calc(1 - var(--tw-divide-y-reverse)))"),
+                  ("border-bottom-width", f"calc({value} * var(--tw-divide-y-reverse))")),
+                 1, BETWEEN)
+
+
+@plugin
+def divideColor(theme, util, negative):
+    prefix, key = prefixed(util, ("divide",))
+    decls = key and not negative and color_decls(theme, key, "border-color", "--tw-divide-opacity")
+    return Match(decls, 0, BETWEEN) if decls else None
+
+
+static_plugin("alignSelf", {f"self-{k}": f"align-self: {v}" for k, v in {
+    "auto": "auto", "start": "flex-start", "end": "flex-end", "center": "center",
+    "stretch": "stretch", "baseline": "baseline"}.items()})
+static_plugin("overflow", {f"overflow{axis}-{v}": f"overflow{axis}: {v}"
+                           for axis in ("", "-x", "-y")
+                           for v in ("auto", "hidden", "clip", "visible", "scroll")})
+static_plugin("textOverflow", {"truncate": "overflow: hidden; text-overflow: ellipsis; white-space: nowrap",
+                               "text-ellipsis": "text-overflow: ellipsis",
+                               "text-clip": "text-overflow: clip"})
+static_plugin("whitespace", {f"whitespace-{v}": f"white-space: {v}" for v in (
+    "normal", "nowrap", "pre", "pre-line", "pre-wrap", "break-spaces")})
+
+
+@plugin
+def borderRadius(theme, util, negative):
+    corners = {"": ("border-radius",),
+               "t": ("border-top-left-radius", "border-top-right-radius"),
+               "r": ("border-top-right-radius", "border-bottom-right-radius"),
+               "b": ("border-bottom-right-radius", "border-bottom-left-radius"),
+               "l": ("border-top-left-radius", "border-bottom-left-radius"),
+               "tl": ("border-top-left-radius",), "tr": ("border-top-right-radius",),
+               "br": ("border-bottom-right-radius",), "bl": ("border-bottom-left-radius",)}
+    m = re.fullmatch(r"rounded(?:-(t|r|b|l|tl|tr|br|bl))?(?:-(.+))?", util)
+    if negative or not m:
+        return None
+    side, key = m.group(1) or "", m.group(2) or ""
+    if side == "" and key in corners:   # rounded-t → side, not a size
+        side, key = key, ""
+    value = themed(theme, "borderRadius", key)
+    if value is None:
+        return None
+    return Match(tuple((p, value) for p in corners[side]), list(corners).index(side))
+
+
+@plugin
+def borderWidth(theme, util, negative):
+    m = re.fullmatch(r"border(?:-([xytrbl]))?(?:-(.+))?", util)
+    if negative or not m:
+        return None
+    side, key = m.group(1), m.group(2) or ""
+    value = theme.get("borderWidth", key or "DEFAULT")
+    if value is None:
+        value = arbitrary(key)
+        if value is None or not is_length(value):
+            return None
+    props = ("border-width",) if not side else tuple(f"border-{s}-width" for s in SIDES[side])
+    return Match(tuple((p, value) for p in props), " xytrbl".index(side or " "))
+
+
+static_plugin("borderStyle", {f"border-{s}": f"border-style: {s}" for s in (
+    "solid", "dashed", "dotted", "double", "hidden", "none")})
+
+
+@plugin
+def borderColor(theme, util, negative):
+    m = re.fullmatch(r"border(?:-([xytrbl]))?-(.+)", util)
+    if negative or not m:
+        return None
+    side, key = m.group(1), m.group(2)
+    props = ("border-color",) if not side else tuple(f"border-{s}-color" for s in SIDES[side])
+    decls = color_decls(theme, key, props, "--tw-border-opacity")
+    if decls is None and side:   # 'border-t-...' where '-t-' is part of a color name
+        decls = color_decls(theme, f"{side}-{key}", "border-color", "--tw-border-opacity")
+        side = None
+    return Match(decls, " xytrbl".index(side or " ")) if decls else None
+
+
+@plugin
+def backgroundColor(theme, util, negative):
+    prefix, key = prefixed(util, ("bg",))
+    decls = key and not negative and color_decls(theme, key, "background-color", "--tw-bg-opacity")
+    return Match(decls) if decls else None
+
+
+GRADIENT_DIRECTIONS = {"t": "top", "tr": "top right", "r": "right", "br": "bottom right",
+                       "b": "bottom", "bl": "bottom left", "l": "left", "tl": "top left"}
+
+
+@plugin
+def backgroundImage(theme, util, negative):
+    prefix, key = prefixed(util, ("bg",))
+    if negative or not key:
+        return None
+    m = re.fullmatch(r"gradient-to-(t|tr|r|br|b|bl|l|tl)", key)
+    if m:
+        value = f"linear-gradient(to {GRADIENT_DIRECTIONS[m.group(1)]}, var(--tw-gradient-stops))"
+    else:
+        value = theme.get("backgroundImage", key)
+        if value is None:
+            value = arbitrary(key)
+            if value is None or not value.startswith(("url(", "linear-gradient(", "radial-gradient(",
+                                                      "conic-gradient(", "repeating-")):
+                return None
+    return Match((("background-image", value),))
+
+
+@plugin
+def gradientColorStops(theme, util, negative):
+    prefix, key = prefixed(util, ("from", "via", "to"))
+    if negative or not key:
+        return None
+    color = plain_color(theme, key)
+    if color is None:
+        return None
+    clear = transparent_of(color)
+    if prefix == "from":
+        decls = (("--tw-gradient-from", f"{color} var(--tw-gradient-from-position)"),
+                 ("--tw-gradient-to", f"{clear} var(--tw-gradient-to-position)"),
+                 ("--tw-gradient-stops", "var(--tw-gradient-from), var(--tw-gradient-to)"))
+    elif prefix == "via":
+        decls = (("--tw-gradient-to", f"{clear} var(--tw-gradient-to-position)"),
+                 ("--tw-gradient-stops",
+                  f"var(--tw-gradient-from), {color} var(--tw-gradient-via-position), var(--tw-gradient-to)"))
+    else:
+        decls = (("--tw-gradient-to", f"{color} var(--tw-gradient-to-position)"),)
+    return Match(decls, ("from", "via", "to").index(prefix))
+
+
+@plugin
+def backgroundSize(theme, util, negative):
+    prefix, key = prefixed(util, ("bg",))
+    value = key and theme.get("backgroundSize", key)
+    return Match((("background-size", value),)) if value and not negative else None
+
+
+static_plugin("backgroundAttachment", {"bg-fixed": "background-attachment: fixed",
+                                       "bg-local": "background-attachment: local",
+                                       "bg-scroll": "background-attachment: scroll"})
+static_plugin("backgroundClip", {"bg-clip-border": "background-clip: border-box",
+                                 "bg-clip-padding": "background-clip: padding-box",
+                                 "bg-clip-content": "background-clip: content-box",
+                                 "bg-clip-text": "-webkit-background-clip: text; background-clip: text"})
+static_plugin("backgroundPosition", {f"bg-{k}": f"background-position: {k.replace('-', ' ')}"
+                                     for k in ("bottom", "center", "left", "left-bottom", "left-top",
+                                               "right", "right-bottom", "right-top", "top")})
+static_plugin("backgroundRepeat", {"bg-repeat": "background-repeat: repeat",
+                                   "bg-no-repeat": "background-repeat: no-repeat",
+                                   "bg-repeat-x": "background-repeat: repeat-x",
+                                   "bg-repeat-y": "background-repeat: repeat-y"})
+static_plugin("objectFit", {f"object-{v}": f"object-fit: {v}" for v in (
+    "contain", "cover", "fill", "none", "scale-down")})
+
+
+@plugin
+def padding(theme, util, negative):
+    order = ("p", "px", "py", "ps", "pe", "pt", "pr", "pb", "pl")
+    prefix, key = prefixed(util, order)
+    value = key and spacing(theme, key)
+    if negative or not value:
+        return None
+    side = prefix[1:]
+    props = ("padding",) if not side else tuple(f"padding-{s}" for s in SIDES.get(side, ()))
+    if side in ("s", "e"):
+        props = ("padding-inline-start",) if side == "s" else ("padding-inline-end",)
+    return Match(tuple((p, value) for p in props), order.index(prefix))
+
+
+static_plugin("textAlign", {f"text-{v}": f"text-align: {v}" for v in (
+    "left", "center", "right", "justify", "start", "end")})
+
+
+@plugin
+def fontFamily(theme, util, negative):
+    prefix, key = prefixed(util, ("font",))
+    value = key and theme.get("fontFamily", key)
+    return Match((("font-family", font_family(value)),)) if value and not negative else None
+
+
+@plugin
+def fontSize(theme, util, negative):
+    prefix, key = prefixed(util, ("text",))
+    if negative or not key:
+        return None
+    value = theme.get("fontSize", key)
+    if value is None:
+        value = arbitrary(key)
+        if value is None or not is_length(value):
+            return None
+        return Match((("font-size", value),))
+    if isinstance(value, (list, tuple)):
+        size, extra = value[0], value[1] if len(value) > 1 else None
+        line_height = extra.get("lineHeight") if isinstance(extra, dict) else extra
+        decls = (("font-size", size),)
+        return Match(decls + ((("line-height", line_height),) if line_height else ()))
+    return Match((("font-size", value),))
+
+
+@plugin
+def fontWeight(theme, util, negative):
+    prefix, key = prefixed(util, ("font",))
+    value = key and themed(theme, "fontWeight", key)
+    return Match((("font-weight", value),)) if value and not negative else None
+
+
+static_plugin("textTransform", {"uppercase": "text-transform: uppercase",
+                                "lowercase": "text-transform: lowercase",
+                                "capitalize": "text-transform: capitalize",
+                                "normal-case": "text-transform: none"})
+static_plugin("fontStyle", {"italic": "font-style: italic", "not-italic": "font-style: normal"})
+
+
+@plugin
+def lineHeight(theme, util, negative):
+    prefix, key = prefixed(util, ("leading",))
+    value = key and themed(theme, "lineHeight", key)
+    return Match((("line-height", value),)) if value and not negative else None
+
+
+@plugin
+def letterSpacing(theme, util, negative):
+    prefix, key = prefixed(util, ("tracking",))
+    value = key and themed(theme, "letterSpacing", key)
+    if not value:
+        return None
+    return Match((("letter-spacing", negate(value) if negative else value),))
+
+
+@plugin
+def textColor(theme, util, negative):
+    prefix, key = prefixed(util, ("text",))
+    decls = key and not negative and color_decls(theme, key, "color", "--tw-text-opacity")
+    return Match(decls) if decls else None
+
+
+static_plugin("textDecoration", {"underline": "text-decoration-line: underline",
+                                 "overline": "text-decoration-line: overline",
+                                 "line-through": "text-decoration-line: line-through",
+                                 "no-underline": "text-decoration-line: none"})
+
+
+@plugin
+def placeholderColor(theme, util, negative):
+    prefix, key = prefixed(util, ("placeholder",))
+    decls = key and not negative and color_decls(theme, key, "color", "--tw-placeholder-opacity")
+    return Match(decls, 0, "::placeholder") if decls else None
+
+
+@plugin
+def opacity(theme, util, negative):
+    prefix, key = prefixed(util, ("opacity",))
+    value = key and themed(theme, "opacity", key)
+    return Match((("opacity", value),)) if value and not negative else None
+
+
+static_plugin("mixBlendMode", {f"mix-blend-{m}": f"mix-blend-mode: {m}" for m in (
+    "normal", "multiply", "screen", "overlay", "darken", "lighten", "color-dodge",
+    "color-burn", "hard-light", "soft-light", "difference", "exclusion", "hue",
+    "saturation", "color", "luminosity")})
+
+
+@plugin
+def boxShadow(theme, util, negative):
+    prefix, key = prefixed(util, ("shadow",))
+    if negative or prefix is None:
+        return None
+    value = themed(theme, "boxShadow", key)
+    if value is None:
+        return None
+    if value == "none":
+        value = "0 0 #0000"
+    colored = re.sub(r"#[0-9a-fA-F]{3,8}\b|rgba?\([^)]*\)|hsla?\([^)]*\)",
+                     "var(--tw-shadow-color)", value)
+    return Match((("--tw-shadow", value), ("--tw-shadow-colored", colored), ("box-shadow", SHADOW)))
+
+
+static_plugin("outlineStyle", {"outline-none": "outline: 2px solid transparent; outline-offset: 2px",
+                               "outline": "outline-style: solid"})
+
+
+@plugin
+def blur(theme, util, negative):
+    prefix, key = prefixed(util, ("blur",))
+    if negative or prefix is None:
+        return None
+    value = themed(theme, "blur", key)
+    if value is None:
+        return None
+    return Match((("--tw-blur", f"blur({value})" if value else " "), ("filter", FILTER)))
+
+
+static_plugin("filter", {"filter": f"filter: {FILTER}", "filter-none": "filter: none"})
+
+
+@plugin
+def backdropBlur(theme, util, negative):
+    prefix, key = prefixed(util, ("backdrop-blur",))
+    if negative or prefix is None:
+        return None
+    value = themed(theme, "blur", key)
+    if value is None:
+        return None
+    return Match((("--tw-backdrop-blur", f"blur({value})" if value else " "),
+                  ("-webkit-backdrop-filter", BACKDROP_FILTER),
+                  ("backdrop-filter", BACKDROP_FILTER)))
+
+
+@plugin
+def transitionProperty(theme, util, negative):
+    prefix, key = prefixed(util, ("transition",))
+    if negative or prefix is None:
+        return None
+    value = TRANSITION_PROPERTIES.get(key or "DEFAULT")
+    if value is None:
+        return None
+    if value == "none":
+        return Match((("transition-property", "none"),))
+    return Match((("transition-property", value), ("transition-timing-function", EASE),
+                  ("transition-duration", "150ms")))
+
+
+@plugin
+def transitionDelay(theme, util, negative):
+    prefix, key = prefixed(util, ("delay",))
+    value = key and themed(theme, "transitionDelay", key)
+    return Match((("transition-delay", value),)) if value and not negative else None
+
+
+@plugin
+def transitionDuration(theme, util, negative):
+    prefix, key = prefixed(util, ("duration",))
+    value = key and themed(theme, "transitionDuration", key)
+    return Match((("transition-duration", value),)) if value and not negative else None
+
+
+@plugin
+def transitionTimingFunction(theme, util, negative):
+    prefix, key = prefixed(util, ("ease",))
+    value = key and themed(theme, "transitionTimingFunction", key)
+    return Match((("transition-timing-function", value),)) if value and not negative else None
+
+
+PLUGIN_RANK = {name: i for i, (name, _) in enumerate(PLUGINS)}
+
+
+# ---------------------------------------------------------------------------
+# Variants
+# ---------------------------------------------------------------------------
+
+PSEUDO_ELEMENTS = {"placeholder": "::placeholder", "before": "::before", "after": "::after",
+                   "marker": "::marker", "file": "::file-selector-button"}
+PSEUDO_CLASSES = {"first": ":first-child", "last": ":last-child", "odd": ":nth-child(odd)",
+                  "even": ":nth-child(even)", "visited": ":visited", "checked": ":checked",
+                  "focus-within": ":focus-within", "hover": ":hover", "focus": ":focus",
+                  "focus-visible": ":focus-visible", "active": ":active",
+                  "disabled": ":disabled"}
+GROUP_STATES = ("hover", "focus", "focus-within", "active")
+MEDIA_VARIANTS = {"motion-safe": "(prefers-reduced-motion: no-preference)",
+                  "motion-reduce": "(prefers-reduced-motion: reduce)",
+                  "dark": "(prefers-color-scheme: dark)",
+                  "print": "print"}
+
+# Tailwind's variant order: later variants win the cascade
+VARIANT_ORDER = (["selection"] + list(PSEUDO_ELEMENTS) + list(PSEUDO_CLASSES)
+                 + [f"group-{s}" for s in GROUP_STATES] + list(MEDIA_VARIANTS))
+
+
+class Rule(NamedTuple):
+    """One compiled utility."""
+    sort: tuple            # Cascade position
+    media: str             # "" or an @media condition
+    selectors: tuple       # Complete selectors
+    decls: tuple           # ((prop, value), ...)
+    keyframes: tuple       # Keyframe names used
+
+    def css(self, indent: str = "") -> str:
+        body = "".join(f"{indent}  {p}: {v};\n" for p, v in self.decls)
+        return f"{indent}{', '.join(self.selectors)} {{\n{body}{indent}}}\n"
+
+
+def split_variants(candidate: str) -> list:
+    """'md:hover:bg-[url(a:b)]' → ['md', 'hover', 'bg-[url(a:b)]'] (':' in [] kept)."""
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(candidate):
+        if ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+        elif ch == ":" and depth == 0:
+            parts.append(candidate[start:i])
+            start = i + 1
+    parts.append(candidate[start:])
+    return parts
+
+
+def escape_class(name: str) -> str:
+    """CSS-escape a class name for use in a selector."""
+    out = []
+    for i, ch in enumerate(name):
+        if ch.isascii() and (ch.isalnum() or ch in "-_"):
+            out.append(f"\\3{ch} " if i == 0 and ch.isdigit() else ch)
+        else:
+            out.append("\\" + ch)
+    return "".join(out)
+
+
+def compile_candidate(theme: Theme, candidate: str):
+    """Compile one class name (variants and all) into a Rule, or None."""
+    *variants, util = split_variants(candidate)
+    if not util or any(not v for v in variants):
+        return None
+    important = util.startswith("!")
+    util = util.lstrip("!")
+    negative = util.startswith("-")
+    util = util[1:] if negative else util
+
+    for name, fn in PLUGINS:
+        match = fn(theme, util, negative)
+        if match is not None:
+            break
+    else:
+        return None
+
+    screens = theme.sections["screens"]
+    media = []
+    pseudo_classes = ""
+    pseudo_element = ""
+    group = ""
+    selection = False
+    ranks = []
+    for variant in variants:
+        if variant in screens:
+            media.append(f"(min-width: {screens[variant]})")
+            ranks.append(len(VARIANT_ORDER) + list(screens).index(variant))
+            continue
+        if variant not in VARIANT_ORDER:
+            return None
+        ranks.append(VARIANT_ORDER.index(variant))
+        if variant in MEDIA_VARIANTS:
+            media.append(MEDIA_VARIANTS[variant])
+        elif variant in PSEUDO_CLASSES:
+            pseudo_classes += PSEUDO_CLASSES[variant]
+        elif variant in PSEUDO_ELEMENTS:
+            pseudo_element = PSEUDO_ELEMENTS[variant]
+        elif variant.startswith("group-"):
+            group += f".group:{variant[6:]} "
+        elif variant == "selection":
+            selection = True
+
+    base = f"{group}.{escape_class(candidate)}{pseudo_classes}"
+    tail = match.child + pseudo_element
+    if selection:
+        selectors = (f"{base} *::selection{tail}", f"{base}::selection{tail}")
+    else:
+        selectors = (base + tail,)
+    decls = match.decls
+    if important:
+        decls = tuple((p, f"{v} !important") for p, v in decls)
+
+    sort = (tuple(sorted(ranks)), PLUGIN_RANK[name], match.sub, candidate)
+    return Rule(sort, " and ".join(media), selectors, decls, match.keyframes)
+
+
+# ---------------------------------------------------------------------------
+# Stylesheet Rendering
+# ---------------------------------------------------------------------------
+
+def render_keyframes(theme: Theme, name: str) -> str:
+    frames = theme.sections.get("keyframes", {}).get(name) or {}
+    lines = [f"@keyframes {name} {{\n"]
+    for step, props in frames.items():
+        if not isinstance(props, dict):
+            continue
+        body = " ".join(f"{re.sub(r'[A-Z]', lambda m: '-' + m.group().lower(), p)}: {v};"
+                        for p, v in props.items())
+        lines.append(f"  {step} {{ {body} }}\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def render_rules(theme: Theme, rules) -> str:
+    """Utilities in cascade order; media variants grouped per condition."""
+    rules = sorted(rules, key=lambda r: r.sort)
+    out = []
+    emitted_keyframes = set()
+    plain = [r for r in rules if not r.media]
+    for rule in plain:
+        for name in rule.keyframes:
+            if name not in emitted_keyframes:
+                emitted_keyframes.add(name)
+                out.append(render_keyframes(theme, name))
+        out.append(rule.css())
+
+    media_blocks = {}
+    for rule in rules:
+        if rule.media:
+            media_blocks.setdefault(rule.media, []).append(rule)
+    for media, block in sorted(media_blocks.items(), key=lambda item: item[1][0].sort[0]):
+        out.append(f"\n@media {media} {{\n")
+        for rule in block:
+            for name in rule.keyframes:
+                if name not in emitted_keyframes:
+                    emitted_keyframes.add(name)
+                    out.append(render_keyframes(theme, name))
+            out.append(rule.css("  "))
+        out.append("}\n")
+    return "".join(out)
+
+
+def rule_signature(theme: Theme, rule: Rule) -> str:
+    """A rule's full effect (CSS plus keyframes) for comparing themes."""
+    return rule.css() + "".join(render_keyframes(theme, k) for k in rule.keyframes)
+
+
+# ---------------------------------------------------------------------------
+# Pages
+# ---------------------------------------------------------------------------
+
+class Page(NamedTuple):
+    path: str
+    rel: str
+    candidates: frozenset
+    config: dict            # Inline (or previously stripped) config, {} if none
+    inline_config: bool
+
+
+def find_pages(targets: list, project_root: str) -> list:
+    """HTML files for the targets, minus excluded snapshots."""
+    from validate_html import collect_targets
+    excluded = tuple(os.path.join(project_root, d) + os.sep for d in EXCLUDE_DIRS)
+    return [p for p in collect_targets(targets, project_root) if not p.startswith(excluded)]
+
+
+def scan_page(path: str, project_root: str, stored_configs: dict) -> Page:
+    """Class candidates and theme config of one page."""
+    ir = load_ir(path)
+    candidates = set()
+    for _, class_string in ir.classes():
+        candidates.update(class_string.split())
+    rel = os.path.relpath(path, project_root).replace(os.sep, "/")
+    config = {}
+    inline = False
+    for _, js in ir.script_blocks():
+        if CONFIG_START_RE.search(js):
+            config = read_config(js)
+            inline = True
+            continue
+        # Classes toggled from scripts: classList.add('opacity-0'), className = "..."
+        for m in JS_STRING_RE.finditer(js):
+            candidates.update(JS_TOKEN_SPLIT_RE.split(m.group(2)))
+    if not inline:
+        config = stored_configs.get(rel, {})
+    return Page(path, rel, frozenset(candidates), config, inline)
+
+
+def load_json(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+class Build(NamedTuple):
+    css: str
+    rules: int
+    overrides: dict        # {page rel: css for its <style data-tailwind-build>}
+    unmatched: set
+
+
+def build(pages: list, base_config: dict) -> Build:
+    """Compile the shared stylesheet and per-page overrides."""
+    configs = [base_config] + [p.config for p in sorted(pages, key=lambda p: p.rel) if p.config]
+    shared = Theme(configs, shared=True)
+    page_themes = {}   # Pages with identical configs share a Theme (and its memo)
+
+    used = {}
+    unmatched = set()
+    for page in pages:
+        for candidate in page.candidates:
+            rule = shared.compile(candidate)
+            if rule is None:
+                unmatched.add(candidate)
+            else:
+                used[candidate] = rule
+
+    overrides = {}
+    for page in pages:
+        if not page.config:
+            continue
+        key = json.dumps(page.config, sort_keys=True)
+        if key not in page_themes:
+            page_themes[key] = Theme([page.config])
+        theme = page_themes[key]
+        differing = []
+        for candidate in page.candidates:
+            own = theme.compile(candidate)
+            if own is not None and candidate in used and \
+                    rule_signature(theme, own) != rule_signature(shared, used[candidate]):
+                differing.append(own)
+        if differing:
+            overrides[page.rel] = render_rules(theme, differing)
+
+    css = ("/* Generated by execution/build_tailwind.py — do not edit.\n"
+           f"   {len(used)} utilities from {len(pages)} pages; theme: {TAILWIND_CONFIG} */\n\n"
+           + base_layer(shared) + "\n" + render_rules(shared, used.values()))
+    return Build(css, len(used), overrides, unmatched)
+
+
+def strip_page(page: Page, project_root: str, override_css: str) -> bool:
+    """Swap the CDN (and inline config) for the built stylesheet. True if changed."""
+    with open(page.path, "r", encoding="utf-8") as f:
+        html = f.read()
+    stylesheet = os.path.relpath(os.path.join(project_root, OUTPUT_CSS),
+                                 os.path.dirname(page.path)).replace(os.sep, "/")
+    has_cdn = bool(CDN_SCRIPT_RE.search(html))
+    has_link = f'href="{stylesheet}"' in html
+    if not (has_cdn or has_link):
+        return False   # Never used Tailwind from the CDN
+
+    new = CDN_SCRIPT_RE.sub("", html)
+    new = INLINE_CONFIG_RE.sub("", new)
+    new = BUILD_STYLE_RE.sub("", new)
+    head_end = HEAD_END_RE.search(new)
+    if head_end is None:
+        return False
+    indent = head_end.group(1) + "    "
+    block = ""
+    if not has_link:
+        block += (f"{indent}<!-- Tailwind utilities (built by execution/build_tailwind.py) -->\n"
+                  f'{indent}<link rel="stylesheet" href="{stylesheet}">\n')
+    if override_css:
+        body = "".join(f"{indent}    {line}\n" if line else "\n"
+                       for line in override_css.rstrip("\n").split("\n"))
+        block += f"{indent}<style data-tailwind-build>\n{body}{indent}</style>\n"
+    new = new[:head_end.start()] + block + new[head_end.start():]
+    if new == html:
+        return False
+    with open(page.path, "w", encoding="utf-8") as f:
+        f.write(new)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build a static Tailwind stylesheet for the Axiara pages.",
+        epilog="Example: python3 execution/build_tailwind.py --strip"
+    )
+    parser.add_argument(
+        "targets", nargs="*", default=["."],
+        help="HTML file(s), directories or glob patterns to scan, relative to "
+             "project root (default: .)"
+    )
+    parser.add_argument(
+        "--strip", action="store_true",
+        help="Rewrite the pages: remove the Play CDN script and inline config, "
+             f"link {OUTPUT_CSS}"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true",
+        help="List classes that are not Tailwind utilities"
+    )
+    args = parser.parse_args()
+
+    project_root = resolve_project_root()
+    config_path = os.path.join(project_root, TAILWIND_CONFIG)
+    if not os.path.isfile(config_path):
+        print(f"[ERROR] Tailwind config not found: {config_path}")
+        sys.exit(1)
+    with open(config_path, "r", encoding="utf-8") as f:
+        base_config = read_config(f.read())
+
+    stored_path = os.path.join(project_root, PAGE_CONFIGS)
+    stored_configs = load_json(stored_path)
+    pages = [scan_page(path, project_root, stored_configs)
+             for path in find_pages(args.targets, project_root)]
+    result = build(pages, base_config)
+
+    output_abs = os.path.join(project_root, OUTPUT_CSS)
+    os.makedirs(os.path.dirname(output_abs), exist_ok=True)
+    with open(output_abs, "w", encoding="utf-8") as f:
+        f.write(result.css)
+
+    print(f"[OK] Generated: {output_abs}")
+    print(f"     Pages scanned: {len(pages)}")
+    print(f"     Utilities: {result.rules}")
+    print(f"     Size: {os.path.getsize(output_abs):,} bytes")
+    if result.overrides:
+        print(f"     Page-specific overrides: {', '.join(sorted(result.overrides))}")
+    if args.verbose and result.unmatched:
+        print(f"     Not Tailwind utilities ({len(result.unmatched)}): "
+              + " ".join(sorted(result.unmatched)))
+
+    if args.strip:
+        # Keep stripped inline configs: later builds still need each page's theme
+        for page in pages:
+            if page.inline_config:
+                stored_configs[page.rel] = page.config
+        if stored_configs:
+            with open(stored_path, "w", encoding="utf-8") as f:
+                json.dump(dict(sorted(stored_configs.items())), f, indent=2, ensure_ascii=False)
+                f.write("\n")
+        changed = [page.rel for page in pages
+                   if strip_page(page, project_root, result.overrides.get(page.rel, ""))]
+        print(f"[OK] Rewrote {len(changed)} page(s) to use {OUTPUT_CSS}")
+        for rel in changed:
+            print(f"     {rel}")
+
+
+if __name__ == "__main__":
+    main()
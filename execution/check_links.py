@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+check_links.py — Axiara Site Link & Anchor Checker (Layer 3 Execution)
+
+Resolves every internal link on the site and reports the ones that point
+nowhere: missing pages, missing assets and missing #fragment targets.
+
+Usage:
+  python3 execution/check_links.py
+  python3 execution/check_links.py --root axiara-deploy-v1
+
+What is checked:
+  - <a href>, <link href>, <script src>, <img src/srcset>,
+    <source src/srcset>, <iframe src>, <video src/poster>, <audio src>
+  - Component fetches in inline scripts, e.g.
+    fetch('/src/components/navbar.html') and
+    loadComponent('footer-placeholder', '/src/components/footer.html')
+  - #fragment targets against the id= (and <a name=>) anchors of the
+    target page
+
+How it stays linear:
+  One pass over the tree builds three hash maps — every file path, every
+  page's anchor set, and every page's outgoing links (pages are read via
+  the shared IR, execution/html_ir.py). Each link is then resolved with
+  O(1) set lookups, so total work is linear in pages + links.
+
+Resolution rules (static host semantics):
+  /path         → relative to --root
+  path, ../path → relative to the linking page
+  dir/          → dir/index.html
+  /about        → about.html or about/index.html (pretty URLs)
+  External URLs (http:, https:, //, mailto:, tel:, javascript:, data:)
+  are skipped.
+
+Source of truth:
+  - directives/deploy-betheme.md § 1.3 Validate Codebase
+
+No external dependencies beyond Python standard library.
+"""
+
+import argparse
+import os
+import posixpath
+import re
+import sys
+from urllib.parse import unquote, urlsplit
+
+from html_ir import load_ir
+from validate_html import SKIP_DIRS, Issue
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# (tag, attribute) pairs that reference another resource
+LINK_ATTRS = {
+    "a": ("href",),
+    "link": ("href",),
+    "script": ("src",),
+    "img": ("src", "srcset"),
+    "source": ("src", "srcset"),
+    "iframe": ("src",),
+    "video": ("src", "poster"),
+    "audio": ("src",),
+}
+
+# Runtime component fetches inside inline <script> blocks
+FETCH_PATTERNS = [
+    re.compile(r'''fetch\(\s*['"]([^'"]+)['"]'''),
+    re.compile(r'''loadComponent\(\s*['"][^'"]*['"]\s*,\s*['"]([^'"]+)['"]\s*\)'''),
+]
+
+# URL schemes that are never resolved locally
+EXTERNAL_SCHEMES = {"http", "https", "mailto", "tel", "javascript", "data", "ftp"}
+
+
+# ---------------------------------------------------------------------------
+# Site Index — one pass, three hash maps
+# ---------------------------------------------------------------------------
+
+class SiteIndex:
+    """Every file, every page's anchors and every page's outgoing links.
+
+    Paths are site-relative POSIX paths without a leading slash,
+    e.g. "services/sprint.html".
+    """
+
+    def __init__(self, root: str, use_cache: bool = True):
+        self.root = root
+        self.files = set()       # {site_path}
+        self.anchors = {}        # {page_path: {anchor_id}}
+        self.links = {}          # {page_path: [(line, tag, attr, url)]}
+
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for fname in sorted(filenames):
+                abs_path = os.path.join(dirpath, fname)
+                site_path = os.path.relpath(abs_path, root).replace(os.sep, "/")
+                self.files.add(site_path)
+                if fname.lower().endswith(".html"):
+                    self._index_page(site_path, abs_path, use_cache)
+
+    def _index_page(self, site_path: str, abs_path: str, use_cache: bool) -> None:
+        ir = load_ir(abs_path, use_cache=use_cache)
+        anchors = set()
+        links = []
+
+        for line, tag, attrs in ir.elements():
+            if attrs.get("id"):
+                anchors.add(attrs["id"])
+            if tag == "a" and attrs.get("name"):
+                anchors.add(attrs["name"])
+
+            for attr in LINK_ATTRS.get(tag, ()):
+                value = attrs.get(attr)
+                if not value:
+                    continue
+                if attr == "srcset":
+                    for candidate in value.split(","):
+                        url = candidate.strip().split(" ")[0]
+                        if url:
+                            links.append((line, tag, attr, url))
+                else:
+                    links.append((line, tag, attr, value.strip()))
+
+        for start_line, js in ir.script_blocks():
+            for pattern in FETCH_PATTERNS:
+                for match in pattern.finditer(js):
+                    line = start_line + js.count("\n", 0, match.start())
+                    links.append((line, "script", "fetch", match.group(1)))
+
+        self.anchors[site_path] = anchors
+        self.links[site_path] = links
+
+    # --- Resolution ---
+
+    def resolve(self, page: str, url: str):
+        """Resolve a URL found on `page`.
+
+        Returns:
+            (target_path_or_None, fragment) — target None means external or
+            unresolvable-by-design (skipped); "" target means not found.
+        """
+        parts = urlsplit(url)
+        if parts.scheme.lower() in EXTERNAL_SCHEMES or parts.netloc:
+            return None, ""
+        if "{" in url:
+            # Template placeholder such as {slug} or ${path}, resolved at runtime
+            return None, ""
+
+        path = unquote(parts.path)
+        fragment = unquote(parts.fragment)
+
+        if not path:
+            return page, fragment  # Same-page "#fragment"
+
+        if path.startswith("/"):
+            candidate = posixpath.normpath(path.lstrip("/")) if path != "/" else ""
+        else:
+            candidate = posixpath.normpath(
+                posixpath.join(posixpath.dirname(page), path))
+
+        if candidate.startswith(".."):
+            return "", fragment  # Escapes the site root
+
+        for option in self._candidates(candidate, path.endswith("/")):
+            if option in self.files:
+                return option, fragment
+        return "", fragment
+
+    @staticmethod
+    def _candidates(candidate: str, is_dir: bool):
+        if candidate in ("", "."):
+            yield "index.html"
+            return
+        if not is_dir:
+            yield candidate
+        yield f"{candidate}/index.html"
+        if not is_dir and not posixpath.splitext(candidate)[1]:
+            yield f"{candidate}.html"
+
+
+# ---------------------------------------------------------------------------
+# Checking
+# ---------------------------------------------------------------------------
+
+def check_site(index: SiteIndex) -> dict:
+    """Check every indexed link.
+
+    Returns:
+        {page_path: [Issue, ...]} for pages with at least one broken link
+    """
+    results = {}
+
+    for page in sorted(index.links):
+        issues = []
+        for line, _, attr, url in index.links[page]:
+            target, fragment = index.resolve(page, url)
+            if target is None:
+                continue
+            if target == "":
+                issues.append(Issue("LINKS", "FAIL", line,
+                    f"Broken {attr}: '{url}' — target not found"))
+            elif fragment and fragment not in index.anchors.get(target, ()):
+                if target.endswith(".html"):
+                    issues.append(Issue("LINKS", "FAIL", line,
+                        f"Broken anchor {attr}: '{url}' — no id=\"{fragment}\" "
+                        f"on {target}"))
+        if issues:
+            results[page] = issues
+
+    return results
+
+
+def format_links_report(index: SiteIndex, results: dict) -> str:
+    """Format the link check results as a readable terminal output."""
+    total_links = sum(len(links) for links in index.links.values())
+    broken = sum(len(issues) for issues in results.values())
+
+    lines = []
+    lines.append("")
+    lines.append("=" * 64)
+    lines.append("  AXIARA LINK CHECKER")
+    lines.append(f"  Root: {index.root}")
+    lines.append("=" * 64)
+
+    for page, issues in results.items():
+        lines.append(f"\n  [❌ FAIL] {page} ({len(issues)} broken)")
+        for issue in issues:
+            lines.append(f"    ✗ L{issue.line}: {issue.message}")
+
+    lines.append("")
+    lines.append("-" * 64)
+    lines.append(f"  RESULT: {len(index.links)} pages, {len(index.files)} files, "
+                 f"{total_links} links, {broken} broken")
+    if broken == 0:
+        lines.append("  STATUS: ✅ ALL LINKS RESOLVE")
+    else:
+        lines.append("  STATUS: ❌ BROKEN LINKS FOUND")
+    lines.append("=" * 64)
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check every internal link, asset and #anchor on the site.",
+        epilog="Example: python3 execution/check_links.py --root axiara-deploy-v1"
+    )
+    parser.add_argument(
+        "--root", default=".",
+        help="Site root to check, relative to project root (default: .)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Parse pages without the shared IR cache (.tmp/html_ir/)"
+    )
+    args = parser.parse_args()
+
+    # Resolve relative to project root
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    site_root = os.path.normpath(os.path.join(project_root, args.root))
+
+    if not os.path.isdir(site_root):
+        print(f"[ERROR] Site root not found: {site_root}")
+        sys.exit(1)
+
+    index = SiteIndex(site_root, use_cache=not args.no_cache)
+    results = check_site(index)
+    print(format_links_report(index, results))
+
+    sys.exit(1 if results else 0)
+
+
+if __name__ == "__main__":
+    main()
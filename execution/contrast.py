@@ -0,0 +1,837 @@
+#!/usr/bin/env python3
+"""
+contrast.py — WCAG Contrast Engine (Layer 3 Execution)
+
+Resolves the effective foreground and background color of every visible
+text run on a page and computes its WCAG 2.x contrast ratio, instead of
+guessing from class names.
+
+Where colors come from (later wins):
+  1. Tailwind's default palette (gray-400, white, ...)
+  2. The axiara palette in src/tailwind.config.js (colors, backgroundImage)
+  3. The page's own inline `tailwind.config = {...}` (CDN pages), or the
+     configs build_tailwind.py moved to src/tailwind.pages.json
+  4. CSS variables from generate_css.block_b_variables() and :root blocks
+  5. Plain tag / .class rules in linked and inline stylesheets
+     (src/css/axiara.css: body gradient, p/body silver, h1 white, ...)
+  6. Utility classes on the element (text-axiara-crimson, bg-white/5,
+     bg-gradient-to-r from-... to-..., text-[#abc])
+  7. Inline style="color: ...; background: ..."
+
+Colors inherit down the DOM; translucent backgrounds are composited over
+the ancestor background, and gradients are checked against every stop
+(worst case wins). Text is "large" (3:1 instead of 4.5:1) at >= 24px, or
+>= 18.66px bold, following Tailwind text-* sizes, heading defaults and
+font-bold/extrabold/black.
+
+How it stays fast:
+  Resolving an element's colors is memoized on (tag, class string, style,
+  parent state) — the parent state carries the ancestor background — and
+  contrast ratios on the color pair, so repeated markup across a whole
+  site resolves once. Page palettes are shared by every page with the same
+  inline config and stylesheets.
+
+Usage:
+  python3 execution/contrast.py index.html
+  python3 execution/contrast.py . --min 4.5
+  python3 execution/contrast.py --pair "#C41E3A" "#0D0D0D"
+
+Source of truth:
+  - directives/qa-checklist.md § Color & Contrast
+  - WCAG 2.2 SC 1.4.3 Contrast (Minimum)
+
+No external dependencies beyond Python standard library.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from functools import lru_cache
+from typing import NamedTuple
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# WCAG 2.x AA thresholds
+AA_NORMAL = 4.5
+AA_LARGE = 3.0
+
+# Large text: 18pt, or 14pt bold (in CSS px)
+LARGE_PX = 24.0
+LARGE_BOLD_PX = 18.66
+
+TAILWIND_CONFIG = "src/tailwind.config.js"
+PAGE_CONFIGS = "src/tailwind.pages.json"   # Inline configs moved out by build_tailwind.py
+
+# build_tailwind.py output — its utilities are resolved from the classes
+# themselves, so the stylesheet is not read as rules (no double-painting)
+TAILWIND_CSS = "src/css/tailwind.css"
+
+# Tailwind v3 default palette: 11 shades per family
+SHADES = (50, 100, 200, 300, 400, 500, 600, 700, 800, 900, 950)
+TAILWIND_FAMILIES = {
+    "slate":   "f8fafc f1f5f9 e2e8f0 cbd5e1 94a3b8 64748b 475569 334155 1e293b 0f172a 020617",
+    "gray":    "f9fafb f3f4f6 e5e7eb d1d5db 9ca3af 6b7280 4b5563 374151 1f2937 111827 030712",
+    "zinc":    "fafafa f4f4f5 e4e4e7 d4d4d8 a1a1aa 71717a 52525b 3f3f46 27272a 18181b 09090b",
+    "neutral": "fafafa f5f5f5 e5e5e5 d4d4d4 a3a3a3 737373 525252 404040 262626 171717 0a0a0a",
+    "stone":   "fafaf9 f5f5f4 e7e5e4 d6d3d1 a8a29e 78716c 57534e 44403c 292524 1c1917 0c0a09",
+    "red":     "fef2f2 fee2e2 fecaca fca5a5 f87171 ef4444 dc2626 b91c1c 991b1b 7f1d1d 450a0a",
+    "orange":  "fff7ed ffedd5 fed7aa fdba74 fb923c f97316 ea580c c2410c 9a3412 7c2d12 431407",
+    "amber":   "fffbeb fef3c7 fde68a fcd34d fbbf24 f59e0b d97706 b45309 92400e 78350f 451a03",
+    "yellow":  "fefce8 fef9c3 fef08a fde047 facc15 eab308 ca8a04 a16207 854d0e 713f12 422006",
+    "lime":    "f7fee7 ecfccb d9f99d bef264 a3e635 84cc16 65a30d 4d7c0f 3f6212 365314 1a2e05",
+    "green":   "f0fdf4 dcfce7 bbf7d0 86efac 4ade80 22c55e 16a34a 15803d 166534 14532d 052e16",
+    "emerald": "ecfdf5 d1fae5 a7f3d0 6ee7b7 34d399 10b981 059669 047857 065f46 064e3b 022c22",
+    "teal":    "f0fdfa ccfbf1 99f6e4 5eead4 2dd4bf 14b8a6 0d9488 0f766e 115e59 134e4a 042f2e",
+    "cyan":    "ecfeff cffafe a5f3fc 67e8f9 22d3ee 06b6d4 0891b2 0e7490 155e75 164e63 083344",
+    "sky":     "f0f9ff e0f2fe bae6fd 7dd3fc 38bdf8 0ea5e9 0284c7 0369a1 075985 0c4a6e 082f49",
+    "blue":    "eff6ff dbeafe bfdbfe 93c5fd 60a5fa 3b82f6 2563eb 1d4ed8 1e40af 1e3a8a 172554",
+    "indigo":  "eef2ff e0e7ff c7d2fe a5b4fc 818cf8 6366f1 4f46e5 4338ca 3730a3 312e81 1e1b4b",
+    "violet":  "f5f3ff ede9fe ddd6fe c4b5fd a78bfa 8b5cf6 7c3aed 6d28d9 5b21b6 4c1d95 2e1065",
+    "purple":  "faf5ff f3e8ff e9d5ff d8b4fe c084fc a855f7 9333ea 7e22ce 6b21a8 581c87 3b0764",
+    "fuchsia": "fdf4ff fae8ff f5d0fe f0abfc e879f9 d946ef c026d3 a21caf 86198f 701a75 4a044e",
+    "pink":    "fdf2f8 fce7f3 fbcfe8 f9a8d4 f472b6 ec4899 db2777 be185d 9d174d 831843 500724",
+    "rose":    "fff1f2 ffe4e6 fecdd3 fda4af fb7185 f43f5e e11d48 be123c 9f1239 881337 4c0519",
+}
+
+TAILWIND_COLORS = {"white": "#ffffff", "black": "#000000", "transparent": "transparent"}
+for _family, _hexes in TAILWIND_FAMILIES.items():
+    for _shade, _hex in zip(SHADES, _hexes.split()):
+        TAILWIND_COLORS[f"{_family}-{_shade}"] = f"#{_hex}"
+
+# Tailwind text-* font sizes (px)
+TEXT_SIZES = {
+    "text-xs": 12, "text-sm": 14, "text-base": 16, "text-lg": 18,
+    "text-xl": 20, "text-2xl": 24, "text-3xl": 30, "text-4xl": 36,
+    "text-5xl": 48, "text-6xl": 60, "text-7xl": 72, "text-8xl": 96,
+    "text-9xl": 128,
+    "text-hero": 48,   # axiara.css display size (clamp(), never below 2.5rem)
+}
+BOLD_CLASSES = {"font-bold", "font-extrabold", "font-black"}
+NORMAL_WEIGHT_CLASSES = {"font-thin", "font-extralight", "font-light",
+                         "font-normal", "font-medium", "font-semibold"}
+
+# Browser default (size px, bold) per tag
+TAG_DEFAULTS = {
+    "h1": (32, True), "h2": (24, True), "h3": (18.72, True),
+    "h4": (16, True), "h5": (13.28, True), "h6": (10.72, True),
+    "b": (None, True), "strong": (None, True), "th": (None, True),
+}
+
+# Elements whose text is never rendered as page text
+NON_VISUAL_TAGS = {"head", "title", "script", "style", "noscript", "template",
+                   "svg", "math", "select", "option"}
+
+# Classes that hide text or paint it with something other than a color
+HIDDEN_CLASSES = {"hidden", "invisible", "sr-only", "bg-clip-text"}
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+             "link", "meta", "param", "source", "track", "wbr"}
+
+# Directories never searched for stylesheets
+SKIP_DIRS = {".git", ".tmp", ".venv", "venv", "node_modules", "__pycache__"}
+
+# Browser canvas and default text color
+CANVAS = (255.0, 255.0, 255.0, 1.0)
+DEFAULT_TEXT = (0.0, 0.0, 0.0, 1.0)
+
+
+def resolve_project_root() -> str:
+    """Resolve the project root (one level up from execution/)."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(script_dir)
+
+
+# ---------------------------------------------------------------------------
+# Color Math
+# ---------------------------------------------------------------------------
+
+HEX_RE = re.compile(r"#([0-9a-fA-F]{3,8})\b")
+RGB_RE = re.compile(r"rgba?\(\s*([\d.]+)[\s,]+([\d.]+)[\s,]+([\d.]+)(?:\s*[,/]\s*([\d.]+%?))?\s*\)")
+VAR_RE = re.compile(r"var\(\s*(--[\w-]+)\s*(?:,\s*([^)]*))?\)")
+COLOR_TOKEN_RE = re.compile(r"#[0-9a-fA-F]{3,8}\b|rgba?\([^)]*\)|\btransparent\b|\bwhite\b|\bblack\b")
+
+
+def _hex_to_rgba(digits: str):
+    if len(digits) in (3, 4):
+        digits = "".join(c * 2 for c in digits)
+    if len(digits) not in (6, 8):
+        return None
+    r, g, b = (int(digits[i:i + 2], 16) for i in (0, 2, 4))
+    a = int(digits[6:8], 16) / 255 if len(digits) == 8 else 1.0
+    return (float(r), float(g), float(b), a)
+
+
+def parse_color(token: str):
+    """One CSS color token → (r, g, b, alpha), or None."""
+    token = token.strip().lower()
+    if token == "transparent":
+        return (0.0, 0.0, 0.0, 0.0)
+    if token == "white":
+        return (255.0, 255.0, 255.0, 1.0)
+    if token == "black":
+        return (0.0, 0.0, 0.0, 1.0)
+    m = HEX_RE.fullmatch(token)
+    if m:
+        return _hex_to_rgba(m.group(1))
+    m = RGB_RE.fullmatch(token)
+    if m:
+        alpha = m.group(4)
+        if alpha is None:
+            a = 1.0
+        elif alpha.endswith("%"):
+            a = float(alpha[:-1]) / 100
+        else:
+            a = float(alpha)
+        return (float(m.group(1)), float(m.group(2)), float(m.group(3)), min(a, 1.0))
+    return None
+
+
+def color_stops(value: str, variables: dict = None) -> tuple:
+    """Every color in a CSS value (a color or a gradient), var() resolved."""
+    variables = variables or {}
+    for _ in range(8):  # Nested var() chains
+        expanded = VAR_RE.sub(lambda m: variables.get(m.group(1), m.group(2) or ""), value)
+        if expanded == value:
+            break
+        value = expanded
+    stops = (parse_color(token) for token in COLOR_TOKEN_RE.findall(value))
+    return tuple(dict.fromkeys(stop for stop in stops if stop))
+
+
+def composite(top: tuple, bottom: tuple) -> tuple:
+    """`top` painted over an opaque `bottom`."""
+    a = top[3]
+    if a >= 1.0:
+        return top
+    return (top[0] * a + bottom[0] * (1 - a),
+            top[1] * a + bottom[1] * (1 - a),
+            top[2] * a + bottom[2] * (1 - a), 1.0)
+
+
+def with_alpha(color: tuple, factor: float) -> tuple:
+    return color[:3] + (color[3] * factor,)
+
+
+@lru_cache(maxsize=4096)
+def relative_luminance(color: tuple) -> float:
+    def channel(c):
+        c /= 255
+        return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+    r, g, b = (channel(c) for c in color[:3])
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+@lru_cache(maxsize=65536)
+def contrast_ratio(foreground: tuple, background: tuple) -> float:
+    """WCAG ratio of `foreground` (composited over background) on `background`."""
+    fg = composite(foreground, background)
+    l1, l2 = relative_luminance(fg[:3]), relative_luminance(background[:3])
+    hi, lo = max(l1, l2), min(l1, l2)
+    return (hi + 0.05) / (lo + 0.05)
+
+
+def to_hex(color: tuple) -> str:
+    return "#{:02X}{:02X}{:02X}".format(*(round(c) for c in color[:3]))
+
+
+# ---------------------------------------------------------------------------
+# Palette Sources
+# ---------------------------------------------------------------------------
+
+JS_TOKEN_RE = re.compile(
+    r"""\s*(?://[^\n]*|/\*.*?\*/|'((?:\\.|[^'\\])*)'|"((?:\\.|[^"\\])*)"|([\w$.%-]+)|(\S))""",
+    re.DOTALL)
+
+
+def _js_tokens(text: str, start: int):
+    for m in JS_TOKEN_RE.finditer(text, start):
+        single, double, word, punct = m.groups()
+        if single is not None or double is not None:
+            yield "str", single if single is not None else double
+        elif word is not None:
+            yield "word", word
+        elif punct is not None:
+            yield "punct", punct
+
+
+def parse_js_object(text: str, start: int) -> dict:
+    """Parse the object literal opening at text[start] ('{').
+
+    Understands what Tailwind configs use: nested objects, arrays, quoted
+    or bare keys, string values. Anything else (functions, require(),
+    numbers) is skipped and reads as None.
+    """
+    tokens = _js_tokens(text, start)
+
+    def value(kind, tok):
+        if (kind, tok) == ("punct", "{"):
+            return obj()
+        if (kind, tok) == ("punct", "["):
+            items = []
+            for kind, tok in tokens:
+                if (kind, tok) == ("punct", "]"):
+                    break
+                if (kind, tok) != ("punct", ","):
+                    items.append(value(kind, tok))
+            return items
+        if kind == "str":
+            return tok
+        # Opaque expression: skip to the end of this value
+        depth = 0
+        for kind, tok in tokens:
+            if kind != "punct":
+                continue
+            if tok in "([{":
+                depth += 1
+            elif tok in ")]}":
+                if depth == 0:
+                    raise _EndOfValue(tok)
+                depth -= 1
+            elif tok == "," and depth == 0:
+                raise _EndOfValue(",")
+        return None
+
+    def obj():
+        result = {}
+        key = None
+        for kind, tok in tokens:
+            if (kind, tok) == ("punct", "}"):
+                return result
+            if (kind, tok) == ("punct", ","):
+                continue
+            if key is None:
+                key = tok
+                continue
+            if (kind, tok) == ("punct", ":"):
+                continue
+            try:
+                result[key] = value(kind, tok)
+            except _EndOfValue as end:
+                result[key] = None
+                if end.args[0] == "}":
+                    return result
+            key = None
+        return result
+
+    first = next(tokens, None)
+    return obj() if first == ("punct", "{") else {}
+
+
+class _EndOfValue(Exception):
+    """An opaque value ended at this punctuation."""
+
+
+def flatten_theme(tree: dict, prefix: str = "") -> dict:
+    """{'axiara': {'crimson': '#C41E3A', 'DEFAULT': ...}} → {'axiara-crimson': ...}"""
+    flat = {}
+    for key, val in tree.items():
+        name = prefix if key == "DEFAULT" else (f"{prefix}-{key}" if prefix else key)
+        if isinstance(val, dict):
+            flat.update(flatten_theme(val, name))
+        elif isinstance(val, str):
+            flat[name] = val
+    return flat
+
+
+CONFIG_START_RE = re.compile(r"(?:module\.exports|tailwind\.config)\s*=\s*\{")
+
+
+def parse_tailwind_config(text: str):
+    """Theme colors and background images from a Tailwind config script.
+
+    Returns:
+        (colors, background_images, replaces_defaults) — flattened
+        {name: css_value} dicts; replaces_defaults is True when the config
+        sets theme.colors (not theme.extend.colors)
+    """
+    m = CONFIG_START_RE.search(text)
+    if not m:
+        return {}, {}, False
+    config = parse_js_object(text, m.end() - 1)
+    theme = config.get("theme") or {}
+    extend = theme.get("extend") or {}
+    colors = {}
+    images = {}
+    replaces = isinstance(theme.get("colors"), dict)
+    for section in (theme, extend):
+        if isinstance(section.get("colors"), dict):
+            colors.update(flatten_theme(section["colors"]))
+        if isinstance(section.get("backgroundImage"), dict):
+            images.update(flatten_theme(section["backgroundImage"]))
+    return colors, images, replaces
+
+
+def parse_css_rules(css: str) -> tuple:
+    """Variables and simple-selector color rules from a stylesheet.
+
+    Only top-level rules count (nothing inside @media/@supports), and only
+    plain `tag` and `.class` selectors; pseudo-classes, combinators and
+    attribute selectors are ignored.
+
+    Returns:
+        (variables, rules) — {"--name": value}, {"h1" or ".class": {prop: value}}
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    variables = {}
+    rules = {}
+    depth = 0
+    selector_start = 0
+    selector = None
+    body_start = 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            if depth == 0:
+                selector = css[selector_start:i].strip()
+                body_start = i + 1
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                if selector and not selector.startswith("@"):
+                    _add_rule(selector, css[body_start:i], variables, rules)
+                selector_start = i + 1
+            depth = max(depth, 0)
+        elif ch == ";" and depth == 0:
+            selector_start = i + 1   # @import / @charset statements
+    return variables, rules
+
+
+SIMPLE_SELECTOR_RE = re.compile(r"(?:[a-z][a-z0-9]*|\.[\w-]+)")
+COLOR_PROPS = ("color", "background", "background-color")
+
+
+def _add_rule(selector: str, body: str, variables: dict, rules: dict) -> None:
+    decls = {}
+    for decl in body.split(";"):
+        prop, sep, val = decl.partition(":")
+        if not sep:
+            continue
+        prop = prop.strip().lower()
+        val = val.replace("!important", "").strip()
+        if prop.startswith("--"):
+            decls[prop] = val
+        elif prop in COLOR_PROPS:
+            decls[prop] = val
+    for part in selector.split(","):
+        part = part.strip()
+        if part in (":root", "html"):
+            variables.update({k: v for k, v in decls.items() if k.startswith("--")})
+        if SIMPLE_SELECTOR_RE.fullmatch(part):
+            colors = {k: v for k, v in decls.items() if k in COLOR_PROPS}
+            if colors:
+                rules.setdefault(part, {}).update(colors)
+
+
+@lru_cache(maxsize=None)
+def generated_variables() -> tuple:
+    """CSS variables emitted by generate_css.block_b_variables()."""
+    try:
+        from generate_css import block_b_variables
+    except ImportError:
+        return ()
+    variables, _ = parse_css_rules(block_b_variables())
+    return tuple(variables.items())
+
+
+@lru_cache(maxsize=None)
+def _stylesheet_index(project_root: str) -> tuple:
+    found = []
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for fname in sorted(filenames):
+            if fname.endswith(".css"):
+                rel = os.path.relpath(os.path.join(dirpath, fname), project_root)
+                found.append(rel.replace(os.sep, "/"))
+    return tuple(found)
+
+
+@lru_cache(maxsize=None)
+def find_stylesheet(project_root: str, href: str, page_dir: str = "") -> str:
+    """Resolve a <link href> to a stylesheet path in the project ("" if external/missing)."""
+    href = href.split("?")[0].split("#")[0]
+    if not href or "//" in href or href.startswith(("data:", "http:", "https:")):
+        return ""
+    if href.startswith("/"):
+        candidate = os.path.join(project_root, href.lstrip("/"))
+    elif page_dir:
+        candidate = os.path.join(page_dir, href)
+    else:
+        candidate = ""
+    if candidate and os.path.isfile(candidate):
+        return os.path.normpath(candidate)
+    # No page path (event stream only): match the href's tail in the project
+    tail = re.sub(r"^(?:\.{1,2}/)+", "", href.lstrip("/"))
+    matches = [p for p in _stylesheet_index(project_root) if p == tail or p.endswith("/" + tail)]
+    return os.path.join(project_root, min(matches, key=len)) if matches else ""
+
+
+@lru_cache(maxsize=None)
+def read_stylesheet(path: str) -> tuple:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        variables, rules = parse_css_rules(f.read())
+    return tuple(variables.items()), tuple((sel, tuple(d.items())) for sel, d in rules.items())
+
+
+# ---------------------------------------------------------------------------
+# Palette — named colors, variables and rules, with memoized resolution
+# ---------------------------------------------------------------------------
+
+class TextState(NamedTuple):
+    """Resolved style of an element, inherited by its children."""
+    fg: tuple            # (r, g, b, a) text color
+    bg: tuple            # opaque background candidates ((r, g, b, 1.0), ...)
+    size: float          # font size, px
+    bold: bool
+    hidden: bool         # text not painted as a plain color (sr-only, gradient text...)
+
+
+ROOT_STATE = TextState(DEFAULT_TEXT, (CANVAS,), 16.0, False, False)
+
+UTILITY_RE = re.compile(r"(text|bg|from|via|to)-(.+?)(?:/(\d+|\[[\d.]+\]))?")
+
+
+class Palette:
+    """Everything needed to resolve colors on one page.
+
+    resolve() is memoized per instance on (tag, class string, style,
+    parent state); pages sharing a palette share the memo.
+    """
+
+    def __init__(self, colors: dict, images: dict, variables: dict, rules: dict):
+        self.colors = colors
+        self.images = images
+        self.variables = variables
+        self.rules = rules
+        self.resolve = lru_cache(maxsize=65536)(self._resolve)
+
+    def value_stops(self, value: str) -> tuple:
+        return color_stops(value, self.variables)
+
+    def utility(self, name: str) -> tuple:
+        """Color stops for a utility's color part: 'axiara-crimson', '[#abc]'."""
+        if name.startswith("[") and name.endswith("]"):
+            return self.value_stops(name[1:-1].replace("_", " "))
+        value = self.colors.get(name)
+        if value is None:
+            value = self.images.get(name)
+        return self.value_stops(value) if value else ()
+
+    def _resolve(self, tag: str, classes: str, style: str, parent: TextState) -> TextState:
+        fg, size, bold, hidden = parent.fg, parent.size, parent.bold, parent.hidden
+        bg_layers = []
+        gradient = {}
+
+        default_size, default_bold = TAG_DEFAULTS.get(tag, (None, None))
+        size = default_size or size
+        bold = bold if default_bold is None else default_bold
+
+        # Stylesheet rules: tag first, then classes (higher specificity)
+        selectors = [tag] + ["." + c for c in classes.split()]
+        for selector in selectors:
+            for prop, value in self.rules.get(selector, {}).items():
+                stops = self.value_stops(value)
+                if prop == "color" and stops:
+                    fg = stops[0]
+                elif prop != "color" and stops:
+                    bg_layers.append(stops)
+
+        for cls in classes.split():
+            if ":" in cls:
+                continue  # hover:, md:, dark: — not the resting state
+            if cls in HIDDEN_CLASSES:
+                hidden = True
+            elif cls in TEXT_SIZES:
+                size = TEXT_SIZES[cls]
+            elif cls in BOLD_CLASSES:
+                bold = True
+            elif cls in NORMAL_WEIGHT_CLASSES:
+                bold = False
+            m = UTILITY_RE.fullmatch(cls)
+            if not m:
+                continue
+            kind, name, opacity = m.groups()
+            stops = self.utility(name)
+            if not stops:
+                continue
+            if opacity:
+                factor = float(opacity.strip("[]"))
+                factor = factor / 100 if factor > 1 else factor
+                stops = tuple(with_alpha(c, factor) for c in stops)
+            if kind == "text":
+                fg = stops[0]
+            elif kind == "bg":
+                bg_layers.append(stops)
+            else:
+                gradient[kind] = stops
+
+        if gradient and any(c.startswith("bg-gradient-to-") for c in classes.split()):
+            bg_layers.append(tuple(c for stops in gradient.values() for c in stops))
+
+        for decl in style.split(";"):
+            prop, sep, value = decl.partition(":")
+            prop = prop.strip().lower()
+            if not sep:
+                continue
+            if prop == "color":
+                stops = self.value_stops(value)
+                if stops:
+                    fg = stops[0]
+            elif prop in ("background", "background-color", "background-image"):
+                stops = self.value_stops(value)
+                if stops:
+                    bg_layers.append(stops)
+            elif prop == "font-size":
+                px = _css_px(value)
+                size = px or size
+            elif prop == "font-weight":
+                weight = value.strip()
+                bold = weight == "bold" or (weight.isdigit() and int(weight) >= 700)
+
+        if fg[3] == 0:
+            hidden = True  # text-transparent (gradient text, visually-hidden)
+
+        bg = parent.bg
+        for stops in bg_layers:
+            bg = tuple(dict.fromkeys(composite(top, under) for top in stops for under in bg))[:16]
+
+        return TextState(fg, bg, size, bold, hidden)
+
+
+def _css_px(value: str):
+    m = re.fullmatch(r"\s*([\d.]+)(px|rem|em)\s*", value)
+    if not m:
+        return None
+    number = float(m.group(1))
+    return number if m.group(2) == "px" else number * 16
+
+
+@lru_cache(maxsize=None)
+def _base_sources(project_root: str):
+    colors = dict(TAILWIND_COLORS)
+    images = {}
+    config_path = os.path.join(project_root, TAILWIND_CONFIG)
+    if os.path.isfile(config_path):
+        with open(config_path, "r", encoding="utf-8") as f:
+            config_colors, images, replaces = parse_tailwind_config(f.read())
+        if replaces:
+            colors = {}
+        colors.update(config_colors)
+    # Page colors whose inline configs were stripped (first definition wins,
+    # as in the built stylesheet)
+    try:
+        with open(os.path.join(project_root, PAGE_CONFIGS), "r", encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        stored = {}
+    for config in stored.values():
+        theme = config.get("theme") or {}
+        for section in (theme, theme.get("extend") or {}):
+            for key, value in flatten_theme(section.get("colors") or {}).items():
+                colors.setdefault(key, value)
+            for key, value in flatten_theme(section.get("backgroundImage") or {}).items():
+                images.setdefault(key, value)
+    return colors, images
+
+
+@lru_cache(maxsize=256)
+def page_palette(project_root: str, inline_config: str = "", sheets: tuple = ()) -> Palette:
+    """The palette for a page with this inline Tailwind config and stylesheets.
+
+    Args:
+        project_root: Project root (src/tailwind.config.js lives under it)
+        inline_config: The page's `tailwind.config = {...}` script, if any
+        sheets: Stylesheet paths and/or ("inline", css) pairs, in page order
+    """
+    colors, images = _base_sources(project_root)
+    colors, images = dict(colors), dict(images)
+    if inline_config:
+        page_colors, page_images, replaces = parse_tailwind_config(inline_config)
+        if replaces:
+            colors = {}
+        colors.update(page_colors)
+        images.update(page_images)
+
+    variables = dict(generated_variables())
+    rules = {}
+    for sheet in sheets:
+        if isinstance(sheet, tuple):
+            sheet_vars, sheet_rules = parse_css_rules(sheet[1])
+            sheet_rules = {sel: tuple(d.items()) for sel, d in sheet_rules.items()}
+            sheet_vars = sheet_vars.items()
+        else:
+            sheet_vars, sheet_rules = read_stylesheet(sheet)
+            sheet_rules = dict(sheet_rules)
+        variables.update(sheet_vars)
+        for selector, decls in sheet_rules.items():
+            rules.setdefault(selector, {}).update(decls)
+    return Palette(colors, images, variables, rules)
+
+
+# ---------------------------------------------------------------------------
+# Checker — an IR sink (see execution/html_ir.py)
+# ---------------------------------------------------------------------------
+
+class Finding(NamedTuple):
+    line: int
+    ratio: float
+    required: float
+    fg: str            # hex
+    bg: str            # hex (worst background candidate)
+    text: str          # the text run, shortened
+
+    def message(self) -> str:
+        return (f"Contrast {self.ratio:.2f}:1 for \"{self.text}\" "
+                f"({self.fg} on {self.bg}) — WCAG AA needs {self.required:g}:1")
+
+
+class ContrastChecker:
+    """Tracks the resolved style stack and checks every visible text run.
+
+    Drive it with the IR event hooks (live EventParser or replay()).
+    Stylesheets and the inline Tailwind config are read from <head>; the
+    palette is fixed at the first element after it (normally <body>).
+
+    Args:
+        project_root: Project root (defaults to this repo)
+        report: Called with each Finding; defaults to self.findings.append
+        page_path: Absolute page path, to resolve relative stylesheet links
+        minimum: Override the AA thresholds with one ratio (e.g. 7.0 for AAA)
+    """
+
+    def __init__(self, project_root: str = None, report=None, page_path: str = "",
+                 minimum: float = None):
+        self.project_root = project_root or resolve_project_root()
+        self.findings = []
+        self.report = report or self.findings.append
+        self.page_dir = os.path.dirname(page_path) if page_path else ""
+        self.minimum = minimum
+        self.inline_config = ""
+        self.sheets = []
+        self.palette = None
+        self.stack = [("", ROOT_STATE, False)]   # (tag, state, non_visual)
+
+    # --- Page sources ---
+
+    def on_style_block(self, line, css):
+        self.sheets.append(("inline", css))
+
+    def on_script_block(self, line, js):
+        if "tailwind.config" in js:
+            self.inline_config = js
+
+    # --- Element stack ---
+
+    def on_starttag(self, line, tag, attrs):
+        if tag == "link" and "stylesheet" in (attrs.get("rel") or "").lower():
+            path = find_stylesheet(self.project_root, attrs.get("href") or "", self.page_dir)
+            if path and path != os.path.join(self.project_root, TAILWIND_CSS):
+                self.sheets.append(path)
+        if tag in VOID_TAGS:
+            return
+        _, parent, non_visual = self.stack[-1]
+        non_visual = non_visual or tag in NON_VISUAL_TAGS
+        state = parent
+        if not non_visual and tag != "html":   # <head> sources aren't read yet
+            state = self._palette().resolve(tag, attrs.get("class") or "",
+                                            attrs.get("style") or "", parent)
+        self.stack.append((tag, state, non_visual))
+
+    def on_endtag(self, line, tag):
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i][0] == tag:
+                del self.stack[i:]
+                return
+
+    def on_text(self, line, text):
+        _, state, non_visual = self.stack[-1]
+        if non_visual or state.hidden:
+            return
+        required = self.minimum or (
+            AA_LARGE if state.size >= LARGE_PX or (state.bold and state.size >= LARGE_BOLD_PX)
+            else AA_NORMAL)
+        ratio, bg = min((contrast_ratio(state.fg, bg), bg) for bg in state.bg)
+        if ratio < required:
+            text = " ".join(text.split())
+            snippet = text if len(text) <= 40 else text[:37] + "..."
+            self.report(Finding(line, round(ratio, 2), required,
+                                to_hex(composite(state.fg, bg)), to_hex(bg), snippet))
+
+    def on_decl(self, decl): pass
+    def finish(self): pass
+
+    def _palette(self) -> Palette:
+        if self.palette is None:
+            self.palette = page_palette(self.project_root, self.inline_config,
+                                        tuple(self.sheets))
+        return self.palette
+
+
+def check_ir(ir, project_root: str = None, page_path: str = "",
+             minimum: float = None) -> list:
+    """All contrast findings for a parsed DocumentIR, in document order."""
+    checker = ContrastChecker(project_root, page_path=page_path, minimum=minimum)
+    ir.replay(checker)
+    return checker.findings
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compute WCAG contrast for every text run on Axiara pages.",
+        epilog="Example: python3 execution/contrast.py . --min 4.5"
+    )
+    parser.add_argument(
+        "targets", nargs="*", default=["."],
+        help="HTML file(s), directories or glob patterns, relative to project "
+             "root (default: .)"
+    )
+    parser.add_argument(
+        "--min", type=float, default=None,
+        help="Required ratio for all text (default: WCAG AA, 4.5 / 3 for large text)"
+    )
+    parser.add_argument(
+        "--pair", nargs=2, metavar=("FG", "BG"),
+        help="Just print the ratio of two CSS colors"
+    )
+    args = parser.parse_args()
+
+    if args.pair:
+        fg, bg = (parse_color(value) for value in args.pair)
+        if fg is None or bg is None:
+            print(f"[ERROR] Not a CSS color: {args.pair[0] if fg is None else args.pair[1]}")
+            sys.exit(1)
+        bg = composite(bg, CANVAS)
+        print(f"[OK] {to_hex(composite(fg, bg))} on {to_hex(bg)}: "
+              f"{contrast_ratio(fg, bg):.2f}:1")
+        return
+
+    # Imported here: validate_html imports this module for its CONTRAST rule
+    from html_ir import load_ir
+    from validate_html import collect_targets
+
+    project_root = resolve_project_root()
+    files = collect_targets(args.targets, project_root)
+    total = 0
+    for path in files:
+        findings = check_ir(load_ir(path), project_root, page_path=path, minimum=args.min)
+        total += len(findings)
+        if findings:
+            print(f"\n  {os.path.relpath(path, project_root)} ({len(findings)} low-contrast)")
+            for f in findings:
+                print(f"    ✗ L{f.line}: {f.message()}")
+
+    print(f"\n[{'OK' if total == 0 else 'ERROR'}] {len(files)} page(s), "
+          f"{total} text run(s) below the contrast minimum")
+    sys.exit(1 if total else 0)
+
+
+if __name__ == "__main__":
+    main()
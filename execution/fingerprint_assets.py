@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+fingerprint_assets.py — Content-Hashed Asset Build (Layer 3 Execution)
+
+Pages reference src/css/axiara.css, logos and images by stable names, so
+a host cannot let browsers and CDNs cache them for long: a changed file
+keeps its URL. This script writes a deployable copy of the site in which
+every CSS, JS, image and SVG file is also stored under a name derived
+from its content:
+
+  src/css/axiara.css  →  src/css/axiara.3f9a1c2b.css
+
+and every href/src/srcset (plus CSS url()) that points at an asset is
+rewritten to the fingerprinted name. A fingerprinted file never changes,
+so it can be served with
+
+  Cache-Control: public, max-age=31536000, immutable
+
+and a deploy only makes clients re-download the assets whose content
+changed. HTML is left at its stable URLs (short cache).
+
+How it works:
+  1. Copy the runtime site (root pages, section folders, src/) into the
+     output directory; dev folders (execution/, directives/, docs/,
+     SKILLS/, the deploy mirror, ...) are left out
+  2. Hash images, SVGs and JS first, then stylesheets after rewriting
+     their url() references, so a stylesheet's hash covers the
+     fingerprinted names it points at
+  3. Rewrite href/src/srcset and url() in every page; absolute
+     ("/src/...") references stay absolute and relative ones relative.
+     References to files that do not exist are left untouched
+  4. Write asset-manifest.json: {"src/css/axiara.css": "src/css/axiara.3f9a1c2b.css"}
+
+Originals are copied too, so URLs that are not rewritten (/favicon.ico,
+paths assembled in JavaScript) keep working.
+
+Usage:
+  python3 execution/fingerprint_assets.py
+  python3 execution/fingerprint_assets.py --out .tmp/dist
+
+Output:
+  dist/ (or --out), with dist/asset-manifest.json
+
+Source of truth:
+  - directives/deploy-betheme.md (Packaging for Deployment)
+
+No external dependencies beyond Python standard library.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+import sys
+from urllib.parse import quote, unquote, urlsplit
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+OUTPUT_DIR = "dist"
+MANIFEST_FILE = "asset-manifest.json"
+
+# Hex digits of the SHA-256 content hash kept in the file name
+HASH_LENGTH = 8
+
+# Fingerprinted file types; stylesheets go last (their url()s are rewritten first)
+ASSET_EXTENSIONS = {".js", ".png", ".jpg", ".jpeg", ".webp", ".avif", ".gif",
+                    ".svg", ".ico", ".woff", ".woff2"}
+STYLESHEET_EXTENSIONS = {".css"}
+
+# Top-level folders that are development material, not the runtime site
+DEV_DIRS = {".git", ".agent", ".gemini", ".tmp", ".venv", "venv", "node_modules",
+            "__pycache__", "SKILLS", "design-system", "directives", "docs",
+            "execution", "axiara-deploy-v1", OUTPUT_DIR}
+
+# href="...", src='...', srcset="..." in HTML
+ATTR_RE = re.compile(r'''(\b(?:href|src|srcset)\s*=\s*)(["'])(.*?)\2''', re.I | re.S)
+
+# url(...) in CSS, <style> blocks and style="" attributes
+CSS_URL_RE = re.compile(r'''(url\(\s*)(["']?)([^"')\s]+)\2(\s*\))''', re.I)
+
+
+def resolve_project_root() -> str:
+    """Resolve the project root (one level up from execution/)."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(script_dir)
+
+
+# ---------------------------------------------------------------------------
+# Site Files
+# ---------------------------------------------------------------------------
+
+def site_files(project_root: str, out_dir: str) -> list[str]:
+    """Site-relative POSIX paths of the runtime site.
+
+    At the project root only pages are taken (the PDFs and notes there
+    are project documents); below it, everything outside DEV_DIRS.
+    """
+    out_abs = os.path.abspath(out_dir)
+    files = []
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        at_root = os.path.samefile(dirpath, project_root)
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if not (at_root and (d in DEV_DIRS or d.startswith(".")))
+            and os.path.abspath(os.path.join(dirpath, d)) != out_abs
+        )
+        for fname in sorted(filenames):
+            if at_root and not fname.lower().endswith(".html"):
+                continue
+            rel = os.path.relpath(os.path.join(dirpath, fname), project_root)
+            files.append(rel.replace(os.sep, "/"))
+    return files
+
+
+def fingerprinted_name(path: str, content: bytes) -> str:
+    """Fingerprinted path: src/css/axiara.css → src/css/axiara.3f9a1c2b.css"""
+    stem, ext = posixpath.splitext(path)
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    return f"{stem}.{digest}{ext}"
+
+
+# ---------------------------------------------------------------------------
+# Reference Rewriting
+# ---------------------------------------------------------------------------
+
+class Rewriter:
+    """Maps asset URLs found in a file to their fingerprinted URLs."""
+
+    def __init__(self, manifest: dict):
+        self.manifest = manifest      # {site path: fingerprinted site path}
+        self.rewritten = 0
+
+    def url(self, url: str, base: str) -> str:
+        """Fingerprinted form of `url` as seen from site path `base`, or `url`."""
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc or not parts.path:
+            return url
+        path = unquote(parts.path)
+        if path.startswith("/"):
+            target = posixpath.normpath(path.lstrip("/"))
+        else:
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(base), path))
+        hashed = self.manifest.get(target)
+        if hashed is None:
+            return url
+        if path.startswith("/"):
+            new_path = "/" + hashed
+        else:
+            new_path = posixpath.relpath(hashed, posixpath.dirname(base) or ".")
+        if "%" in parts.path:
+            new_path = quote(new_path)
+        self.rewritten += 1
+        suffix = (f"?{parts.query}" if parts.query else "") + \
+                 (f"#{parts.fragment}" if parts.fragment else "")
+        return new_path + suffix
+
+    def srcset(self, value: str, base: str) -> str:
+        candidates = []
+        for candidate in value.split(","):
+            fields = candidate.strip().split()
+            if fields:
+                fields[0] = self.url(fields[0], base)
+            candidates.append(" ".join(fields))
+        return ", ".join(candidates)
+
+    def css(self, text: str, base: str) -> str:
+        return CSS_URL_RE.sub(
+            lambda m: m.group(1) + m.group(2) + self.url(m.group(3), base)
+            + m.group(2) + m.group(4), text)
+
+    def html(self, text: str, base: str) -> str:
+        def attr(m):
+            name = m.group(1).split("=")[0].strip().lower()
+            value = m.group(3)
+            value = self.srcset(value, base) if name == "srcset" else self.url(value, base)
+            return m.group(1) + m.group(2) + value + m.group(2)
+        return self.css(ATTR_RE.sub(attr, text), base)
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+def write_file(out_dir: str, path: str, content: bytes) -> None:
+    dest = os.path.join(out_dir, path)
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    with open(dest, "wb") as f:
+        f.write(content)
+
+
+def build(project_root: str, out_dir: str) -> dict:
+    """Write the fingerprinted site to `out_dir`. Returns a summary."""
+    if os.path.isdir(out_dir):
+        shutil.rmtree(out_dir)
+    files = site_files(project_root, out_dir)
+    manifest = {}
+    rewriter = Rewriter(manifest)
+
+    def read(path):
+        with open(os.path.join(project_root, path), "rb") as f:
+            return f.read()
+
+    def ext(path):
+        return posixpath.splitext(path)[1].lower()
+
+    # 1. Plain assets: content is final as-is
+    for path in files:
+        if ext(path) in ASSET_EXTENSIONS:
+            content = read(path)
+            manifest[path] = fingerprinted_name(path, content)
+            write_file(out_dir, path, content)
+            write_file(out_dir, manifest[path], content)
+
+    # 2. Stylesheets: rewrite url()s, then hash the result
+    for path in files:
+        if ext(path) in STYLESHEET_EXTENSIONS:
+            content = rewriter.css(read(path).decode("utf-8"), path).encode("utf-8")
+            manifest[path] = fingerprinted_name(path, content)
+            write_file(out_dir, path, content)
+            write_file(out_dir, manifest[path], content)
+
+    # 3. Pages and everything else
+    pages = 0
+    for path in files:
+        if path in manifest:
+            continue
+        content = read(path)
+        if ext(path) == ".html":
+            content = rewriter.html(content.decode("utf-8"), path).encode("utf-8")
+            pages += 1
+        write_file(out_dir, path, content)
+
+    with open(os.path.join(out_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+        f.write("\n")
+
+    return {"files": len(files), "assets": len(manifest), "pages": pages,
+            "references": rewriter.rewritten}
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build a deployable copy of the site with content-hashed asset names.",
+        epilog="Example: python3 execution/fingerprint_assets.py --out dist"
+    )
+    parser.add_argument(
+        "--out", default=OUTPUT_DIR,
+        help=f"Output directory, relative to project root (default: {OUTPUT_DIR}); "
+             "replaced on every run"
+    )
+    args = parser.parse_args()
+
+    project_root = resolve_project_root()
+    out_dir = os.path.join(project_root, args.out)
+    # The output directory is replaced; never delete something that isn't one
+    if os.path.isdir(out_dir) and os.listdir(out_dir) and \
+            not os.path.isfile(os.path.join(out_dir, MANIFEST_FILE)):
+        print(f"[ERROR] {out_dir} exists and is not a previous build (no {MANIFEST_FILE})")
+        sys.exit(1)
+
+    summary = build(project_root, out_dir)
+    print(f"[OK] Built: {out_dir}")
+    print(f"     Files: {summary['files']}")
+    print(f"     Fingerprinted assets: {summary['assets']}")
+    print(f"     Pages rewritten: {summary['pages']} ({summary['references']} references)")
+    print(f"     Manifest: {os.path.join(out_dir, MANIFEST_FILE)}")
+
+
+if __name__ == "__main__":
+    main()
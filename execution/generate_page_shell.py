@@ -12,11 +12,19 @@ Usage:
     --output "src/pages/technology/episteme.html" \\
     --desc "Episteme: Axiara's knowledge governance engine."
 
+  # Every page in a manifest, from one process
+  python3 execution/generate_page_shell.py --manifest pages.json
+
 Arguments:
-  --title   Page <title> tag text (required)
-  --slug    URL slug / page identifier (required)
-  --output  Output filepath relative to project root (required)
-  --desc    Meta description text (optional, defaults to title)
+  --title     Page <title> tag text (required without --manifest)
+  --slug      URL slug / page identifier (required without --manifest)
+  --output    Output filepath relative to project root (required without --manifest)
+  --desc      Meta description text (optional, defaults to title)
+  --manifest  JSON list of pages, relative to project root:
+                [{"title": "...", "slug": "...", "output": "...", "desc": "..."}, ...]
+              Components are read and the template is prepared once; pages
+              are written in parallel (--jobs) and outputs whose content is
+              already identical are left untouched.
 
 Source of truth:
   - directives/build-page.md (Standard Page Structure)
@@ -27,8 +35,11 @@ No external dependencies beyond Python standard library.
 """
 
 import argparse
+import json
 import os
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
 # ---------------------------------------------------------------------------
@@ -44,8 +55,9 @@ GOOGLE_FONTS_URL = (
     "display=swap"
 )
 
-# Tailwind CSS CDN (latest v3 via Play CDN for development)
-TAILWIND_CDN = "https://cdn.tailwindcss.com"
+# Tailwind utilities, prebuilt from the site's class usage by
+# execution/build_tailwind.py (replaces the Play CDN)
+TAILWIND_CSS_FILE = "src/css/tailwind.css"
 
 # Lucide Icons CDN
 LUCIDE_CDN = "https://unpkg.com/lucide@latest"
@@ -185,12 +197,12 @@ PAGE_TEMPLATE = """\
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="{google_fonts_url}" rel="stylesheet">
 
-    <!-- Tailwind CSS (Play CDN for development) -->
-    <script src="{tailwind_cdn}"></script>
-
     <!-- Axiara "Darkroom" CSS Kit -->
     <!-- Generated by: execution/generate_css.py -->
     <link rel="stylesheet" href="{css_path}">
+
+    <!-- Tailwind utilities (built by execution/build_tailwind.py) -->
+    <link rel="stylesheet" href="{tailwind_css_path}">
 </head>
 <body>
     <!-- Skip-to-content link (Accessibility) -->
@@ -313,8 +325,9 @@ def resolve_project_root() -> str:
     return os.path.dirname(script_dir)
 
 
-def compute_relative_css_path(output_path: str, project_root: str) -> str:
-    """Compute the relative path from the output HTML file to axiara.css.
+def compute_relative_css_path(output_path: str, project_root: str,
+                              css_file: str = CSS_FILE) -> str:
+    """Compute the relative path from the output HTML file to a stylesheet.
     
     Example:
       output: src/pages/technology/episteme.html
@@ -322,7 +335,7 @@ def compute_relative_css_path(output_path: str, project_root: str) -> str:
       result: ../../css/axiara.css
     """
     output_abs = os.path.join(project_root, output_path)
-    css_abs = os.path.join(project_root, CSS_FILE)
+    css_abs = os.path.join(project_root, css_file)
     output_dir = os.path.dirname(output_abs)
     return os.path.relpath(css_abs, output_dir)
 
@@ -364,6 +377,118 @@ def slug_to_h1(slug: str) -> str:
     return slug.replace("-", " ").upper()
 
 
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+class PageRenderer:
+    """PAGE_TEMPLATE with the components and site-wide values filled in once.
+
+    The template is split into literal text and per-page fields up front,
+    so rendering a page is a single join however many pages are generated.
+    """
+
+    def __init__(self, project_root: str):
+        self.project_root = project_root
+        site = {
+            "google_fonts_url": GOOGLE_FONTS_URL,
+            "navbar": load_component(NAVBAR_PATH, project_root, DEFAULT_NAVBAR),
+            "footer": load_component(FOOTER_PATH, project_root, DEFAULT_FOOTER),
+            "lucide_cdn": LUCIDE_CDN,
+        }
+        self.parts = []      # Literal strings and per-page field names, alternating
+        literal = ""
+        for text, field, _, _ in string.Formatter().parse(PAGE_TEMPLATE):
+            literal += text
+            if field is None:
+                continue
+            if field in site:
+                literal += site[field]
+            else:
+                self.parts += [literal, field]
+                literal = ""
+        self.parts.append(literal)
+
+    def fields(self, title: str, slug: str, output: str, desc: str = None) -> dict:
+        return {
+            "title": title,
+            "meta_desc": desc or title,
+            "css_path": compute_relative_css_path(output, self.project_root),
+            "tailwind_css_path": compute_relative_css_path(output, self.project_root,
+                                                           TAILWIND_CSS_FILE),
+            "slug": slug,
+            "title_h1": slug_to_h1(slug),
+        }
+
+    def render(self, fields: dict) -> str:
+        return "".join(part if i % 2 == 0 else fields[part]
+                       for i, part in enumerate(self.parts))
+
+
+def write_if_changed(path: str, html: str) -> bool:
+    """Write `html` to `path` unless the file already has exactly that content."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == html:
+                return False
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return True
+
+
+def load_manifest(path: str) -> list:
+    """Page entries from a manifest; exits with [ERROR] on a malformed one."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            pages = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[ERROR] Cannot read manifest {path}: {e}")
+        sys.exit(1)
+    if not isinstance(pages, list):
+        print(f"[ERROR] Manifest must be a JSON list of pages: {path}")
+        sys.exit(1)
+
+    outputs = set()
+    for i, page in enumerate(pages):
+        missing = [key for key in ("title", "slug", "output")
+                   if not isinstance(page, dict) or not page.get(key)]
+        if missing:
+            print(f"[ERROR] Manifest entry {i}: missing {', '.join(missing)}")
+            sys.exit(1)
+        output = os.path.normpath(page["output"])
+        if output in outputs:
+            print(f"[ERROR] Manifest entry {i}: duplicate output {page['output']}")
+            sys.exit(1)
+        outputs.add(output)
+    return pages
+
+
+def generate_manifest(manifest: str, project_root: str, jobs: int) -> None:
+    pages = load_manifest(os.path.join(project_root, manifest))
+    renderer = PageRenderer(project_root)
+
+    def generate(page):
+        fields = renderer.fields(page["title"], page["slug"], page["output"], page.get("desc"))
+        return write_if_changed(os.path.join(project_root, page["output"]),
+                                renderer.render(fields))
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        written = list(pool.map(generate, pages))
+
+    print(f"[OK] Manifest: {manifest}")
+    print(f"     Pages: {len(pages)}")
+    print(f"     Written: {sum(written)}")
+    print(f"     Unchanged: {len(pages) - sum(written)}")
+    for page, changed in zip(pages, written):
+        if changed:
+            print(f"     {page['output']}")
+    if any(written):
+        print("     Next: python3 execution/build_tailwind.py  (utilities for these pages)")
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -377,15 +502,15 @@ def main():
                '--output "src/pages/technology/episteme.html"'
     )
     parser.add_argument(
-        "--title", required=True,
+        "--title",
         help='Page <title> text, e.g. "NTRJ Episteme — Axiara"'
     )
     parser.add_argument(
-        "--slug", required=True,
+        "--slug",
         help='URL slug / page identifier, e.g. "episteme"'
     )
     parser.add_argument(
-        "--output", required=True,
+        "--output",
         help='Output filepath relative to project root, '
              'e.g. "src/pages/technology/episteme.html"'
     )
@@ -393,33 +518,29 @@ def main():
         "--desc", default=None,
         help="Meta description text (optional, defaults to title)"
     )
+    parser.add_argument(
+        "--manifest",
+        help="JSON list of pages to generate in one run, relative to project root"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Pages written in parallel with --manifest (default: all cores)"
+    )
 
     args = parser.parse_args()
     project_root = resolve_project_root()
 
-    # Resolve values
-    meta_desc = args.desc if args.desc else args.title
-    css_path = compute_relative_css_path(args.output, project_root)
-    title_h1 = slug_to_h1(args.slug)
+    if args.manifest:
+        generate_manifest(args.manifest, project_root, args.jobs)
+        return
+    missing = [f"--{name}" for name in ("title", "slug", "output") if not getattr(args, name)]
+    if missing:
+        parser.error(f"{', '.join(missing)} required (or use --manifest)")
 
-    # Load or use default components
     print(f"Generating page shell: {args.output}")
-    navbar = load_component(NAVBAR_PATH, project_root, DEFAULT_NAVBAR)
-    footer = load_component(FOOTER_PATH, project_root, DEFAULT_FOOTER)
-
-    # Render template
-    html = PAGE_TEMPLATE.format(
-        title=args.title,
-        meta_desc=meta_desc,
-        google_fonts_url=GOOGLE_FONTS_URL,
-        tailwind_cdn=TAILWIND_CDN,
-        css_path=css_path,
-        slug=args.slug,
-        title_h1=title_h1,
-        navbar=navbar,
-        footer=footer,
-        lucide_cdn=LUCIDE_CDN,
-    )
+    renderer = PageRenderer(project_root)
+    fields = renderer.fields(args.title, args.slug, args.output, args.desc)
+    html = renderer.render(fields)
 
     # Write output
     output_abs = os.path.join(project_root, args.output)
@@ -432,9 +553,10 @@ def main():
     print(f"[OK] Generated: {output_abs}")
     print(f"     Size: {file_size:,} bytes")
     print(f"     Title: {args.title}")
-    print(f"     H1: {title_h1}")
-    print(f"     CSS path: {css_path}")
+    print(f"     H1: {fields['title_h1']}")
+    print(f"     CSS path: {fields['css_path']}")
     print(f"     Slug: {args.slug}")
+    print("     Next: python3 execution/build_tailwind.py  (utilities for this page)")
 
 
 if __name__ == "__main__":
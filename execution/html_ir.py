@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+html_ir.py — Shared Parsed-Document IR for the QA scripts (Layer 3 Execution)
+
+Parses an HTML file once into a compact, ordered event list and caches it
+on disk keyed by the file's content hash. Every QA tool consumes the same
+IR instead of re-parsing the page:
+
+  - execution/validate_html.py                        (brand rules)
+  - SKILLS/frontend-design/scripts/ux_audit.py        (structural UX checks)
+  - SKILLS/frontend-design/scripts/accessibility_checker.py
+
+Event vocabulary (one list per event, JSON-serializable):
+  ["decl",   decl]                  <!DOCTYPE ...> and other declarations
+  ["start",  line, tag, attrs]      start tag; attrs is a dict
+  ["end",    line, tag]             end tag
+  ["text",   line, text]            visible text (stripped, non-empty)
+  ["style",  line, css]             complete <style> block contents
+  ["script", line, js]              complete inline <script> contents
+
+The same events drive any "sink" object exposing the hooks on_decl,
+on_starttag, on_endtag, on_text, on_style_block, on_script_block and
+finish — either live from EventParser.feed() or replayed from a cached
+DocumentIR via replay().
+
+Usage:
+  python3 execution/html_ir.py index.html
+  python3 execution/html_ir.py index.html --json
+
+Cache:
+  .tmp/html_ir/<sha256>.json (bump IR_VERSION when the event format changes)
+
+No external dependencies beyond Python standard library.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections import Counter
+from html.parser import HTMLParser
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Bump when the event vocabulary or its encoding changes
+IR_VERSION = "1"
+
+# Cache directory (relative to project root)
+IR_CACHE_DIR = ".tmp/html_ir"
+
+# Characters fed to the parser per read
+CHUNK_SIZE = 64 * 1024
+
+
+def resolve_project_root() -> str:
+    """Resolve the project root (one level up from execution/)."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(script_dir)
+
+
+# ---------------------------------------------------------------------------
+# Event Parser — HTMLParser reporting the IR event vocabulary
+# ---------------------------------------------------------------------------
+
+class EventParser(HTMLParser):
+    """HTMLParser that reports IR events to its own on_* hooks.
+
+    Subclasses override the hooks they need. <style> and inline <script>
+    bodies are collected and reported whole when their end tag arrives;
+    everything else is reported as it streams through feed().
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Raw-text element tracking (<style> / <script>)
+        self._raw_tag = None
+        self._raw_start_line = 0
+        self._raw_content = []
+
+    # --- Hooks (no-ops by default) ---
+
+    def on_decl(self, decl): pass
+    def on_starttag(self, line, tag, attrs): pass
+    def on_endtag(self, line, tag): pass
+    def on_text(self, line, text): pass
+    def on_style_block(self, line, css): pass
+    def on_script_block(self, line, js): pass
+    def finish(self): pass
+
+    # --- HTMLParser callbacks ---
+
+    def handle_decl(self, decl):
+        self.on_decl(decl)
+
+    def handle_starttag(self, tag, attrs):
+        line = self.getpos()[0]
+        self.on_starttag(line, tag, dict(attrs))
+
+        if tag in ("style", "script"):
+            self._raw_tag = tag
+            self._raw_start_line = line
+            self._raw_content = []
+
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing tags (<img />) carry no content
+        self.on_starttag(self.getpos()[0], tag, dict(attrs))
+
+    def handle_endtag(self, tag):
+        if tag == self._raw_tag:
+            text = "".join(self._raw_content)
+            if tag == "style":
+                self.on_style_block(self._raw_start_line, text)
+            else:
+                self.on_script_block(self._raw_start_line, text)
+            self._raw_tag = None
+            self._raw_content = []
+        self.on_endtag(self.getpos()[0], tag)
+
+    def handle_data(self, data):
+        if self._raw_tag:
+            self._raw_content.append(data)
+            return
+        stripped = data.strip()
+        if stripped:
+            self.on_text(self.getpos()[0], stripped)
+
+    def close(self):
+        super().close()
+        self.finish()
+
+
+def feed_file(parser: HTMLParser, abs_path: str, chunk_size: int = CHUNK_SIZE) -> None:
+    """Feed a file to a parser in fixed-size chunks, then close it.
+
+    The document is never held as one string; peak memory is the chunk
+    size plus whatever a single unterminated construct needs (HTMLParser
+    keeps a <style>/<script> element's body until its end tag arrives).
+    """
+    with open(abs_path, "r", encoding="utf-8", errors="replace") as f:
+        for chunk in iter(lambda: f.read(chunk_size), ""):
+            parser.feed(chunk)
+    parser.close()
+
+
+# ---------------------------------------------------------------------------
+# Document IR
+# ---------------------------------------------------------------------------
+
+class DocumentIR:
+    """Ordered event list for one parsed HTML document."""
+
+    def __init__(self, events: list, content_hash: str = ""):
+        self.events = events
+        self.content_hash = content_hash
+
+    # --- Replay ---
+
+    def replay(self, sink) -> None:
+        """Drive a sink's on_* hooks exactly as a live EventParser would."""
+        for event in self.events:
+            kind = event[0]
+            if kind == "start":
+                sink.on_starttag(event[1], event[2], event[3])
+            elif kind == "end":
+                sink.on_endtag(event[1], event[2])
+            elif kind == "text":
+                sink.on_text(event[1], event[2])
+            elif kind == "style":
+                sink.on_style_block(event[1], event[2])
+            elif kind == "script":
+                sink.on_script_block(event[1], event[2])
+            elif kind == "decl":
+                sink.on_decl(event[1])
+        sink.finish()
+
+    # --- Queries ---
+
+    def elements(self, *tags):
+        """Yield (line, tag, attrs) for start tags (all, or only `tags`)."""
+        for event in self.events:
+            if event[0] == "start" and (not tags or event[2] in tags):
+                yield event[1], event[2], event[3]
+
+    def texts(self):
+        """Yield (line, text) for visible text spans."""
+        for event in self.events:
+            if event[0] == "text":
+                yield event[1], event[2]
+
+    def style_blocks(self):
+        """Yield (line, css) for <style> blocks."""
+        for event in self.events:
+            if event[0] == "style":
+                yield event[1], event[2]
+
+    def script_blocks(self):
+        """Yield (line, js) for inline <script> blocks."""
+        for event in self.events:
+            if event[0] == "script":
+                yield event[1], event[2]
+
+    def classes(self):
+        """Yield (line, class_string) for every element with a class."""
+        for line, _, attrs in self.elements():
+            if attrs.get("class"):
+                yield line, attrs["class"]
+
+    def element_texts(self, tag: str):
+        """Yield (line, attrs, text) for each `tag` element.
+
+        text is the space-joined visible text of all descendants. Elements
+        left unclosed at the end of the document are still yielded.
+        """
+        open_elements = []   # [(line, attrs, [text, ...])]
+        for event in self.events:
+            kind = event[0]
+            if kind == "start" and event[2] == tag:
+                open_elements.append((event[1], event[3], []))
+            elif kind == "text":
+                for _, _, parts in open_elements:
+                    parts.append(event[2])
+            elif kind == "end" and event[2] == tag and open_elements:
+                line, attrs, parts = open_elements.pop()
+                yield line, attrs, " ".join(parts)
+        for line, attrs, parts in reversed(open_elements):
+            yield line, attrs, " ".join(parts)
+
+    # --- Serialization ---
+
+    def to_json(self) -> dict:
+        return {"version": IR_VERSION, "hash": self.content_hash,
+                "events": self.events}
+
+    @classmethod
+    def from_json(cls, data: dict):
+        return cls(data["events"], data.get("hash", ""))
+
+
+class IRBuilder(EventParser):
+    """EventParser that records every event into a DocumentIR."""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def on_decl(self, decl):
+        self.events.append(["decl", decl])
+
+    def on_starttag(self, line, tag, attrs):
+        self.events.append(["start", line, tag, attrs])
+
+    def on_endtag(self, line, tag):
+        self.events.append(["end", line, tag])
+
+    def on_text(self, line, text):
+        self.events.append(["text", line, text])
+
+    def on_style_block(self, line, css):
+        self.events.append(["style", line, css])
+
+    def on_script_block(self, line, js):
+        self.events.append(["script", line, js])
+
+
+# ---------------------------------------------------------------------------
+# Build & Cache
+# ---------------------------------------------------------------------------
+
+def file_hash(abs_path: str) -> str:
+    """SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(abs_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def build_ir(abs_path: str, content_hash: str = "") -> DocumentIR:
+    """Parse a file into a DocumentIR (no cache)."""
+    builder = IRBuilder()
+    feed_file(builder, abs_path)
+    return DocumentIR(builder.events, content_hash)
+
+
+def load_ir(abs_path: str, use_cache: bool = True, cache_dir: str = None) -> DocumentIR:
+    """Return the IR for a file, from the on-disk cache when possible.
+
+    Args:
+        abs_path: Absolute path to the HTML file
+        use_cache: Read/write .tmp/html_ir/ (False: always parse)
+        cache_dir: Override the cache directory
+
+    Returns:
+        DocumentIR for the file's current contents
+    """
+    if not use_cache:
+        return build_ir(abs_path)
+
+    content_hash = file_hash(abs_path)
+    cache_dir = cache_dir or os.path.join(resolve_project_root(), IR_CACHE_DIR)
+    cache_path = os.path.join(cache_dir, f"{content_hash}.json")
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == IR_VERSION:
+            return DocumentIR.from_json(data)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    ir = build_ir(abs_path, content_hash)
+
+    # Write atomically — several worker processes may race on one hash
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(ir.to_json(), f, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Cache is an optimization; a read-only tree still works
+
+    return ir
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build (and cache) the parsed-document IR for an HTML file.",
+        epilog="Example: python3 execution/html_ir.py index.html"
+    )
+    parser.add_argument("filepath", help="HTML file, relative to project root")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the full IR as JSON instead of a summary")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Parse without reading/writing {IR_CACHE_DIR}/")
+    args = parser.parse_args()
+
+    abs_path = os.path.join(resolve_project_root(), args.filepath)
+    if not os.path.isfile(abs_path):
+        print(f"[ERROR] File not found: {abs_path}")
+        sys.exit(1)
+
+    ir = load_ir(abs_path, use_cache=not args.no_cache)
+
+    if args.json:
+        print(json.dumps(ir.to_json()))
+        return
+
+    counts = Counter(event[0] for event in ir.events)
+    tags = Counter(tag for _, tag, _ in ir.elements())
+    print(f"[OK] {args.filepath}")
+    print(f"     Hash:   {ir.content_hash or '(uncached)'}")
+    print(f"     Events: {len(ir.events)} "
+          f"({', '.join(f'{k}={v}' for k, v in sorted(counts.items()))})")
+    print(f"     Top tags: "
+          f"{', '.join(f'{t}={n}' for t, n in tags.most_common(8))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,13 @@ optimize_images.py — Axiara Image Processor (Layer 3 Execution)
 Processes images for the Axiara.id site per brand photography rules:
   1. Converts color photos to grayscale (B&W requirement)
   2. Optionally applies a Crimson (#C41E3A) duotone overlay
-  3. Compresses output to WebP format
+  3. Compresses output to WebP format (optionally AVIF, plus a JPEG fallback)
   4. Generates multiple sizes (375w, 768w, 1440w) for responsive srcset
 
+Each image is decoded once, to grayscale (JPEGs in draft mode, at reduced
+scale when --max-width allows); every size is downscaled from the next
+larger one, and the crimson and B&W sets share those buffers.
+
 Usage:
   python3 execution/optimize_images.py \\
     --input src/assets/images/raw/photo.jpg \\
@@ -24,12 +28,39 @@ Usage:
     --output src/assets/images/ \\
     --crimson-overlay
 
+  # Crimson and pure B&W sets from one decode, full size capped at 2560px
+  python3 execution/optimize_images.py \\
+    --input src/assets/images/raw/ \\
+    --output src/assets/images/ \\
+    --crimson-overlay --also-bw --max-width 2560
+
+  # AVIF and WebP with a JPEG fallback, and <picture> snippets
+  python3 execution/optimize_images.py \\
+    --input src/assets/images/raw/ \\
+    --output src/assets/images/ \\
+    --formats avif,webp,jpeg
+
+  # Check the lookup-table duotone against the per-pixel reference
+  python3 execution/optimize_images.py --parity-check
+
 Arguments:
   --input           Input image file or directory (required)
   --output          Output directory (required)
   --crimson-overlay Apply Crimson (#C41E3A) duotone overlay (optional)
-  --quality         WebP quality 1-100 (default: 80)
+  --also-bw         With --crimson-overlay, also write the pure B&W set
+                    (one decode for both)
+  --max-width       Cap the full-size variant; large JPEGs are then decoded
+                    at 1/2, 1/4 or 1/8 scale (default: original width)
+  --quality         Encoder quality 1-100 (default: 80)
+  --formats         Comma-separated output formats: avif, webp, jpeg
+                    (default: webp); with several, snippets are <picture>
   --sizes           Comma-separated widths (default: 375,768,1440)
+  --jobs            Worker processes (default: all cores; 1 = serial)
+  --split-sizes     With --jobs, encode each (image, size) as its own task
+  --no-cache        Re-encode everything; ignore and do not update
+                    .tmp/optimize_images_cache.json
+  --parity-check    Verify apply_crimson_overlay_lut matches the reference
+                    apply_crimson_overlay for every gray level, then exit
 
 Source of truth:
   - directives/axiara-brand.md § Photography
@@ -40,15 +71,21 @@ Requires: Pillow (pip install Pillow)
 """
 
 import argparse
+import hashlib
+import json
 import os
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 # ---------------------------------------------------------------------------
 # Dependency check
 # ---------------------------------------------------------------------------
 
 try:
-    from PIL import Image, ImageEnhance, ImageFilter
+    import PIL
+    from PIL import Image, ImageEnhance, ImageFilter, features
 except ImportError:
     print("[ERROR] Pillow is required but not installed.")
     print("        Install it with: pip install Pillow")
@@ -64,12 +101,33 @@ CRIMSON = (196, 30, 58)  # #C41E3A
 # Default responsive breakpoints matching directives/qa-checklist.md
 DEFAULT_SIZES = [375, 768, 1440]
 
-# Default WebP quality (good balance of quality and file size)
+# Default encoder quality (good balance of quality and file size)
 DEFAULT_QUALITY = 80
 
+# Output formats: name → (file extension, MIME type, Pillow feature).
+# <picture> snippets list them in this order, smallest files first; the
+# last one written is the <img> fallback.
+OUTPUT_FORMATS = {
+    "avif": (".avif", "image/avif", "avif"),
+    "webp": (".webp", "image/webp", "webp"),
+    "jpeg": (".jpg", "image/jpeg", "jpg"),
+}
+DEFAULT_FORMATS = ["webp"]
+
+# AVIF reaches the look of a given WebP/JPEG quality at a lower setting;
+# --quality is lowered by this much for AVIF (80 → 60)
+AVIF_QUALITY_OFFSET = 20
+
 # Supported input formats
 SUPPORTED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".tiff", ".tif", ".bmp", ".webp"}
 
+# Bump when outputs change without a source change in this file
+PIPELINE_VERSION = "1"
+
+# Cache of earlier runs (relative to project root) and its size bound
+CACHE_FILE = ".tmp/optimize_images_cache.json"
+CACHE_MAX_ENTRIES = 5000
+
 
 # ---------------------------------------------------------------------------
 # Image Processing Functions
@@ -142,10 +200,55 @@ def apply_crimson_overlay(gray_img: Image.Image, opacity: float = 0.25) -> Image
     return result
 
 
+def crimson_duotone_lut(opacity: float = 0.25) -> list[int]:
+    """768-entry (R, G, B) lookup table for the crimson duotone.
+
+    Entry [c * 256 + luma] is channel c of apply_crimson_overlay's pixel
+    for that luma: the same float math and int() truncation, evaluated
+    once per gray level instead of once per pixel.
+    """
+    shadow = CRIMSON
+    highlight = (255, 255, 255)
+    lut = []
+    for channel in range(3):
+        for luma in range(256):
+            t = luma / 255.0
+            duo = int(shadow[channel] * (1 - t) + highlight[channel] * t)
+            lut.append(int(luma * (1 - opacity) + duo * opacity))
+    return lut
+
+
+def apply_crimson_overlay_lut(gray_img: Image.Image, opacity: float = 0.25) -> Image.Image:
+    """Crimson duotone via per-channel lookup tables (C speed).
+    
+    Same mapping as apply_crimson_overlay — shadows → crimson, highlights
+    → white, blended with the gray at `opacity` — applied with one
+    Image.point() pass. Returns RGB: the reference's alpha is always 255.
+    Verified for every gray level by --parity-check.
+    """
+    if gray_img.mode != "L":
+        gray_img = gray_img.convert("L")
+    return gray_img.convert("RGB").point(crimson_duotone_lut(opacity))
+
+
+def check_duotone_parity(opacity: float = 0.25) -> int:
+    """Count gray levels where the LUT duotone differs from the reference.
+    
+    The duotone is a per-pixel function of luma alone, so a 256-pixel
+    ramp holding every gray level covers every possible input.
+    """
+    ramp = Image.new("L", (256, 1))
+    ramp.putdata(range(256))
+    reference = apply_crimson_overlay(ramp, opacity).convert("RGB").tobytes()
+    fast = apply_crimson_overlay_lut(ramp, opacity).tobytes()
+    return sum(1 for i in range(0, len(reference), 3) if reference[i:i + 3] != fast[i:i + 3])
+
+
 def apply_crimson_overlay_fast(gray_img: Image.Image, opacity: float = 0.25) -> Image.Image:
-    """Fast version of crimson overlay using PIL blend operations.
+    """Fast crimson tint using PIL blend operations.
     
-    Preferred over pixel-by-pixel for large images.
+    Not the brand duotone: a flat blend plus contrast boost. Use
+    apply_crimson_overlay_lut for the shadow→crimson/highlight→white look.
     """
     if gray_img.mode != "L":
         gray_img = gray_img.convert("L")
@@ -167,7 +270,7 @@ def apply_crimson_overlay_fast(gray_img: Image.Image, opacity: float = 0.25) ->
     return blended
 
 
-def resize_image(img: Image.Image, target_width: int) -> Image.Image:
+def resize_image(img: Image.Image, target_width: int, source_size: tuple = None) -> Image.Image:
     """Resize image to target width, maintaining aspect ratio.
     
     Uses LANCZOS resampling for highest quality downscaling.
@@ -176,14 +279,15 @@ def resize_image(img: Image.Image, target_width: int) -> Image.Image:
     Args:
         img: PIL Image
         target_width: Target width in pixels
+        source_size: Size the aspect ratio is taken from (default: img.size);
+            pass the original size when resizing an intermediate, so the
+            height matches a direct resize of the original
     
     Returns:
         Resized PIL Image
     """
-    original_width, original_height = img.size
-
-    # Don't upscale
-    if original_width <= target_width:
+    original_width, original_height = source_size or img.size
+    if img.width <= target_width:
         return img.copy()
 
     # Calculate proportional height
@@ -217,132 +321,490 @@ def save_webp(img: Image.Image, output_path: str, quality: int = 80) -> int:
     return os.path.getsize(output_path)
 
 
+def save_avif(img: Image.Image, output_path: str, quality: int = 80) -> int:
+    """Save image as AVIF at the equivalent of a WebP/JPEG quality.
+    
+    Args:
+        img: PIL Image
+        output_path: Output file path
+        quality: Quality 1-100 on the WebP/JPEG scale (see AVIF_QUALITY_OFFSET)
+    
+    Returns:
+        File size in bytes
+    """
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+
+    img.save(output_path, "AVIF", quality=max(1, quality - AVIF_QUALITY_OFFSET), speed=6)
+    return os.path.getsize(output_path)
+
+
+def save_jpeg(img: Image.Image, output_path: str, quality: int = 80) -> int:
+    """Save image as progressive JPEG, the fallback for browsers without WebP/AVIF.
+    
+    Args:
+        img: PIL Image
+        output_path: Output file path
+        quality: JPEG quality 1-100
+    
+    Returns:
+        File size in bytes
+    """
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+
+    img.save(output_path, "JPEG", quality=quality, optimize=True, progressive=True)
+    return os.path.getsize(output_path)
+
+
+# Encoder per output format (see OUTPUT_FORMATS)
+ENCODERS = {"avif": save_avif, "webp": save_webp, "jpeg": save_jpeg}
+
+
+def available_formats() -> list[str]:
+    """Output formats this Pillow build can encode, in OUTPUT_FORMATS order."""
+    return [fmt for fmt, (_, _, feature) in OUTPUT_FORMATS.items() if features.check(feature)]
+
+
 # ---------------------------------------------------------------------------
 # Processing Pipeline
 # ---------------------------------------------------------------------------
 
+def full_size(original_size: tuple, max_width: int = None) -> tuple:
+    """Size of the full-size variant: the original, capped at max_width."""
+    width, height = original_size
+    if max_width and width > max_width:
+        return max_width, int(height * max_width / width)
+    return width, height
+
+
+def decode_image(input_path: str, max_width: int = None) -> tuple:
+    """Decode an image once, straight to grayscale where the format allows.
+    
+    JPEGs are decoded in draft mode: luma only (the pipeline drops the
+    color anyway) and, when the full-size variant is at most half the
+    source width, at a reduced DCT scale (1/2, 1/4 or 1/8) that still
+    covers it. Other formats are decoded in full.
+    
+    Returns:
+        (grayscale image, original size)
+    """
+    img = Image.open(input_path)
+    original_size = img.size
+    img.draft("L", full_size(original_size, max_width))
+    return to_grayscale(img), original_size
+
+
+def treatment_suffixes(crimson_overlay: bool = False, also_bw: bool = False) -> list[str]:
+    """Output name suffix per treatment: "-crimson" for the duotone, "" for pure B&W."""
+    if not crimson_overlay:
+        return [""]
+    return ["-crimson", ""] if also_bw else ["-crimson"]
+
+
+def treatment_lines(crimson_overlay: bool = False, also_bw: bool = False) -> list[str]:
+    """Progress lines describing the treatments."""
+    return ["    → Grayscale + Crimson overlay applied" if suffix
+            else "    → Grayscale conversion applied"
+            for suffix in treatment_suffixes(crimson_overlay, also_bw)]
+
+
+def apply_treatment(gray: Image.Image, suffix: str) -> Image.Image:
+    """Brand treatment for one output set (see treatment_suffixes)."""
+    if suffix == "-crimson":
+        return apply_crimson_overlay_lut(gray, opacity=0.25)
+    return gray.convert("RGB")
+
+
+def prepare_image(input_path: str, crimson_overlay: bool = False, also_bw: bool = False,
+                  max_width: int = None, log=print):
+    """Open an image and decode it to grayscale (steps 1-2 of the pipeline).
+    
+    Returns:
+        (basename, grayscale image, original size)
+    """
+    basename = os.path.splitext(os.path.basename(input_path))[0]
+
+    # Step 1: Open and decode, converting to grayscale
+    gray, original_size = decode_image(input_path, max_width)
+    log(f"  Processing: {os.path.basename(input_path)} ({original_size[0]}x{original_size[1]})")
+
+    # Step 2: The treatments are applied per variant, from the shared buffers
+    for line in treatment_lines(crimson_overlay, also_bw):
+        log(line)
+
+    return basename, gray, original_size
+
+
+def render_variants(gray: Image.Image, basename: str, suffixes: list[str], sizes: list[int],
+                    original_size: tuple, max_width: int = None):
+    """Yield (suffix, output name without extension, image) per treatment and size.
+    
+    Resizing runs once, on the one-channel grayscale buffer, widest first:
+    each width is downscaled from the nearest larger intermediate rather
+    than from the full image. Every treatment then fans out from those
+    shared buffers, and each treated variant is created only when it is
+    consumed. Per treatment: responsive sizes ascending, then the full size.
+    """
+    full_width = full_size(original_size, max_width)[0]
+    full = gray
+    if gray.width > full_width:
+        full = resize_image(gray, full_width, original_size)
+
+    buffers = {}
+    current = full
+    for width in sorted(set(sizes), reverse=True):
+        if current.width > width:
+            current = resize_image(current, width, original_size)
+        buffers[width] = current
+
+    for suffix in suffixes:
+        for width in sorted(sizes):
+            resized = buffers[width]
+            # Output filename: {basename}{suffix}-{width}w.{ext}
+            yield (suffix, f"{basename}{suffix}-{resized.size[0]}w",
+                   apply_treatment(resized, suffix))
+        # Also save full-size version
+        yield suffix, f"{basename}{suffix}-full", apply_treatment(full, suffix)
+
+
+def output_record(out_path: str, size: tuple, file_size: int, variant: str = "",
+                  fmt: str = "webp") -> tuple:
+    """Result entry and progress line for one written variant."""
+    record = {
+        "path": out_path,
+        "variant": variant,
+        "format": fmt,
+        "width": size[0],
+        "height": size[1],
+        "size_bytes": file_size,
+    }
+    line = (f"    → {os.path.basename(out_path)} ({size[0]}x{size[1]}, "
+            f"{file_size / 1024:.1f}KB)")
+    return record, line
+
+
 def process_single_image(
     input_path: str,
     output_dir: str,
     crimson_overlay: bool = False,
     quality: int = DEFAULT_QUALITY,
     sizes: list[int] = None,
+    also_bw: bool = False,
+    max_width: int = None,
+    formats: list[str] = None,
+    log=print,
 ) -> dict:
     """Process a single image through the full Axiara pipeline.
     
     Pipeline:
-      1. Open original image
-      2. Convert to grayscale
-      3. (Optional) Apply crimson overlay
-      4. Generate responsive sizes
-      5. Save as WebP
+      1. Open and decode the original once, to grayscale
+      2. Generate responsive sizes (cascaded, on the grayscale buffer)
+      3. (Optional) Apply crimson overlay, per variant
+      4. Save in each output format (WebP by default)
     
     Args:
         input_path: Path to input image
         output_dir: Output directory
         crimson_overlay: Whether to apply crimson duotone
-        quality: WebP quality 1-100
+        quality: Encoder quality 1-100
         sizes: List of target widths
+        also_bw: With crimson_overlay, also write the pure B&W set
+        max_width: Cap for the full-size variant (default: original width)
+        formats: Output formats, keys of OUTPUT_FORMATS (default: webp)
+        log: Called with each progress line (default: print)
     
     Returns:
         Dict with processing results
     """
     if sizes is None:
         sizes = DEFAULT_SIZES
+    if formats is None:
+        formats = DEFAULT_FORMATS
 
-    # Extract filename without extension
-    basename = os.path.splitext(os.path.basename(input_path))[0]
-
-    # Open image
-    img = Image.open(input_path)
-    original_size = img.size
-    print(f"  Processing: {os.path.basename(input_path)} ({original_size[0]}x{original_size[1]})")
-
-    # Step 1: Convert to grayscale
-    gray = to_grayscale(img)
-
-    # Step 2: Apply crimson overlay if requested
-    if crimson_overlay:
-        processed = apply_crimson_overlay_fast(gray, opacity=0.25)
-        suffix = "-crimson"
-        print(f"    → Grayscale + Crimson overlay applied")
-    else:
-        processed = gray.convert("RGB")
-        suffix = ""
-        print(f"    → Grayscale conversion applied")
+    basename, gray, original_size = prepare_image(
+        input_path, crimson_overlay, also_bw, max_width, log)
 
-    # Step 3: Generate responsive sizes and save as WebP
+    # Steps 2-4: Generate responsive sizes, apply treatments, encode
     results = {
         "input": input_path,
         "original_size": original_size,
         "outputs": [],
     }
 
-    for width in sorted(sizes):
-        resized = resize_image(processed, width)
-        actual_w, actual_h = resized.size
-
-        # Output filename: {basename}{suffix}-{width}w.webp
-        out_filename = f"{basename}{suffix}-{actual_w}w.webp"
-        out_path = os.path.join(output_dir, out_filename)
-
-        file_size = save_webp(resized, out_path, quality=quality)
-        results["outputs"].append({
-            "path": out_path,
-            "width": actual_w,
-            "height": actual_h,
-            "size_bytes": file_size,
-        })
-        print(f"    → {out_filename} ({actual_w}x{actual_h}, "
-              f"{file_size / 1024:.1f}KB)")
-
-    # Also save full-size version
-    out_filename = f"{basename}{suffix}-full.webp"
-    out_path = os.path.join(output_dir, out_filename)
-    file_size = save_webp(processed, out_path, quality=quality)
-    results["outputs"].append({
-        "path": out_path,
-        "width": processed.size[0],
-        "height": processed.size[1],
-        "size_bytes": file_size,
-    })
-    print(f"    → {out_filename} ({processed.size[0]}x{processed.size[1]}, "
-          f"{file_size / 1024:.1f}KB)")
+    suffixes = treatment_suffixes(crimson_overlay, also_bw)
+    written = {}   # out_path -> file size; sizes wider than the source share a file
+    for suffix, stem, variant in render_variants(
+            gray, basename, suffixes, sizes, original_size, max_width):
+        for fmt in formats:
+            out_path = os.path.join(output_dir, stem + OUTPUT_FORMATS[fmt][0])
+            if out_path not in written:
+                written[out_path] = ENCODERS[fmt](variant, out_path, quality=quality)
+            file_size = written[out_path]
+            record, line = output_record(out_path, variant.size, file_size, suffix, fmt)
+            results["outputs"].append(record)
+            log(line)
 
     return results
 
 
-def generate_srcset_snippet(results: dict) -> str:
+# ---------------------------------------------------------------------------
+# Parallel Processing
+# ---------------------------------------------------------------------------
+
+def _process_captured(input_path: str, **options) -> tuple:
+    """Worker: process one image, returning its progress lines instead of printing."""
+    lines = []
+    results = process_single_image(input_path, log=lines.append, **options)
+    return results, lines
+
+
+def _process_split(pool, input_files, jobs, output_dir, crimson_overlay, quality, sizes,
+                   also_bw=False, max_width=None, formats=None):
+    """Yield (results, lines) per image with every encode a separate task.
+
+    Decoding, resizing and the brand treatments run here (they are fast C
+    operations); the encodes, which dominate, go to the pool. At most
+    `jobs` images are in flight, so memory stays bounded on large shoots.
+    Sizes wider than the source map to the same file; it is submitted
+    once and its result reused, so two workers never write one path.
+    """
+    pending = deque()
+
+    def finish(entry):
+        input_path, original_size, lines, tasks = entry
+        results = {"input": input_path, "original_size": original_size, "outputs": []}
+        for out_path, size, suffix, fmt, future in tasks:
+            record, line = output_record(out_path, size, future.result(), suffix, fmt)
+            results["outputs"].append(record)
+            lines.append(line)
+        return results, lines
+
+    for input_path in input_files:
+        lines = []
+        basename, gray, original_size = prepare_image(
+            input_path, crimson_overlay, also_bw, max_width, lines.append)
+        tasks = []
+        submitted = {}   # out_path -> future; each file is encoded by one worker only
+        suffixes = treatment_suffixes(crimson_overlay, also_bw)
+        for suffix, stem, variant in render_variants(
+                gray, basename, suffixes, sizes, original_size, max_width):
+            for fmt in formats or DEFAULT_FORMATS:
+                out_path = os.path.join(output_dir, stem + OUTPUT_FORMATS[fmt][0])
+                if out_path not in submitted:
+                    submitted[out_path] = pool.submit(ENCODERS[fmt], variant, out_path, quality)
+                tasks.append((out_path, variant.size, suffix, fmt, submitted[out_path]))
+        pending.append((input_path, original_size, lines, tasks))
+        while len(pending) > jobs:
+            yield finish(pending.popleft())
+    while pending:
+        yield finish(pending.popleft())
+
+
+def process_many(input_files: list[str], jobs: int = 1, split_sizes: bool = False,
+                 **options):
+    """Yield (results, progress lines) for each image, in input order.
+
+    jobs <= 1 processes serially and prints progress live (lines is then
+    empty). Otherwise images — or, with split_sizes, individual
+    (image, size) encodes — are spread over a process pool; each image's
+    lines are handed back in input order, so the printed output matches
+    a serial run.
+    """
+    if jobs <= 1 or (len(input_files) <= 1 and not split_sizes):
+        for input_path in input_files:
+            yield process_single_image(input_path, **options), []
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        if split_sizes:
+            yield from _process_split(pool, input_files, jobs, **options)
+        else:
+            yield from pool.map(partial(_process_captured, **options), input_files)
+
+
+def generate_srcset_snippet(results: dict, variant: str = "") -> str:
     """Generate an HTML srcset snippet for the processed image.
     
-    Returns a ready-to-paste <img> tag with srcset for responsive loading.
+    Returns a ready-to-paste <img> tag with srcset for responsive loading,
+    for one treatment's outputs (variant "-crimson" or "" for pure B&W).
+    With several formats the <img> is wrapped in a <picture>: one <source>
+    per format, smallest first (OUTPUT_FORMATS order), and the last format
+    as the <img> fallback for browsers that support none of them.
     """
-    outputs = sorted(results["outputs"], key=lambda o: o["width"])
+    outputs = sorted((o for o in results["outputs"] if o["variant"] == variant),
+                     key=lambda o: o["width"])
     # Exclude the "full" size from srcset (it's a fallback)
-    sized = [o for o in outputs if not o["path"].endswith("-full.webp")]
+    sized = [o for o in outputs if not os.path.splitext(o["path"])[0].endswith("-full")]
 
     if not sized:
         return ""
 
-    srcset_parts = []
-    for o in sized:
-        rel_path = o["path"]
-        srcset_parts.append(f"{rel_path} {o['width']}w")
-
-    srcset = ",\n             ".join(srcset_parts)
-    default_src = sized[-1]["path"]  # Largest size as default
+    formats = [fmt for fmt in OUTPUT_FORMATS if any(o["format"] == fmt for o in sized)]
+
+    def attributes(fmt: str, pad: str) -> tuple:
+        """(srcset, sizes) attribute lines for one format, continued at `pad`."""
+        srcset_parts = [f"{o['path']} {o['width']}w" for o in sized if o["format"] == fmt]
+        srcset = f",\n{pad}        ".join(srcset_parts)
+        return (f'{pad}srcset="{srcset}"\n'
+                f'{pad}sizes="(max-width: 375px) 375px,\n'
+                f'{pad}       (max-width: 768px) 768px,\n'
+                f'{pad}       1440px"')
+
+    fallback = formats[-1]
+    default_src = [o for o in sized if o["format"] == fallback][-1]["path"]  # Largest size
+
+    if len(formats) == 1:
+        return (
+            f'<img src="{default_src}"\n'
+            f'{attributes(fallback, "     ")}\n'
+            f'     alt=""\n'
+            f'     loading="lazy">'
+        )
 
+    sources = "".join(
+        f'  <source type="{OUTPUT_FORMATS[fmt][1]}"\n{attributes(fmt, "          ")}>\n'
+        for fmt in formats[:-1])
     return (
-        f'<img src="{default_src}"\n'
-        f'     srcset="{srcset}"\n'
-        f'     sizes="(max-width: 375px) 375px,\n'
-        f'            (max-width: 768px) 768px,\n'
-        f'            1440px"\n'
-        f'     alt=""\n'
-        f'     loading="lazy">'
+        f'<picture>\n'
+        f'{sources}'
+        f'  <img src="{default_src}"\n'
+        f'{attributes(fallback, "       ")}\n'
+        f'       alt=""\n'
+        f'       loading="lazy">\n'
+        f'</picture>'
     )
 
 
+# ---------------------------------------------------------------------------
+# Incremental Cache
+# ---------------------------------------------------------------------------
+
+class ImageCache:
+    """Outputs of earlier runs, keyed by source content and options.
+
+    An image is re-encoded only when its source bytes, its name, the
+    options (sizes, quality, overlay) or the pipeline (this script, the
+    Pillow and encoder versions) changed — or when one of its recorded
+    outputs is missing or no longer matches. Source hashes are memoized
+    by (size, mtime), so an unchanged shoot is not even re-read.
+    """
+
+    def __init__(self, path: str, enabled: bool = True):
+        self.path = path
+        self.enabled = enabled
+        self.pipeline = pipeline_hash()
+        self.entries = {}        # {key: {"original_size": [w, h], "outputs": [...]}}
+        self.sources = {}        # {abs path: [size, mtime_ns, sha256]}
+        self.dirty = False
+        if not enabled:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.sources = data.get("sources", {})
+        if data.get("pipeline") == self.pipeline:
+            self.entries = data.get("entries", {})
+
+    def source_hash(self, path: str) -> str:
+        stat = os.stat(path)
+        known = self.sources.get(path)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+        digest = file_sha256(path)
+        self.sources[path] = [stat.st_size, stat.st_mtime_ns, digest]
+        self.dirty = True
+        return digest
+
+    def key(self, path: str, **options) -> str:
+        """Cache key for a source file and the options that shape its outputs."""
+        if not self.enabled:
+            return ""
+        basename = os.path.splitext(os.path.basename(path))[0]
+        material = [self.source_hash(path), basename, options]
+        return hashlib.sha256(json.dumps(material, sort_keys=True).encode()).hexdigest()
+
+    def lookup(self, key: str, input_path: str, output_dir: str):
+        """Results of an earlier run if all of its outputs are still in place."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        outputs = []
+        for output in entry["outputs"]:
+            out_path = os.path.join(output_dir, output["file"])
+            if not os.path.isfile(out_path) or os.path.getsize(out_path) != output["size_bytes"] \
+                    or file_sha256(out_path) != output["sha256"]:
+                return None
+            outputs.append({"path": out_path, **{k: v for k, v in output.items()
+                                                 if k not in ("file", "sha256")}})
+        return {"input": input_path, "original_size": tuple(entry["original_size"]),
+                "outputs": outputs}
+
+    def store(self, key: str, results: dict) -> None:
+        if not self.enabled:
+            return
+        self.entries[key] = {
+            "original_size": list(results["original_size"]),
+            "outputs": [{"file": os.path.basename(o["path"]),
+                         **{k: v for k, v in o.items() if k != "path"},
+                         "sha256": file_sha256(o["path"])} for o in results["outputs"]],
+        }
+        self.dirty = True
+
+    def save(self) -> None:
+        """Persist atomically, keeping the newest entries."""
+        if not (self.enabled and self.dirty):
+            return
+        keys = list(self.entries)[-CACHE_MAX_ENTRIES:]
+        data = {
+            "pipeline": self.pipeline,
+            "sources": self.sources,
+            "entries": {key: self.entries[key] for key in keys},
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+def pipeline_hash() -> str:
+    """Hash of the pipeline version, the encoder versions and this script's source.
+
+    Any edit to the processing code changes the source bytes, so outputs
+    of an older pipeline are never reused.
+    """
+    digest = hashlib.sha256()
+    digest.update(PIPELINE_VERSION.encode())
+    encoders = "|".join(str(features.version(feature))
+                        for _, _, feature in OUTPUT_FORMATS.values())
+    digest.update(f"{PIL.__version__}|{encoders}".encode())
+    with open(os.path.abspath(__file__), "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def progress_lines(results: dict, crimson_overlay: bool, also_bw: bool = False) -> list[str]:
+    """The progress lines process_single_image printed for these results."""
+    width, height = results["original_size"]
+    lines = [f"  Processing: {os.path.basename(results['input'])} ({width}x{height})"]
+    lines += treatment_lines(crimson_overlay, also_bw)
+    for output in results["outputs"]:
+        lines.append(output_record(output["path"], (output["width"], output["height"]),
+                                   output["size_bytes"])[1])
+    return lines
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -350,34 +812,78 @@ def generate_srcset_snippet(results: dict) -> str:
 def main():
     parser = argparse.ArgumentParser(
         description="Axiara Image Processor — B&W conversion, "
-                    "crimson overlay, WebP compression, responsive sizes.",
+                    "crimson overlay, WebP/AVIF compression, responsive sizes.",
         epilog="Example: python3 execution/optimize_images.py "
                "--input src/assets/images/raw/hero.jpg "
                "--output src/assets/images/ --crimson-overlay"
     )
     parser.add_argument(
-        "--input", required=True,
-        help="Input image file or directory of images"
+        "--input",
+        help="Input image file or directory of images (required)"
     )
     parser.add_argument(
-        "--output", required=True,
-        help="Output directory for processed images"
+        "--output",
+        help="Output directory for processed images (required)"
     )
     parser.add_argument(
         "--crimson-overlay", action="store_true",
         help="Apply Crimson (#C41E3A) duotone overlay"
     )
+    parser.add_argument(
+        "--also-bw", action="store_true",
+        help="With --crimson-overlay, also write the pure B&W set from the same decode"
+    )
+    parser.add_argument(
+        "--max-width", type=int, default=None,
+        help="Cap the full-size variant at this width; large JPEGs are then "
+             "decoded at reduced scale (default: original width)"
+    )
     parser.add_argument(
         "--quality", type=int, default=DEFAULT_QUALITY,
-        help=f"WebP quality 1-100 (default: {DEFAULT_QUALITY})"
+        help=f"Encoder quality 1-100 (default: {DEFAULT_QUALITY})"
+    )
+    parser.add_argument(
+        "--formats", type=str, default=None,
+        help="Comma-separated output formats, from: " + ", ".join(OUTPUT_FORMATS)
+             + f" (default: {','.join(DEFAULT_FORMATS)}); several give <picture> snippets"
     )
     parser.add_argument(
         "--sizes", type=str, default=None,
         help="Comma-separated widths (default: 375,768,1440)"
     )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Worker processes (default: all cores; 1 = serial)"
+    )
+    parser.add_argument(
+        "--split-sizes", action="store_true",
+        help="Distribute (image, size) encodes instead of whole images; "
+             "for a few large images on many cores"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Re-encode every image; ignore and do not update {CACHE_FILE}"
+    )
+    parser.add_argument(
+        "--parity-check", action="store_true",
+        help="Verify the lookup-table duotone against the per-pixel reference and exit"
+    )
 
     args = parser.parse_args()
 
+    if args.parity_check:
+        failures = 0
+        for opacity in (0.0, 0.25, 0.5, 1.0):
+            mismatches = check_duotone_parity(opacity)
+            failures += mismatches
+            status = "[OK]" if not mismatches else "[ERROR]"
+            print(f"{status} opacity {opacity:.2f}: {mismatches} of 256 gray levels differ")
+        sys.exit(1 if failures else 0)
+    if not args.input or not args.output:
+        parser.error("--input and --output are required")
+    if args.also_bw and not args.crimson_overlay:
+        parser.error("--also-bw requires --crimson-overlay")
+
     # Resolve paths relative to project root
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
@@ -390,6 +896,23 @@ def main():
     if args.sizes:
         sizes = [int(s.strip()) for s in args.sizes.split(",")]
 
+    # Parse formats; skip (with a warning) those this Pillow build cannot encode
+    formats = DEFAULT_FORMATS
+    if args.formats:
+        requested = [f.strip().lower() for f in args.formats.split(",") if f.strip()]
+        unknown = [f for f in requested if f not in OUTPUT_FORMATS]
+        if unknown:
+            parser.error(f"unknown format(s): {', '.join(unknown)} "
+                         f"(choose from {', '.join(OUTPUT_FORMATS)})")
+        supported = available_formats()
+        for fmt in requested:
+            if fmt not in supported:
+                print(f"[WARN] This Pillow build cannot encode {fmt.upper()}; skipping it")
+        formats = [fmt for fmt in OUTPUT_FORMATS if fmt in requested and fmt in supported]
+        if not formats:
+            print("[ERROR] None of the requested formats can be encoded")
+            sys.exit(1)
+
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
 
@@ -416,9 +939,15 @@ def main():
     print(f"{'=' * 50}")
     print(f"  Input:   {args.input}")
     print(f"  Output:  {args.output}")
-    print(f"  Overlay: {'Crimson #C41E3A' if args.crimson_overlay else 'None (pure B&W)'}")
+    overlay = "Crimson #C41E3A" if args.crimson_overlay else "None (pure B&W)"
+    if args.also_bw:
+        overlay += " + pure B&W"
+    print(f"  Overlay: {overlay}")
     print(f"  Quality: {args.quality}")
     print(f"  Sizes:   {', '.join(str(s) + 'w' for s in sizes)}")
+    if args.max_width:
+        print(f"  Full:    up to {args.max_width}w")
+    print(f"  Formats: {', '.join(fmt.upper() for fmt in formats)}")
     print(f"  Files:   {len(input_files)}")
     print(f"{'=' * 50}\n")
 
@@ -426,27 +955,50 @@ def main():
     total_input_size = 0
     total_output_size = 0
 
+    # Reuse outputs of earlier runs for unchanged sources and options
+    cache = ImageCache(os.path.join(project_root, CACHE_FILE), enabled=not args.no_cache)
+    options = {
+        "crimson_overlay": args.crimson_overlay,
+        "quality": args.quality,
+        "sizes": sorted(sizes),
+        "also_bw": args.also_bw,
+        "max_width": args.max_width,
+        "formats": formats,
+    }
+    keys = {path: cache.key(path, **options) for path in input_files}
+    reused = {path: cache.lookup(keys[path], path, output_dir) for path in input_files}
+    todo = [path for path in input_files if reused[path] is None]
+
+    processed = process_many(
+        todo,
+        jobs=args.jobs,
+        split_sizes=args.split_sizes,
+        output_dir=output_dir,
+        **options,
+    )
     for filepath in input_files:
+        if reused[filepath] is not None:
+            results = reused[filepath]
+            lines = progress_lines(results, args.crimson_overlay, args.also_bw)
+        else:
+            results, lines = next(processed)
+            cache.store(keys[filepath], results)
+        for line in lines:
+            print(line)
         total_input_size += os.path.getsize(filepath)
-        results = process_single_image(
-            input_path=filepath,
-            output_dir=output_dir,
-            crimson_overlay=args.crimson_overlay,
-            quality=args.quality,
-            sizes=sizes,
-        )
         all_results.append(results)
 
         for output in results["outputs"]:
             total_output_size += output["size_bytes"]
 
-        # Print srcset snippet
-        snippet = generate_srcset_snippet(results)
-        if snippet:
-            print(f"\n    HTML srcset snippet:")
-            for line in snippet.split("\n"):
-                print(f"    {line}")
-            print()
+        # Print srcset snippet, one per treatment
+        for variant in dict.fromkeys(o["variant"] for o in results["outputs"]):
+            snippet = generate_srcset_snippet(results, variant)
+            if snippet:
+                print(f"\n    HTML srcset snippet:")
+                for line in snippet.split("\n"):
+                    print(f"    {line}")
+                print()
 
     # Summary
     print(f"\n{'=' * 50}")
@@ -456,8 +1008,12 @@ def main():
     if total_input_size > 0:
         ratio = (1 - total_output_size / total_input_size) * 100
         print(f"  Savings:      {ratio:.1f}%")
+    if cache.enabled:
+        print(f"  [CACHE] {len(todo)} encoded, {len(input_files) - len(todo)} reused")
     print(f"{'=' * 50}\n")
 
+    cache.save()
+
 
 if __name__ == "__main__":
     main()
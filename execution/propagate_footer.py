@@ -1,67 +1,94 @@
 import os
 
-def propagate_footer():
-    # Configuration
-    footer_source_path = 'src/components/footer.html'
-    target_files = [
-        'about.html',
-        'careers.html',
-        'legal/privacy.html',
-        'legal/terms.html',
-        'services/index.html',
-        'technology/index.html',
-        'industries/index.html',
-        'compliance/index.html'
-    ]
+from site_deps import build_embed_index, resolve_project_root
+
+# Configuration
+FOOTER_SOURCE = 'src/components/footer.html'
+
+# Pages built by execution/build_components.py carry this marker and are refreshed there
+FOOTER_MARKER = f'<!-- component: {FOOTER_SOURCE} -->'
+
+# Snapshots and component test harnesses that are not kept in sync
+EXCLUDE_PATHS = ('axiara-deploy-v1/', 'src/test_')
+
+
+def footer_pages(project_root):
+    """Pages embedding a copy of the footer, from the site dependency graph."""
+    index = build_embed_index(project_root)
+    return sorted(page for page in index.get(FOOTER_SOURCE, ())
+                  if not page.startswith(EXCLUDE_PATHS))
+
+
+def replace_footer(content, footer_content):
+    """Return `content` with its footer block replaced, or None if it has none."""
+    # Find the footer block
+    start_marker = '<footer id="axiara-footer"'
+    end_marker = '</footer>'
+
+    start_index = content.find(start_marker)
+    if start_index == -1:
+        return None
+
+    # Find the end of the footer block (after the start)
+    # We need to find the closing tag corresponding to the footer.
+    # Assuming simple structure where </footer> closes the footer.
+    end_index = content.find(end_marker, start_index)
+    if end_index == -1:
+        return None
+
+    # Replace everything from the '<' of the start marker through the end marker.
+    replacement_end = end_index + len(end_marker)
+
+    return content[:start_index] + footer_content + content[replacement_end:]
+
+
+def propagate_footer(target_files=None):
+    project_root = resolve_project_root()
+    footer_source_path = os.path.join(project_root, FOOTER_SOURCE)
 
     # Read the Golden Master Footer
     try:
         with open(footer_source_path, 'r', encoding='utf-8') as f:
             footer_content = f.read().strip()
     except FileNotFoundError:
-        print(f"Error: Source footer file '{footer_source_path}' not found.")
-        return
+        print(f"Error: Source footer file '{FOOTER_SOURCE}' not found.")
+        return []
 
     print(f"Loaded footer source ({len(footer_content)} bytes).")
 
+    # Every page that embeds the footer, unless the caller narrowed it down
+    if target_files is None:
+        target_files = footer_pages(project_root)
+
     # Process each target file
+    updated = []
     for file_path in target_files:
-        if not os.path.exists(file_path):
+        abs_path = os.path.join(project_root, file_path)
+        if not os.path.exists(abs_path):
             print(f"Skipping {file_path}: File not found.")
             continue
 
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(abs_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Find the footer block
-        start_marker = '<footer id="axiara-footer"'
-        end_marker = '</footer>'
-
-        start_index = content.find(start_marker)
-        if start_index == -1:
-            print(f"Skipping {file_path}: Footer start marker not found.")
+        if FOOTER_MARKER in content:
+            print(f"Skipping {file_path}: Built by execution/build_components.py.")
             continue
 
-        # Find the end of the footer block (after the start)
-        # We need to find the closing tag corresponding to the footer.
-        # Assuming simple structure where </footer> closes the footer.
-        end_index = content.find(end_marker, start_index)
-        if end_index == -1:
-            print(f"Skipping {file_path}: Footer end marker not found.")
+        new_content = replace_footer(content, footer_content)
+        if new_content is None:
+            print(f"Skipping {file_path}: Footer markers not found.")
+            continue
+        if new_content == content:
             continue
 
-        # Include the markers in replacement?
-        # The variables `start_index` points to '<', `end_index` points to '<'.
-        # We want to replace everything from `start_index` to `end_index + len(end_marker)`.
-        
-        replacement_end = end_index + len(end_marker)
-        
-        new_content = content[:start_index] + footer_content + content[replacement_end:]
-
-        with open(file_path, 'w', encoding='utf-8') as f:
+        with open(abs_path, 'w', encoding='utf-8') as f:
             f.write(new_content)
-        
+
         print(f"Updated {file_path}.")
+        updated.append(file_path)
+
+    return updated
 
 if __name__ == "__main__":
     propagate_footer()
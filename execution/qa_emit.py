@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+qa_emit.py — Streaming Findings Emitter for the QA scripts (Layer 3 Execution)
+
+Writes each finding the moment a QA tool reports it, instead of collecting
+every result for one report at the end. Memory stays flat on huge trees
+and downstream tools can consume results while the scan is running.
+
+Used by --format in:
+  - execution/validate_html.py                        (brand rules)
+  - SKILLS/frontend-design/scripts/ux_audit.py        (UX checks)
+  - SKILLS/frontend-design/scripts/accessibility_checker.py
+
+Formats:
+  jsonl   one JSON object per line, flushed per finding:
+            {"type": "finding", "tool": "validate_html", "file": "index.html",
+             "line": 12, "rule": "FONTS", "level": "error", "message": "..."}
+          and a last {"type": "summary", "tool": ..., "summary": {...}} line
+  sarif   one SARIF 2.1.0 log; results are written as they arrive and the
+          run's tool/rule metadata after them (JSON key order is free), so
+          the log is complete once the tool exits
+
+Levels follow SARIF: "error", "warning", "note".
+
+Usage:
+  # Merge JSONL streams from several tools into one SARIF log (one run per tool)
+  python3 execution/validate_html.py . --format jsonl > .tmp/qa.jsonl
+  python3 execution/qa_emit.py .tmp/qa.jsonl > .tmp/qa.sarif
+
+No external dependencies beyond Python standard library.
+"""
+
+import argparse
+import json
+import os
+import sys
+from abc import ABC, abstractmethod
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+FORMATS = ("text", "jsonl", "sarif")
+
+LEVELS = ("error", "warning", "note")
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+def to_uri(path: str) -> str:
+    """Artifact URI for a file path: POSIX separators, no leading ./"""
+    uri = path.replace(os.sep, "/")
+    return uri[2:] if uri.startswith("./") else uri
+
+
+# ---------------------------------------------------------------------------
+# Emitters
+# ---------------------------------------------------------------------------
+
+class Emitter(ABC):
+    """Writes findings for one tool run as they are reported.
+
+    finding() writes and flushes immediately; close() ends the output with
+    the tool's totals. Only running counts are kept. Subclasses define the
+    format through _write_finding() and _write_close().
+    """
+
+    def __init__(self, tool: str, out=None):
+        self.tool = tool
+        self.out = out or sys.stdout
+        self.counts = {level: 0 for level in LEVELS}
+
+    def finding(self, file: str, rule: str, level: str, message: str,
+                line: int = 0) -> None:
+        if level not in LEVELS:
+            raise ValueError(f"level must be one of {LEVELS}, got {level!r}")
+        self.counts[level] += 1
+        self._write_finding(to_uri(file), rule, level, message, line)
+        self.out.flush()
+
+    def close(self, summary: dict = None) -> None:
+        self._write_close(summary or {})
+        self.out.flush()
+
+    @abstractmethod
+    def _write_finding(self, uri, rule, level, message, line):
+        """Write one finding (counts already include it)."""
+
+    @abstractmethod
+    def _write_close(self, summary):
+        """End the output with the summary and the per-level counts."""
+
+
+class JsonlEmitter(Emitter):
+    """One JSON object per line."""
+
+    def _write_finding(self, uri, rule, level, message, line):
+        record = {"type": "finding", "tool": self.tool, "file": uri,
+                  "line": line, "rule": rule, "level": level,
+                  "message": message}
+        self.out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _write_close(self, summary):
+        record = {"type": "summary", "tool": self.tool,
+                  "summary": {**summary, "counts": self.counts}}
+        self.out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class SarifEmitter(Emitter):
+    """A single-run SARIF log, streamed result by result."""
+
+    def __init__(self, tool: str, out=None):
+        super().__init__(tool, out)
+        self.rules = {}          # {rule_id: None}, in first-seen order
+        self.out.write(f'{{"version": "{SARIF_VERSION}", '
+                       f'"$schema": "{SARIF_SCHEMA}", '
+                       f'"runs": [{{"results": [\n')
+
+    def _write_finding(self, uri, rule, level, message, line):
+        self.rules.setdefault(rule, None)
+        separator = ",\n" if sum(self.counts.values()) > 1 else ""
+        self.out.write(separator + json.dumps(sarif_result(uri, rule, level, message, line),
+                                              ensure_ascii=False))
+
+    def _write_close(self, summary):
+        tail = {"tool": sarif_driver(self.tool, self.rules),
+                "properties": {**summary, "counts": self.counts}}
+        # Close "results", then the run's remaining keys
+        self.out.write("\n], " + json.dumps(tail, ensure_ascii=False)[1:] + "]}\n")
+
+
+def sarif_result(uri: str, rule: str, level: str, message: str, line: int) -> dict:
+    location = {"artifactLocation": {"uri": uri}}
+    if line > 0:
+        location["region"] = {"startLine": line}
+    return {"ruleId": rule, "level": level, "message": {"text": message},
+            "locations": [{"physicalLocation": location}]}
+
+
+def sarif_driver(tool: str, rules) -> dict:
+    return {"driver": {"name": tool, "rules": [{"id": rule} for rule in rules]}}
+
+
+def make_emitter(fmt: str, tool: str, out=None):
+    """Emitter for --format, or None for the tool's own text output."""
+    if fmt == "jsonl":
+        return JsonlEmitter(tool, out)
+    if fmt == "sarif":
+        return SarifEmitter(tool, out)
+    if fmt == "text":
+        return None
+    raise ValueError(f"format must be one of {FORMATS}, got {fmt!r}")
+
+
+# ---------------------------------------------------------------------------
+# JSONL → SARIF
+# ---------------------------------------------------------------------------
+
+def jsonl_to_sarif(lines) -> dict:
+    """Merge JSONL findings into one SARIF log, one run per tool."""
+    runs = {}    # {tool: {"rules": {}, "results": [], "properties": {}}}
+    for raw in lines:
+        if not raw.strip():
+            continue
+        record = json.loads(raw)
+        run = runs.setdefault(record["tool"], {"rules": {}, "results": [], "properties": {}})
+        if record.get("type") == "summary":
+            run["properties"] = record["summary"]
+            continue
+        run["rules"].setdefault(record["rule"], None)
+        run["results"].append(sarif_result(record["file"], record["rule"], record["level"],
+                                           record["message"], record.get("line", 0)))
+
+    return {
+        "version": SARIF_VERSION,
+        "$schema": SARIF_SCHEMA,
+        "runs": [{"tool": sarif_driver(tool, run["rules"]), "results": run["results"],
+                  "properties": run["properties"]}
+                 for tool, run in runs.items()],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert QA findings (JSONL from --format jsonl) to one SARIF log.",
+        epilog="Example: python3 execution/qa_emit.py .tmp/qa.jsonl > .tmp/qa.sarif"
+    )
+    parser.add_argument(
+        "inputs", nargs="*",
+        help="JSONL files to merge (default: read stdin)"
+    )
+    args = parser.parse_args()
+
+    lines = []
+    if not args.inputs:
+        lines = sys.stdin
+    for path in args.inputs:
+        if not os.path.isfile(path):
+            print(f"[ERROR] File not found: {path}", file=sys.stderr)
+            sys.exit(1)
+        with open(path, "r", encoding="utf-8") as f:
+            lines.extend(f.readlines())
+
+    try:
+        log = jsonl_to_sarif(lines)
+    except (json.JSONDecodeError, KeyError) as e:
+        print(f"[ERROR] Not a findings stream: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    json.dump(log, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
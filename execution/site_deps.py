@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+site_deps.py — Component → Page Dependency Index (Layer 3 Execution)
+
+Maps every shared file (components, stylesheets, scripts, images) to the
+pages that depend on it, so a change to one component selects exactly the
+pages it can affect.
+
+A page depends on a file when it:
+  - includes, loads or fetches it (<link href>, <script src>, <img src>,
+    <iframe src>, fetch('/src/components/navbar.html'), loadComponent(...),
+    ...). Navigation links (<a href>) are not dependencies: a page does
+    not change when a page it links to does
+  - embeds a copy of a shared component, recognised by the component's
+    root element id (e.g. <footer id="axiara-footer">, as written by
+    execution/propagate_footer.py and execution/build_components.py), or
+    still has the component's placeholder (<div id="navbar-placeholder">)
+  - carries a build-time token: a value execution/generate_page_shell.py
+    writes into pages, tracked as a "token:..." node
+      token:fonts-url   the Google Fonts stylesheet URL
+      token:css-path    the axiara.css location the pages link to
+
+Dependencies are followed transitively through components and assets
+(a page embedding the footer also depends on whatever the footer itself
+references) but stop at pages: nothing depends on a page through it, so
+a change to one page selects that page alone (--self-check verifies it).
+
+Components and tokens are fingerprinted after each build (.tmp/site_deps.json,
+written by execution/build_site.py); --changed selects the pages
+downstream of whatever differs from that build.
+
+Usage:
+  # Pages affected by a component change
+  python3 execution/site_deps.py src/components/footer.html src/css/axiara.css
+
+  # Pages affected by everything changed since a git ref
+  python3 execution/site_deps.py --since origin/main
+
+  # Pages affected by component/token changes since the last build
+  python3 execution/site_deps.py --changed
+
+  # Verify that changing any one page selects only that page
+  python3 execution/site_deps.py --self-check
+
+No external dependencies beyond Python standard library.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import subprocess
+import sys
+from urllib.parse import urlsplit
+
+from check_links import SiteIndex
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Shared components copied into pages, keyed by their root element id
+EMBEDDED_COMPONENTS = {
+    "axiara-navbar": "src/components/navbar.html",
+    "axiara-footer": "src/components/footer.html",
+    # Placeholders execution/build_components.py replaces with the component
+    "navbar-placeholder": "src/components/navbar.html",
+    "footer-placeholder": "src/components/footer.html",
+}
+
+# Shared components; every other .html file is a page, where dependency walks stop
+COMPONENTS_DIR = "src/components/"
+
+# Tags whose URLs are navigation, not dependencies
+NAVIGATION_TAGS = {"a"}
+
+# Component and token fingerprints as of the last build
+BUILD_STATE = ".tmp/site_deps.json"
+
+
+def resolve_project_root() -> str:
+    """Resolve the project root (one level up from execution/)."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(script_dir)
+
+
+# ---------------------------------------------------------------------------
+# Dependency Index
+# ---------------------------------------------------------------------------
+
+def current_tokens() -> dict:
+    """{token node: value} as generate_page_shell.py writes them today."""
+    from generate_page_shell import CSS_FILE, GOOGLE_FONTS_URL
+    return {
+        "token:fonts-url": GOOGLE_FONTS_URL,
+        "token:css-path": CSS_FILE,
+    }
+
+
+def link_path(page: str, url: str) -> str:
+    """Site path a local URL on `page` points at, existing or not ("" if external)."""
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc or not parts.path:
+        return ""
+    if parts.path.startswith("/"):
+        return posixpath.normpath(parts.path.lstrip("/"))
+    return posixpath.normpath(posixpath.join(posixpath.dirname(page), parts.path))
+
+
+def embed_edges(site: SiteIndex, tokens: dict) -> dict:
+    """{component_or_token: {page, ...}} — what each page carries a copy of.
+
+    `tokens` gives the value to look for per token node; pass the values
+    of the last build to find the pages still carrying them.
+    """
+    reverse = {}
+
+    # Embedded copies: the component's root id appears among the page's ids
+    for page, anchors in site.anchors.items():
+        for root_id, component in EMBEDDED_COMPONENTS.items():
+            if root_id in anchors and page != component:
+                reverse.setdefault(component, set()).add(page)
+
+    fonts_url = tokens.get("token:fonts-url")
+    css_path = tokens.get("token:css-path")
+    for page, links in site.links.items():
+        for _, _, attr, url in links:
+            if attr != "href":
+                continue
+            if url == fonts_url:
+                reverse.setdefault("token:fonts-url", set()).add(page)
+            elif css_path and link_path(page, url) == css_path:
+                reverse.setdefault("token:css-path", set()).add(page)
+
+    return reverse
+
+
+def build_dependency_index(root: str, use_cache: bool = True, tokens: dict = None) -> dict:
+    """Build {dependency_path: {dependent_path, ...}} for the site.
+
+    Paths are site-relative POSIX paths, e.g. "src/components/footer.html";
+    build-time tokens appear as "token:..." nodes. Only include, load and
+    fetch edges are recorded; <a href> navigation is not a dependency.
+    Pages are read through the shared IR, so this is one cached parse per page.
+    """
+    site = SiteIndex(root, use_cache=use_cache)
+    reverse = {}
+
+    for page, links in site.links.items():
+        for _, tag, _, url in links:
+            if tag in NAVIGATION_TAGS:
+                continue
+            target, _ = site.resolve(page, url)
+            if target and target != page:
+                reverse.setdefault(target, set()).add(page)
+
+    for node, pages in embed_edges(site, tokens or current_tokens()).items():
+        reverse.setdefault(node, set()).update(pages)
+
+    return reverse
+
+
+def build_embed_index(root: str, use_cache: bool = True, tokens: dict = None) -> dict:
+    """Only the embed and token edges: the pages a build must rewrite."""
+    return embed_edges(SiteIndex(root, use_cache=use_cache), tokens or current_tokens())
+
+
+def is_page(path: str) -> bool:
+    """An .html file outside the shared components."""
+    return path.lower().endswith(".html") and not path.startswith(COMPONENTS_DIR)
+
+
+def dependents(index: dict, changed) -> set:
+    """All files that (transitively) depend on any of `changed`.
+
+    The walk continues through components and assets but stops at pages:
+    a page is selected, but what depends on it is not followed. The
+    changed files themselves are not included unless something else
+    depending on them is.
+    """
+    affected = set()
+    queue = [path for path in changed if not is_page(path)]
+    while queue:
+        path = queue.pop()
+        for dependent in index.get(path, ()):
+            if dependent not in affected:
+                affected.add(dependent)
+                if not is_page(dependent):
+                    queue.append(dependent)
+    return affected
+
+
+def self_check(project_root: str, use_cache: bool = True) -> dict:
+    """{page: [other pages selected]} for pages whose own change selects more than itself."""
+    index = build_dependency_index(project_root, use_cache=use_cache)
+    site_pages = sorted({page for pages in index.values() for page in pages if is_page(page)}
+                        | {node for node in index if is_page(node)})
+    leaks = {}
+    for page in site_pages:
+        others = sorted(dependents(index, [page]) - {page})
+        if others:
+            leaks[page] = others
+    return leaks
+
+
+# ---------------------------------------------------------------------------
+# Build State
+# ---------------------------------------------------------------------------
+
+def fingerprint(project_root: str) -> dict:
+    """{node: fingerprint} for every component (content hash) and token (value)."""
+    nodes = {}
+    for component in sorted(set(EMBEDDED_COMPONENTS.values())):
+        try:
+            with open(os.path.join(project_root, component), "rb") as f:
+                nodes[component] = hashlib.sha256(f.read()).hexdigest()
+        except FileNotFoundError:
+            nodes[component] = ""
+    nodes.update(current_tokens())
+    return nodes
+
+
+def load_build_state(project_root: str) -> dict:
+    """Fingerprints recorded by the last build, {} if there was none."""
+    try:
+        with open(os.path.join(project_root, BUILD_STATE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_build_state(project_root: str, nodes: dict) -> None:
+    path = os.path.join(project_root, BUILD_STATE)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(nodes, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def changed_nodes(previous: dict, current: dict) -> list[str]:
+    """Components and tokens whose fingerprint differs from the last build."""
+    return [node for node in current if previous.get(node) != current[node]]
+
+
+def previous_tokens(previous: dict) -> dict:
+    """Token values as of the last build (today's values if never built)."""
+    return {token: previous.get(token, value) for token, value in current_tokens().items()}
+
+
+# ---------------------------------------------------------------------------
+# Git
+# ---------------------------------------------------------------------------
+
+def git_changed_files(ref: str, project_root: str) -> list[str]:
+    """Files changed relative to a git ref, as project-relative paths.
+
+    Includes committed and uncommitted changes against the ref plus
+    untracked (not ignored) files. Deleted files are included so their
+    dependents are still selected.
+    """
+    def git(*args):
+        result = subprocess.run(
+            ["git", "-C", project_root, *args],
+            capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            print(f"[ERROR] git {' '.join(args)}: {result.stderr.strip()}")
+            sys.exit(1)
+        return result.stdout
+
+    toplevel = git("rev-parse", "--show-toplevel").strip()
+    listed = git("diff", "--name-only", ref, "--").splitlines()
+    listed += git("ls-files", "--others", "--exclude-standard",
+                  "--full-name").splitlines()
+
+    changed = []
+    for name in dict.fromkeys(listed):
+        abs_path = os.path.join(toplevel, name)
+        rel_path = os.path.relpath(abs_path, project_root).replace(os.sep, "/")
+        if not rel_path.startswith(".."):
+            changed.append(rel_path)
+    return changed
+
+
+def affected_pages(changed: list[str], project_root: str, use_cache: bool = True,
+                   tokens: dict = None) -> set:
+    """Changed .html files plus every page depending on any changed file."""
+    index = build_dependency_index(project_root, use_cache=use_cache, tokens=tokens)
+    pages = {path for path in changed if path.lower().endswith(".html")}
+    pages |= dependents(index, changed)
+    return {page for page in pages
+            if os.path.isfile(os.path.join(project_root, page))}
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="List the pages affected by changed components/files.",
+        epilog="Example: python3 execution/site_deps.py src/components/footer.html"
+    )
+    parser.add_argument(
+        "files", nargs="*",
+        help="Changed files, relative to project root"
+    )
+    parser.add_argument(
+        "--since", metavar="REF",
+        help="Use every file changed since this git ref"
+    )
+    parser.add_argument(
+        "--changed", action="store_true",
+        help=f"Use every component/token changed since the last build ({BUILD_STATE})"
+    )
+    parser.add_argument(
+        "--self-check", action="store_true",
+        help="Verify that changing any one page selects only that page; exit 1 if not"
+    )
+    args = parser.parse_args()
+
+    project_root = resolve_project_root()
+    if args.self_check:
+        leaks = self_check(project_root)
+        if leaks:
+            print(f"[ERROR] {len(leaks)} page(s) select other pages when changed:")
+            for page, others in leaks.items():
+                print(f"     {page} → {', '.join(others)}")
+            sys.exit(1)
+        print("[OK] A change to any one page selects only that page")
+        return
+
+    changed = list(args.files)
+    if args.since:
+        changed += git_changed_files(args.since, project_root)
+    tokens = None
+    if args.changed:
+        previous = load_build_state(project_root)
+        changed += changed_nodes(previous, fingerprint(project_root))
+        tokens = previous_tokens(previous)
+
+    if not changed and not args.changed:
+        parser.error("give changed files, --since REF and/or --changed")
+
+    pages = sorted(affected_pages(changed, project_root, tokens=tokens))
+    print(f"[OK] {len(changed)} changed file(s) → {len(pages)} affected page(s)")
+    for page in pages:
+        print(f"     {page}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,34 @@ Usage:
   python3 execution/validate_html.py src/pages/services/sprint.html
   python3 execution/validate_html.py src/pages/technology/episteme.html
 
+  # Site-wide: every .html under a directory or glob, one report
+  python3 execution/validate_html.py .
+  python3 execution/validate_html.py "services/*.html" industries/ --jobs 8
+
+Directory and glob targets are expanded once, validated in a process
+pool across all cores (--jobs), and merged into a single report with a
+single exit code.
+
+Results are cached in .tmp/validate_html_cache.json, keyed by the SHA-256
+of each file's bytes plus a hash of the rule set. Unchanged files replay
+their stored issues; byte-identical files are validated once per run.
+Pass --no-cache to bypass it.
+
+  # Streaming: constant memory, one line per issue as it is found
+  python3 execution/validate_html.py insights/ --stream
+
+  # Machine-readable stream: one JSON line (or SARIF result) per issue,
+  # written as it is found — see execution/qa_emit.py
+  python3 execution/validate_html.py . --format jsonl
+  python3 execution/validate_html.py . --format sarif > .tmp/validate.sarif
+
+  # Watch: one warm process re-validates only changed files on save
+  python3 execution/validate_html.py . --watch
+
+  # CI: only pages changed since a ref, plus dependents of changed
+  # components (navbar, footer, axiara.css — see execution/site_deps.py)
+  python3 execution/validate_html.py . --since origin/main
+
 Checks performed (9 total):
   1. STRUCTURE   — Valid HTML5 doctype, lang attribute, meta viewport
   2. FONTS       — Google Fonts import contains Outfit, Playfair Display, JetBrains Mono
@@ -21,18 +49,35 @@ Checks performed (9 total):
   10. RESP H1      — H1 tags must use .text-hero class
   11. RESP GRIDS   — No multi-column grids on mobile (naked grid-cols-X > 1)
 
+Each check is a Rule subclass registered with @register_rule. Rules
+subscribe to parser events (start tag, text, <style>/<script> block) and
+are evaluated while the document streams through the parser once, so a
+new rule adds no extra pass over the file.
+
 Source of truth:
   - directives/axiara-brand.md (Responsive Rules)
 
 No external dependencies beyond Python standard library.
 """
 
+import argparse
+import glob
+import hashlib
+import json
 import os
 import re
 import sys
-from html.parser import HTMLParser
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import NamedTuple
 
+import contrast
+from contrast import ContrastChecker
+from html_ir import EventParser, feed_file, file_hash, load_ir
+from qa_emit import FORMATS, make_emitter
+
 
 # ---------------------------------------------------------------------------
 # Data Structures
@@ -47,235 +92,245 @@ class Issue(NamedTuple):
 
 
 # ---------------------------------------------------------------------------
-# HTML Parser — extracts structured info from the HTML
+# Rule Registry
 # ---------------------------------------------------------------------------
 
-class AxiaraHTMLParser(HTMLParser):
-    """Custom HTML parser that extracts elements needed for validation.
-    
-    Collects:
-      - Doctype presence
-      - <html lang=""> attribute
-      - <meta> tags (viewport, description)
-      - <link> tags (stylesheets, fonts)
-      - <script> tags
-      - Heading elements (h1-h6) with line numbers
-      - Image elements with alt attributes
-      - Form input elements
-      - Label elements
-      - Class attributes (for Tailwind checks)
-      - Style attributes (for inline style checks)
-      - Raw text content (for emoji scanning)
+class Rule:
+    """Base class for a validation rule.
+
+    A rule subscribes to the shared IR events (see execution/html_ir.py)
+    by overriding the matching hook.
+    The parser only dispatches an event to rules that override its hook,
+    so a rule costs nothing for events it ignores, and every rule is
+    evaluated while the document streams through the parser once.
+
+    Event hooks:
+      on_decl(decl)                 — <!DOCTYPE ...> and other declarations
+      on_starttag(line, tag, attrs) — every start tag (attrs is a dict)
+      on_endtag(line, tag)          — every end tag
+      on_text(line, text)           — visible text (stripped, non-empty)
+      on_style_block(line, css)     — complete <style> block contents
+      on_script_block(line, js)     — complete inline <script> contents
+      finish()                      — end of document (page-level verdicts)
+
+    Issues are reported through self.report(); the parser decides where
+    they go. self.page_path is the absolute path of the page ("" when the
+    events do not come from a file).
     """
 
-    def __init__(self):
-        super().__init__()
-        self.has_doctype = False
-        self.html_lang = None
-        self.meta_viewport = False
-        self.meta_description = False
+    check = ""   # Check category name (matches format_report groups)
 
-        # Font & CSS links
-        self.link_hrefs = []         # [(line, href)]
-        self.script_srcs = []        # [(line, src)]
+    def __init__(self, emit, page_path=""):
+        self._emit = emit
+        self.page_path = page_path
 
-        # Headings: [(line, level)]  e.g., [(10, 1), (25, 2)]
-        self.headings = []
+    def report(self, severity: str, line: int, message: str) -> None:
+        self._emit(Issue(self.check, severity, line, message))
 
-        # Images: [(line, alt_value_or_None)]
-        self.images = []
+    def on_decl(self, decl): pass
+    def on_starttag(self, line, tag, attrs): pass
+    def on_endtag(self, line, tag): pass
+    def on_text(self, line, text): pass
+    def on_style_block(self, line, css): pass
+    def on_script_block(self, line, js): pass
+    def finish(self): pass
 
-        # Form inputs without associated labels
-        self.form_inputs = []        # [(line, input_type, id, name)]
-        self.label_fors = set()      # set of "for" attribute values
 
-        # Classes: [(line, class_string)]
-        self.classes = []
+# Registered rule classes, in report order
+RULES: list[type[Rule]] = []
 
-        # Inline styles: [(line, style_string)]
-        self.styles = []
+EVENT_HOOKS = ("on_decl", "on_starttag", "on_endtag", "on_text",
+               "on_style_block", "on_script_block", "finish")
 
-        # Text content: [(line, text)]
-        self.text_chunks = []
 
-        # Style blocks: [(line, css_text)]
-        self.style_blocks = []
+def register_rule(cls: type[Rule]) -> type[Rule]:
+    """Class decorator — add a rule to the registry."""
+    RULES.append(cls)
+    return cls
 
-        # Current tag tracking
-        self._in_style = False
-        self._style_start_line = 0
-        self._style_content = []
 
-    def handle_decl(self, decl):
-        if decl.lower().startswith("doctype"):
-            self.has_doctype = True
+# ---------------------------------------------------------------------------
+# HTML Parser — dispatches parser events to the registered rules
+# ---------------------------------------------------------------------------
 
-    def handle_starttag(self, tag, attrs):
-        line = self.getpos()[0]
-        attrs_dict = dict(attrs)
+class AxiaraHTMLParser(EventParser):
+    """Single-pass rule dispatcher for the shared IR event stream.
 
-        # <html lang="">
-        if tag == "html":
-            self.html_lang = attrs_dict.get("lang")
+    Works either live (feed()/close(), used by --stream) or as a sink for
+    a cached DocumentIR (ir.replay(parser)). Nothing is buffered per
+    document beyond what each rule keeps for its own verdict.
 
-        # <meta>
-        if tag == "meta":
-            name = attrs_dict.get("name", "").lower()
-            if name == "viewport":
-                self.meta_viewport = True
-            if name == "description":
-                self.meta_description = True
+    Usage:
+        parser = AxiaraHTMLParser(page_path=path)
+        load_ir(path).replay(parser)    # or: feed_file(parser, path)
+        parser.issues   # every Issue reported by the rules
 
-        # <link>
-        if tag == "link":
-            href = attrs_dict.get("href", "")
-            if href:
-                self.link_hrefs.append((line, href))
-
-        # <script>
-        if tag == "script":
-            src = attrs_dict.get("src", "")
-            if src:
-                self.script_srcs.append((line, src))
-
-        # Headings h1-h6
-        if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
-            level = int(tag[1])
-            self.headings.append((line, level))
-
-        # Images
-        if tag == "img":
-            alt = attrs_dict.get("alt")  # None if missing entirely
-            self.images.append((line, alt))
-
-        # Form inputs
-        if tag in ("input", "textarea", "select"):
-            input_type = attrs_dict.get("type", "text")
-            input_id = attrs_dict.get("id", "")
-            input_name = attrs_dict.get("name", "")
-            # Skip hidden inputs — they don't need labels
-            if input_type != "hidden":
-                self.form_inputs.append((line, input_type, input_id, input_name))
+    page_path lets rules resolve page-relative references (CONTRAST reads
+    the stylesheets a page links relative to its directory).
+    """
 
-        # Labels
-        if tag == "label":
-            for_attr = attrs_dict.get("for", "")
-            if for_attr:
-                self.label_fors.add(for_attr)
+    def __init__(self, rules: list[type[Rule]] = None, emit=None, page_path: str = ""):
+        super().__init__()
+        self.issues: list[Issue] = []
+        self._emit = emit or self.issues.append
+        self.rules = [cls(self._emit, page_path)
+                      for cls in (RULES if rules is None else rules)]
 
-        # Classes (for Tailwind checks)
-        class_val = attrs_dict.get("class", "")
-        if class_val:
-            self.classes.append((line, class_val))
+        # Per-event subscriber lists — only rules that override the hook
+        self._subscribers = {
+            hook: [getattr(rule, hook) for rule in self.rules
+                   if getattr(type(rule), hook) is not getattr(Rule, hook)]
+            for hook in EVENT_HOOKS
+        }
 
-        # Inline styles
-        style_val = attrs_dict.get("style", "")
-        if style_val:
-            self.styles.append((line, style_val))
-
-        # <style> block
-        if tag == "style":
-            self._in_style = True
-            self._style_start_line = line
-            self._style_content = []
-
-    def handle_endtag(self, tag):
-        if tag == "style" and self._in_style:
-            self._in_style = False
-            css_text = "\n".join(self._style_content)
-            self.style_blocks.append((self._style_start_line, css_text))
-            self._style_content = []
-
-    def handle_data(self, data):
-        line = self.getpos()[0]
-        if self._in_style:
-            self._style_content.append(data)
-        else:
-            stripped = data.strip()
-            if stripped:
-                self.text_chunks.append((line, stripped))
+    def on_decl(self, decl):
+        for handler in self._subscribers["on_decl"]:
+            handler(decl)
+
+    def on_starttag(self, line, tag, attrs):
+        for handler in self._subscribers["on_starttag"]:
+            handler(line, tag, attrs)
+
+    def on_endtag(self, line, tag):
+        for handler in self._subscribers["on_endtag"]:
+            handler(line, tag)
+
+    def on_text(self, line, text):
+        for handler in self._subscribers["on_text"]:
+            handler(line, text)
+
+    def on_style_block(self, line, css):
+        for handler in self._subscribers["on_style_block"]:
+            handler(line, css)
+
+    def on_script_block(self, line, js):
+        for handler in self._subscribers["on_script_block"]:
+            handler(line, js)
+
+    def finish(self):
+        for handler in self._subscribers["finish"]:
+            handler()
+
+
+def iter_block_lines(start_line: int, text: str):
+    """Yield (line_number, line_text) for each line of a style/script block."""
+    for i, block_line in enumerate(text.split("\n")):
+        yield start_line + i, block_line
 
 
 # ---------------------------------------------------------------------------
-# Validation Checks
+# Validation Rules
 # ---------------------------------------------------------------------------
 
-def check_structure(parser: AxiaraHTMLParser) -> list[Issue]:
+@register_rule
+class StructureRule(Rule):
     """Check 1: STRUCTURE — doctype, lang, viewport.
     Source: directives/build-page.md § Standard Page Structure
     """
-    issues = []
+    check = "STRUCTURE"
 
-    if not parser.has_doctype:
-        issues.append(Issue("STRUCTURE", "FAIL", 0,
-            "Missing <!DOCTYPE html> declaration"))
+    def __init__(self, emit, page_path=""):
+        super().__init__(emit, page_path)
+        self.has_doctype = False
+        self.html_lang = None
+        self.meta_viewport = False
+
+    def on_decl(self, decl):
+        if decl.lower().startswith("doctype"):
+            self.has_doctype = True
+
+    def on_starttag(self, line, tag, attrs):
+        if tag == "html":
+            self.html_lang = attrs.get("lang")
+        elif tag == "meta" and (attrs.get("name") or "").lower() == "viewport":
+            self.meta_viewport = True
 
-    if not parser.html_lang:
-        issues.append(Issue("STRUCTURE", "FAIL", 0,
-            'Missing lang attribute on <html> (expected lang="en")'))
-    elif parser.html_lang.lower() != "en":
-        issues.append(Issue("STRUCTURE", "WARN", 0,
-            f'<html lang="{parser.html_lang}"> — expected "en"'))
+    def finish(self):
+        if not self.has_doctype:
+            self.report("FAIL", 0, "Missing <!DOCTYPE html> declaration")
 
-    if not parser.meta_viewport:
-        issues.append(Issue("STRUCTURE", "FAIL", 0,
-            "Missing <meta name='viewport'> tag"))
+        if not self.html_lang:
+            self.report("FAIL", 0,
+                'Missing lang attribute on <html> (expected lang="en")')
+        elif self.html_lang.lower() != "en":
+            self.report("WARN", 0,
+                f'<html lang="{self.html_lang}"> — expected "en"')
 
-    return issues
+        if not self.meta_viewport:
+            self.report("FAIL", 0, "Missing <meta name='viewport'> tag")
 
 
-def check_fonts(parser: AxiaraHTMLParser) -> list[Issue]:
+@register_rule
+class FontsRule(Rule):
     """Check 2: FONTS — Google Fonts import contains required families.
     Source: directives/axiara-brand.md § Typography (Non-Negotiable)
     """
-    issues = []
-    required_fonts = ["Outfit", "Playfair+Display", "JetBrains+Mono"]
-    alt_fonts = ["Playfair Display", "JetBrains Mono"]  # Space-separated variants
+    check = "FONTS"
 
-    # Search in <link> hrefs and inline @import
-    all_font_refs = []
-    for line, href in parser.link_hrefs:
-        if "fonts.googleapis.com" in href:
-            all_font_refs.append((line, href))
+    # (URL form, space-separated form) — either satisfies the check
+    REQUIRED_FONTS = [
+        ("Outfit", "Outfit"),
+        ("Playfair+Display", "Playfair Display"),
+        ("JetBrains+Mono", "JetBrains Mono"),
+    ]
 
-    for line, css in parser.style_blocks:
-        if "@import" in css and "fonts.googleapis.com" in css:
-            all_font_refs.append((line, css))
+    def __init__(self, emit, page_path=""):
+        super().__init__(emit, page_path)
+        self.font_refs = []   # [(line, href_or_css)] — Google Fonts only
 
-    if not all_font_refs:
-        issues.append(Issue("FONTS", "FAIL", 0,
-            "No Google Fonts import found. Required: Outfit, "
-            "Playfair Display, JetBrains Mono"))
-        return issues
+    def on_starttag(self, line, tag, attrs):
+        # Search in <link> hrefs ...
+        if tag == "link":
+            href = attrs.get("href") or ""
+            if "fonts.googleapis.com" in href:
+                self.font_refs.append((line, href))
 
-    # Check each required font is present
-    combined = " ".join(ref for _, ref in all_font_refs)
-    for i, font in enumerate(required_fonts):
-        if font not in combined and alt_fonts[i - 1] not in combined if i > 0 else font not in combined:
-            # Friendlier display name
-            display = font.replace("+", " ")
-            issues.append(Issue("FONTS", "FAIL", all_font_refs[0][0],
-                f"Google Fonts import missing '{display}'"))
+    def on_style_block(self, line, css):
+        # ... and inline @import
+        if "@import" in css and "fonts.googleapis.com" in css:
+            self.font_refs.append((line, css))
 
-    return issues
+    def finish(self):
+        if not self.font_refs:
+            self.report("FAIL", 0,
+                "No Google Fonts import found. Required: Outfit, "
+                "Playfair Display, JetBrains Mono")
+            return
 
+        # Check each required font is present
+        combined = " ".join(ref for _, ref in self.font_refs)
+        for url_form, display in self.REQUIRED_FONTS:
+            if url_form not in combined and display not in combined:
+                self.report("FAIL", self.font_refs[0][0],
+                    f"Google Fonts import missing '{display}'")
 
-def check_css(parser: AxiaraHTMLParser) -> list[Issue]:
+
+@register_rule
+class CssRule(Rule):
     """Check 3: CSS — page links to axiara.css.
     Source: directives/build-page.md § Standard Page Structure item 4
     """
-    issues = []
-    found = any("axiara.css" in href for _, href in parser.link_hrefs)
-    if not found:
-        issues.append(Issue("CSS", "FAIL", 0,
-            "Missing <link> to axiara.css (the Darkroom kit)"))
-    return issues
+    check = "CSS"
+
+    def __init__(self, emit, page_path=""):
+        super().__init__(emit, page_path)
+        self.found = False
+
+    def on_starttag(self, line, tag, attrs):
+        if tag == "link" and "axiara.css" in (attrs.get("href") or ""):
+            self.found = True
 
+    def finish(self):
+        if not self.found:
+            self.report("FAIL", 0,
+                "Missing <link> to axiara.css (the Darkroom kit)")
 
-def check_emojis(parser: AxiaraHTMLParser) -> list[Issue]:
+
+@register_rule
+class EmojiRule(Rule):
     """Check 4: NO EMOJIS — scan for emoji unicode in text content.
     Source: directives/axiara-brand.md § Icons ("NEVER: Emoji icons")
-    
+
     Scans common emoji ranges:
       - Emoticons (U+1F600–U+1F64F)
       - Misc Symbols (U+1F300–U+1F5FF)
@@ -284,9 +339,10 @@ def check_emojis(parser: AxiaraHTMLParser) -> list[Issue]:
       - Dingbats (U+2702–U+27B0)
       - Misc Symbols & Pictographs (U+2600–U+26FF)
     """
-    issues = []
+    check = "NO EMOJIS"
+
     # Comprehensive emoji regex pattern
-    emoji_pattern = re.compile(
+    EMOJI_PATTERN = re.compile(
         "["
         "\U0001F600-\U0001F64F"  # Emoticons
         "\U0001F300-\U0001F5FF"  # Misc Symbols and Pictographs
@@ -303,259 +359,327 @@ def check_emojis(parser: AxiaraHTMLParser) -> list[Issue]:
         "]"
     )
 
-    for line, text in parser.text_chunks:
-        matches = emoji_pattern.findall(text)
+    def on_text(self, line, text):
+        matches = self.EMOJI_PATTERN.findall(text)
         if matches:
             emojis = " ".join(matches[:5])  # Show first 5
-            issues.append(Issue("NO EMOJIS", "FAIL", line,
-                f"Emoji found in text: {emojis} — use Lucide SVG icons instead"))
-
-    return issues
+            self.report("FAIL", line,
+                f"Emoji found in text: {emojis} — use Lucide SVG icons instead")
 
 
-def check_border_radius(parser: AxiaraHTMLParser, raw_lines: list[str]) -> list[Issue]:
+@register_rule
+class BorderRadiusRule(Rule):
     """Check 5: BORDER RADIUS — no border-radius > 0.
     Source: directives/axiara-brand.md § Border Radius
     "0px on EVERYTHING. No exceptions. Knife-edge apex."
-    
+
     Scans for:
       - Tailwind "rounded-" classes (except "rounded-none")
       - Inline/CSS border-radius values > 0
     """
-    issues = []
+    check = "BORDER RADIUS"
 
-    # Check Tailwind classes
-    rounded_pattern = re.compile(r'\brounded(?!-none)\b[\w-]*')
-    for line, class_str in parser.classes:
-        matches = rounded_pattern.findall(class_str)
-        if matches:
-            issues.append(Issue("BORDER RADIUS", "FAIL", line,
-                f"Tailwind rounded class found: {', '.join(matches)} — "
-                "must be 0px (knife-edge apex)"))
-
-    # Check inline styles
-    br_pattern = re.compile(r'border-radius\s*:\s*(\d+)')
-    for line, style_str in parser.styles:
-        match = br_pattern.search(style_str)
-        if match and int(match.group(1)) > 0:
-            issues.append(Issue("BORDER RADIUS", "FAIL", line,
-                f"Inline border-radius: {match.group(0)} — must be 0px"))
-
-    # Check <style> blocks
-    for start_line, css in parser.style_blocks:
-        for i, css_line in enumerate(css.split("\n")):
-            match = br_pattern.search(css_line)
+    ROUNDED_PATTERN = re.compile(r'\brounded(?!-none)\b[\w-]*')
+    BR_PATTERN = re.compile(r'border-radius\s*:\s*(\d+)')
+
+    def on_starttag(self, line, tag, attrs):
+        # Tailwind classes
+        class_str = attrs.get("class")
+        if class_str:
+            matches = self.ROUNDED_PATTERN.findall(class_str)
+            if matches:
+                self.report("FAIL", line,
+                    f"Tailwind rounded class found: {', '.join(matches)} — "
+                    "must be 0px (knife-edge apex)")
+
+        # Inline styles
+        style_str = attrs.get("style")
+        if style_str:
+            match = self.BR_PATTERN.search(style_str)
             if match and int(match.group(1)) > 0:
-                issues.append(Issue("BORDER RADIUS", "FAIL", start_line + i,
-                    f"CSS border-radius: {match.group(0)} — must be 0px"))
+                self.report("FAIL", line,
+                    f"Inline border-radius: {match.group(0)} — must be 0px")
 
-    return issues
+    def on_style_block(self, line, css):
+        for css_line_no, css_line in iter_block_lines(line, css):
+            match = self.BR_PATTERN.search(css_line)
+            if match and int(match.group(1)) > 0:
+                self.report("FAIL", css_line_no,
+                    f"CSS border-radius: {match.group(0)} — must be 0px")
 
 
-def check_animations(parser: AxiaraHTMLParser, raw_lines: list[str]) -> list[Issue]:
+@register_rule
+class AnimationRule(Rule):
     """Check 6: ANIMATIONS — no forbidden animation types.
     Source: directives/axiara-brand.md § Motion Rules (STRICTLY ENFORCED)
     FORBIDDEN: bounce, elastic, spring, zoom, scale (on hover), spin, rotate
+
+    Scans <style>/<script> lines plus class/style attributes — the only
+    places an animation can be declared — instead of every raw line.
     """
-    issues = []
-    forbidden = ["bounce", "elastic", "spring", "zoom", "spin", "rotate"]
-    forbidden_pattern = re.compile(
-        r'\b(' + '|'.join(forbidden) + r')\b', re.IGNORECASE
+    check = "ANIMATIONS"
+
+    FORBIDDEN = ["bounce", "elastic", "spring", "zoom", "spin", "rotate"]
+    FORBIDDEN_PATTERN = re.compile(
+        r'\b(' + '|'.join(FORBIDDEN) + r')\b', re.IGNORECASE
+    )
+    # Only flag if it's in animation/transition/keyframe context
+    ANIM_CONTEXT = re.compile(
+        r'(animation|@keyframes|transition|transform)', re.IGNORECASE
     )
+    # animate-spin, and theme animations named after a forbidden motion
+    # (animate-rotate-slow) whose keyframes live in the built stylesheet
+    TW_FORBIDDEN = re.compile(
+        r'\b(animate-(?:[\w-]*-)?(?:' + '|'.join(FORBIDDEN) + r'|ping)(?:-[\w-]*)?)(?![\w-])')
+
+    def _scan(self, line, text):
+        matches = self.FORBIDDEN_PATTERN.findall(text)
+        if matches and self.ANIM_CONTEXT.search(text):
+            self.report("FAIL", line,
+                f"Forbidden animation keyword: {', '.join(set(matches))} — "
+                "only fade-in-up is allowed")
+
+    def _scan_block(self, start_line, text):
+        for line, line_text in iter_block_lines(start_line, text):
+            # Skip comments
+            stripped = line_text.strip()
+            if stripped.startswith("/*") or stripped.startswith("//"):
+                continue
+            self._scan(line, line_text)
+
+    def on_starttag(self, line, tag, attrs):
+        style_str = attrs.get("style")
+        if style_str:
+            self._scan(line, style_str)
+
+        class_str = attrs.get("class")
+        if class_str:
+            self._scan(line, class_str)
+
+            # Tailwind animation classes
+            matches = self.TW_FORBIDDEN.findall(class_str)
+            if matches:
+                self.report("FAIL", line,
+                    f"Forbidden Tailwind animation: {', '.join(matches)}")
+
+    def on_style_block(self, line, css):
+        self._scan_block(line, css)
+
+    def on_script_block(self, line, js):
+        self._scan_block(line, js)
+
+
+@register_rule
+class HeadingsRule(Rule):
+    """Check 7: HEADINGS — proper heading hierarchy, no skipping levels.
+    Source: directives/qa-checklist.md § Accessibility
+    """
+    check = "HEADINGS"
 
-    # Scan all raw lines for forbidden animation keywords
-    for i, line_text in enumerate(raw_lines, 1):
-        # Skip comments
-        stripped = line_text.strip()
-        if stripped.startswith("/*") or stripped.startswith("//") or stripped.startswith("<!--"):
-            continue
+    HEADING_TAGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
 
-        matches = forbidden_pattern.findall(line_text)
-        if matches:
-            # Check context — only flag if it's in animation/transition/keyframe context
-            anim_context = re.compile(
-                r'(animation|@keyframes|transition|transform)', re.IGNORECASE
-            )
-            if anim_context.search(line_text):
-                issues.append(Issue("ANIMATIONS", "FAIL", i,
-                    f"Forbidden animation keyword: {', '.join(set(matches))} — "
-                    "only fade-in-up is allowed"))
-
-    # Also check Tailwind animation classes
-    tw_forbidden = re.compile(r'\b(animate-bounce|animate-spin|animate-ping)\b')
-    for line, class_str in parser.classes:
-        matches = tw_forbidden.findall(class_str)
-        if matches:
-            issues.append(Issue("ANIMATIONS", "FAIL", line,
-                f"Forbidden Tailwind animation: {', '.join(matches)}"))
+    def __init__(self, emit, page_path=""):
+        super().__init__(emit, page_path)
+        self.prev_level = 0
 
-    return issues
+    def on_starttag(self, line, tag, attrs):
+        level = self.HEADING_TAGS.get(tag)
+        if level is None:
+            return
 
+        # First heading should be h1
+        if self.prev_level == 0 and level != 1:
+            self.report("WARN", line,
+                f"First heading is <h{level}>, expected <h1>")
 
-def check_headings(parser: AxiaraHTMLParser) -> list[Issue]:
-    """Check 7: HEADINGS — proper heading hierarchy, no skipping levels.
-    Source: directives/qa-checklist.md § Accessibility
-    """
-    issues = []
-    if not parser.headings:
-        issues.append(Issue("HEADINGS", "WARN", 0,
-            "No headings found on page"))
-        return issues
-
-    # First heading should be h1
-    first_line, first_level = parser.headings[0]
-    if first_level != 1:
-        issues.append(Issue("HEADINGS", "WARN", first_line,
-            f"First heading is <h{first_level}>, expected <h1>"))
-
-    # Check for skipped levels (e.g., h1 → h3 without h2)
-    prev_level = 0
-    for line, level in parser.headings:
-        if level > prev_level + 1 and prev_level > 0:
-            issues.append(Issue("HEADINGS", "FAIL", line,
-                f"Heading hierarchy skip: <h{prev_level}> → <h{level}> "
-                f"(missing <h{prev_level + 1}>)"))
-        prev_level = level
-
-    return issues
-
-
-def check_accessibility(parser: AxiaraHTMLParser) -> list[Issue]:
+        # Check for skipped levels (e.g., h1 → h3 without h2)
+        if level > self.prev_level + 1 and self.prev_level > 0:
+            self.report("FAIL", line,
+                f"Heading hierarchy skip: <h{self.prev_level}> → <h{level}> "
+                f"(missing <h{self.prev_level + 1}>)")
+        self.prev_level = level
+
+    def finish(self):
+        if self.prev_level == 0:
+            self.report("WARN", 0, "No headings found on page")
+
+
+@register_rule
+class AccessibilityRule(Rule):
     """Check 8: ACCESSIBILITY — alt on images, labels on inputs.
     Source: directives/qa-checklist.md § Accessibility Checks
     """
-    issues = []
-
-    # Check images for alt attribute
-    for line, alt in parser.images:
-        if alt is None:
-            issues.append(Issue("A11Y", "FAIL", line,
-                "Image missing alt attribute"))
-        elif alt == "":
-            # Empty alt is valid for decorative images, but worth noting
-            pass
-
-    # Check form inputs have labels
-    for line, input_type, input_id, input_name in parser.form_inputs:
-        identifier = input_id or input_name or input_type
-        if input_id and input_id in parser.label_fors:
-            continue  # Has a matching <label for="">
-        issues.append(Issue("A11Y", "WARN", line,
+    check = "A11Y"
+
+    def __init__(self, emit, page_path=""):
+        super().__init__(emit, page_path)
+        # Inputs with an id wait for a <label for=""> that may follow;
+        # only unmatched ones are held, keyed by id
+        self.pending_inputs = {}     # {id: (line, identifier)}
+        self.label_fors = set()      # set of "for" attribute values
+
+    def _missing_label(self, line, identifier):
+        self.report("WARN", line,
             f"Form input '{identifier}' may be missing an associated "
-            "<label> element"))
+            "<label> element")
+
+    def on_starttag(self, line, tag, attrs):
+        # Images — empty alt is valid for decorative images
+        if tag == "img":
+            if attrs.get("alt") is None:
+                self.report("FAIL", line, "Image missing alt attribute")
+
+        # Form inputs — skip hidden inputs, they don't need labels
+        elif tag in ("input", "textarea", "select"):
+            input_type = attrs.get("type") or "text"
+            if input_type == "hidden":
+                return
+            input_id = attrs.get("id") or ""
+            identifier = input_id or attrs.get("name") or input_type
+            if not input_id:
+                self._missing_label(line, identifier)  # Nothing to match
+            elif input_id not in self.label_fors:
+                self.pending_inputs.setdefault(input_id, (line, identifier))
 
-    return issues
+        # Labels
+        elif tag == "label":
+            for_attr = attrs.get("for")
+            if for_attr:
+                self.label_fors.add(for_attr)
+                self.pending_inputs.pop(for_attr, None)
 
+    def finish(self):
+        for line, identifier in self.pending_inputs.values():
+            self._missing_label(line, identifier)
 
-def check_reduced_motion(raw_lines: list[str]) -> list[Issue]:
+
+@register_rule
+class ReducedMotionRule(Rule):
     """Check 9: REDUCED MOTION — prefers-reduced-motion present.
     Source: directives/axiara-brand.md § Motion Rules
     Source: directives/build-page.md § Standard Page Structure item 10
     """
-    issues = []
-    full_text = "\n".join(raw_lines)
-    if "prefers-reduced-motion" not in full_text:
-        issues.append(Issue("MOTION PREF", "FAIL", 0,
-            "Missing prefers-reduced-motion media query — "
-            "animations must be disabled for users who prefer reduced motion"))
-    return issues
+    check = "MOTION PREF"
+
+    def __init__(self, emit, page_path=""):
+        super().__init__(emit, page_path)
+        self.found = False
+
+    def _scan(self, line, text):
+        if not self.found and "prefers-reduced-motion" in text:
+            self.found = True
 
+    # CSS media query or JS matchMedia() both count
+    on_style_block = _scan
+    on_script_block = _scan
 
-def check_responsive_h1(parser: AxiaraHTMLParser) -> list[Issue]:
+    def finish(self):
+        if not self.found:
+            self.report("FAIL", 0,
+                "Missing prefers-reduced-motion media query — "
+                "animations must be disabled for users who prefer reduced motion")
+
+
+@register_rule
+class ResponsiveH1Rule(Rule):
     """Check 10: RESPONSIVE H1 — H1 tags must use .text-hero class.
     Source: directives/axiara-brand.md § Responsive Rules
     """
-    issues = []
-    # Identify H1 lines
-    h1_lines = {line for line, level in parser.headings if level == 1}
-    
-    # Check classes on those lines
-    for line, class_str in parser.classes:
-        if line in h1_lines:
-            if "text-hero" not in class_str:
-                issues.append(Issue("RESP H1", "FAIL", line,
-                    "H1 missing '.text-hero' class (required for 40px/56px/72px scaling)"))
-    
-    return issues
-
-
-def check_responsive_grids(parser: AxiaraHTMLParser) -> list[Issue]:
+    check = "RESP H1"
+
+    def on_starttag(self, line, tag, attrs):
+        if tag == "h1":
+            class_str = attrs.get("class")
+            if class_str and "text-hero" not in class_str:
+                self.report("FAIL", line,
+                    "H1 missing '.text-hero' class (required for 40px/56px/72px scaling)")
+
+
+@register_rule
+class ResponsiveGridsRule(Rule):
     """Check 11: RESPONSIVE GRIDS — No multi-column grids on mobile.
     Source: directives/axiara-brand.md § Responsive Rules
-    
+
     Naked classes like 'grid-cols-2' apply to mobile.
     They must be prefixed (e.g. 'md:grid-cols-2') or be 'grid-cols-1'.
     """
-    issues = []
-    # Find naked grid-cols-X where X > 1
+    check = "RESP GRIDS"
+
     # Matches "grid-cols-2", "grid-cols-12" but not "md:grid-cols-2"
-    pattern = re.compile(r'(?<![:\w-])grid-cols-([2-9]|1[0-2])\b')
-    
-    for line, class_str in parser.classes:
-        matches = pattern.findall(class_str)
-        if matches:
-            issues.append(Issue("RESP GRIDS", "FAIL", line,
-                f"Multi-column grid on mobile: 'grid-cols-{matches[0]}' — "
-                "must use breakpoint prefix (e.g. md:grid-cols-2) or grid-cols-1"))
-                
-    return issues
+    PATTERN = re.compile(r'(?<![:\w-])grid-cols-([2-9]|1[0-2])\b')
 
+    def on_starttag(self, line, tag, attrs):
+        class_str = attrs.get("class")
+        if class_str:
+            matches = self.PATTERN.findall(class_str)
+            if matches:
+                self.report("FAIL", line,
+                    f"Multi-column grid on mobile: 'grid-cols-{matches[0]}' — "
+                    "must use breakpoint prefix (e.g. md:grid-cols-2) or grid-cols-1")
 
-def check_skip_link(parser: AxiaraHTMLParser) -> list[Issue]:
-    """Check 12: SSKIP LINK — A 'Skip to content' link must exist.
+
+@register_rule
+class SkipLinkRule(Rule):
+    """Check 12: SKIP LINK — A 'Skip to content' link must exist.
     Source: directives/qa-checklist.md § Accessibility
     """
-    issues = []
-    has_skip = False
-    
-    # Simple heuristic: look for a link with 'skip' in class or text, pointing to an ID
-    for line, href in parser.link_hrefs:
-        # This parser tracks <link> tags, NOT <a> tags.
-        # We need to scan <a> tags. The parser was not tracking <a> tags.
-        pass
-
-    # The parser needs to be updated to track <a> tags/text first.
-    # Since we can't easily change the parser class in this replace block without replacing the whole file,
-    # let's grep the raw text or use the existing text_chunks.
-    
-    # We can scan text_chunks for "Skip to content"
-    for line, text in parser.text_chunks:
-        if "skip to" in text.lower() or "skip navigation" in text.lower():
-            has_skip = True
-            break
-            
-    if not has_skip:
-        issues.append(Issue("A11Y SKIP", "FAIL", 0,
-            "No visible 'Skip to content' link found (required for keyboard navigation)"))
-            
-    return issues
-
-
-def check_contrast(parser: AxiaraHTMLParser) -> list[Issue]:
-    """Check 13: CONTRAST — Warn about Crimson text on Obsidian background.
+    check = "A11Y SKIP"
+
+    def __init__(self, emit, page_path=""):
+        super().__init__(emit, page_path)
+        self.has_skip = False
+
+    def on_text(self, line, text):
+        # Simple heuristic: visible "Skip to content" / "Skip navigation" text
+        if not self.has_skip:
+            lowered = text.lower()
+            if "skip to" in lowered or "skip navigation" in lowered:
+                self.has_skip = True
+
+    def finish(self):
+        if not self.has_skip:
+            self.report("FAIL", 0,
+                "No visible 'Skip to content' link found (required for keyboard navigation)")
+
+
+@register_rule
+class ContrastRule(Rule):
+    """Check 13: CONTRAST — Text below the WCAG AA contrast ratio.
+    Resolves each text run's real foreground and background (Tailwind
+    classes, axiara palette, linked stylesheets, inline styles) and
+    computes the ratio; see execution/contrast.py.
     Source: directives/qa-checklist.md § Color & Contrast
     """
-    issues = []
-    
-    # Check for text-axiara-crimson used without a safe background or on obsidian
-    # This is a loose static check
-    for line, class_str in parser.classes:
-        if "text-axiara-crimson" in class_str:
-            # If it's small text (not text-xl, 2xl, etc) and on obsidian bg
-            is_large = any(x in class_str for x in ["text-xl", "text-2xl", "text-3xl", "text-4xl", "text-hero", "font-bold", "font-black"])
-            
-            if not is_large:
-                 issues.append(Issue("CONTRAST", "WARN", line,
-                    "Crimson text used on small font — verify 4.5:1 contrast against background"))
-
-    return issues
+    check = "CONTRAST"
+
+    def __init__(self, emit, page_path=""):
+        super().__init__(emit, page_path)
+        self.checker = ContrastChecker(report=self._report_finding, page_path=page_path)
+
+    def _report_finding(self, finding):
+        self.report("WARN", finding.line, finding.message())
+
+    def on_starttag(self, line, tag, attrs):
+        self.checker.on_starttag(line, tag, attrs)
+
+    def on_endtag(self, line, tag):
+        self.checker.on_endtag(line, tag)
+
+    def on_text(self, line, text):
+        self.checker.on_text(line, text)
+
+    def on_style_block(self, line, css):
+        self.checker.on_style_block(line, css)
+
+    def on_script_block(self, line, js):
+        self.checker.on_script_block(line, js)
 
 
 # ---------------------------------------------------------------------------
 # Report Formatting
 # ---------------------------------------------------------------------------
 
-def format_report(filepath: str, issues: list[Issue], checks_run: int) -> str:
+def format_report(filepath: str, issues: list[Issue]) -> str:
     """Format the validation report as a readable terminal output."""
     lines = []
     lines.append("")
@@ -564,12 +688,8 @@ def format_report(filepath: str, issues: list[Issue], checks_run: int) -> str:
     lines.append(f"  File: {filepath}")
     lines.append("=" * 64)
 
-    # Group issues by check
-    check_names = [
-        "STRUCTURE", "FONTS", "CSS", "NO EMOJIS", "BORDER RADIUS",
-        "ANIMATIONS", "HEADINGS", "A11Y", "MOTION PREF",
-        "RESP H1", "RESP GRIDS", "A11Y SKIP", "CONTRAST"
-    ]
+    # Group issues by check, in registry order
+    check_names = [rule.check for rule in RULES]
 
     fails = 0
     warns = 0
@@ -615,57 +735,604 @@ def format_report(filepath: str, issues: list[Issue], checks_run: int) -> str:
     return "\n".join(lines)
 
 
+# ---------------------------------------------------------------------------
+# Single-File Validation
+# ---------------------------------------------------------------------------
+
+# Characters fed to the parser per read
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def validate_file(abs_path: str, use_cache: bool = True) -> list[Issue]:
+    """Run every check against one HTML file.
+
+    The file is parsed once into the shared IR (execution/html_ir.py,
+    cached under .tmp/html_ir/) and replayed through the rule dispatcher.
+    Module-level (not nested) so it can be shipped to worker processes
+    by the site-wide mode.
+
+    Args:
+        abs_path: Absolute path to the HTML file
+        use_cache: Reuse/store the parsed IR on disk
+
+    Returns:
+        All issues found, in document order
+    """
+    parser = AxiaraHTMLParser(page_path=abs_path)
+    load_ir(abs_path, use_cache=use_cache).replay(parser)
+    return parser.issues
+
+
+# ---------------------------------------------------------------------------
+# Site-Wide Mode — directory / glob targets validated in a process pool
+# ---------------------------------------------------------------------------
+
+# Directories never descended into when collecting pages
+SKIP_DIRS = {".git", ".tmp", ".venv", "venv", "node_modules", "__pycache__"}
+
+
+def find_html_files(root: str) -> list[str]:
+    """Recursively collect every .html file under root (sorted).
+
+    Ignored directories are pruned before descending, so the walk never
+    enters .git, node_modules or virtualenvs.
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for fname in sorted(filenames):
+            if fname.lower().endswith(".html"):
+                found.append(os.path.join(dirpath, fname))
+    return found
+
+
+def collect_targets(targets: list[str], project_root: str,
+                    strict: bool = True) -> list[str]:
+    """Expand file, directory and glob arguments into absolute HTML paths.
+
+    Each file appears once even if several targets match it; order
+    follows the targets as given. A file target that does not exist is
+    an error (exit 1) when strict, and skipped otherwise (--watch, where
+    an editor's rename-save briefly removes it).
+    """
+    seen = set()
+    files = []
+
+    def add(path):
+        path = os.path.normpath(path)
+        if path not in seen:
+            seen.add(path)
+            files.append(path)
+
+    for target in targets:
+        abs_target = os.path.join(project_root, target)
+        if os.path.isdir(abs_target):
+            for path in find_html_files(abs_target):
+                add(path)
+        elif os.path.isfile(abs_target):
+            add(abs_target)
+        elif glob.has_magic(target):
+            for path in sorted(glob.glob(abs_target, recursive=True)):
+                if os.path.isfile(path) and path.lower().endswith(".html"):
+                    add(path)
+        elif strict:
+            print(f"[ERROR] File not found: {abs_target}")
+            sys.exit(1)
+
+    return files
+
+
+def validate_many(paths: list[str], jobs: int, use_cache: bool = True) -> list[list[Issue]]:
+    """Validate many files, fanning out across a process pool.
+
+    Results are returned in the same order as paths, so the merged
+    report is deterministic regardless of which worker finishes first.
+    """
+    worker = partial(validate_file, use_cache=use_cache)
+    if jobs <= 1 or len(paths) <= 1:
+        return [worker(path) for path in paths]
+
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(worker, paths, chunksize=chunksize))
+
+
+def format_site_report(results: list[tuple[str, list[Issue]]]) -> str:
+    """Merge per-file issue lists into one site-wide report."""
+    lines = []
+    lines.append("")
+    lines.append("=" * 64)
+    lines.append("  AXIARA HTML VALIDATOR — SITE MODE")
+    lines.append(f"  Files: {len(results)}")
+    lines.append("=" * 64)
+
+    failed_files = 0
+    total_fails = 0
+    total_warns = 0
+
+    for filepath, issues in results:
+        fails = sum(1 for i in issues if i.severity == "FAIL")
+        warns = len(issues) - fails
+        total_fails += fails
+        total_warns += warns
+
+        if fails:
+            status = "❌ FAIL"
+            failed_files += 1
+        elif warns:
+            status = "⚠️  WARN"
+        else:
+            status = "✅ PASS"
+
+        lines.append(f"\n  [{status}] {filepath} "
+                     f"({fails} failures, {warns} warnings)")
+
+        for issue in issues:
+            loc = f"L{issue.line}" if issue.line > 0 else "   "
+            marker = "✗" if issue.severity == "FAIL" else "!"
+            lines.append(f"    {marker} {loc} [{issue.check}]: {issue.message}")
+
+    # Summary
+    lines.append("")
+    lines.append("-" * 64)
+    lines.append(f"  RESULT: {len(results) - failed_files} files passed, "
+                 f"{failed_files} failed ({total_fails} failures, "
+                 f"{total_warns} warnings)")
+
+    if failed_files == 0:
+        lines.append("  STATUS: ✅ ALL FILES PASSED")
+    else:
+        lines.append("  STATUS: ❌ BRAND COMPLIANCE ISSUES FOUND")
+
+    lines.append("=" * 64)
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Streaming Mode — constant memory, issues printed as they are found
+# ---------------------------------------------------------------------------
+
+# Issue severity → qa_emit level
+EMIT_LEVELS = {"FAIL": "error", "WARN": "warning"}
+
+
+def stream_validate(paths: list[str], project_root: str,
+                    chunk_size: int = STREAM_CHUNK_SIZE,
+                    emitter=None) -> tuple[int, int]:
+    """Validate files one after another, printing each issue immediately.
+
+    Nothing is accumulated: issues go straight to stdout as the rules
+    report them, and only running totals are kept. Intended for very large
+    documents (long-form legal/insight pages, concatenated export bundles).
+    With an emitter (--format jsonl/sarif) each issue is written through
+    it instead of as a text line.
+
+    Returns:
+        (fail_count, warn_count)
+    """
+    totals = {"FAIL": 0, "WARN": 0}
+
+    for abs_path in paths:
+        rel_path = os.path.relpath(abs_path, project_root)
+
+        def emit(issue, rel_path=rel_path):
+            totals[issue.severity] += 1
+            if emitter:
+                emitter.finding(rel_path, issue.check, EMIT_LEVELS[issue.severity],
+                                issue.message, issue.line)
+            else:
+                print(f"{rel_path}:{issue.line}: {issue.severity} "
+                      f"[{issue.check}] {issue.message}", flush=True)
+
+        feed_file(AxiaraHTMLParser(emit=emit, page_path=abs_path), abs_path, chunk_size)
+
+    if emitter:
+        emitter.close({"files": len(paths), "failures": totals["FAIL"],
+                       "warnings": totals["WARN"]})
+    else:
+        print(f"RESULT: {len(paths)} files, {totals['FAIL']} failures, "
+              f"{totals['WARN']} warnings")
+    return totals["FAIL"], totals["WARN"]
+
+
+def select_since(files: list[str], ref: str, project_root: str,
+                 use_cache: bool = True) -> list[str]:
+    """Keep only the files changed since a git ref or depending on a change.
+
+    A page is selected if it changed itself, or if it includes/fetches a
+    changed shared file (src/components/*.html, src/css/axiara.css, ...)
+    — see execution/site_deps.py.
+    """
+    # Imported lazily: site_deps builds on check_links, which imports this module
+    from site_deps import affected_pages, git_changed_files
+
+    changed = git_changed_files(ref, project_root)
+    affected = affected_pages(changed, project_root, use_cache=use_cache)
+    selected = [path for path in files
+                if os.path.relpath(path, project_root).replace(os.sep, "/") in affected]
+
+    print(f"[SINCE] {ref}: {len(changed)} changed file(s) → "
+          f"{len(selected)} of {len(files)} page(s) to validate")
+    return selected
+
+
+# ---------------------------------------------------------------------------
+# Watch Mode — one warm process, re-validate only what changed
+# ---------------------------------------------------------------------------
+
+# Seconds between polls of the watched tree
+WATCH_INTERVAL = 0.5
+
+
+def issue_key(issue: Issue) -> tuple:
+    """Identity of an issue across edits (line numbers shift as you type)."""
+    return issue.check, issue.severity, issue.message
+
+
+def diff_issues(old: list[Issue], new: list[Issue]) -> tuple[list[Issue], list[Issue]]:
+    """Split a re-validation into (introduced, resolved) issues."""
+    old_counts = Counter(issue_key(i) for i in old)
+    new_counts = Counter(issue_key(i) for i in new)
+
+    introduced = []
+    added = new_counts - old_counts
+    for issue in new:
+        if added[issue_key(issue)] > 0:
+            added[issue_key(issue)] -= 1
+            introduced.append(issue)
+
+    resolved = []
+    removed = old_counts - new_counts
+    for issue in old:
+        if removed[issue_key(issue)] > 0:
+            removed[issue_key(issue)] -= 1
+            resolved.append(issue)
+
+    return introduced, resolved
+
+
+def watch(targets: list[str], project_root: str, jobs: int,
+          interval: float = WATCH_INTERVAL, use_cache: bool = True) -> None:
+    """Validate once, then poll the targets and re-validate changed files.
+
+    Files are re-checked only when their (mtime, size) changes AND their
+    content hash differs, so touching a file or saving it unchanged costs
+    one stat and one hash. Each change prints the issues it introduced
+    (+) and resolved (-). A target that disappears is reported as removed
+    and picked up again as added when it comes back. Runs until
+    interrupted with Ctrl-C.
+    """
+    # path -> [stat_signature, content_hash, issues]
+    state = {}
+
+    def signature(path):
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    files = collect_targets(targets, project_root, strict=False)
+    results = validate_many(files, jobs, use_cache)
+    for path, issues in zip(files, results):
+        state[path] = [signature(path), file_hash(path), issues]
+
+    fails = sum(1 for r in results for i in r if i.severity == "FAIL")
+    print(f"[WATCH] {len(files)} files, {fails} failures — "
+          f"polling every {interval}s (Ctrl-C to stop)", flush=True)
+
+    try:
+        while True:
+            time.sleep(interval)
+            started = time.perf_counter()
+            changes = []
+
+            current = collect_targets(targets, project_root, strict=False)
+            for path in current:
+                try:
+                    sig = signature(path)
+                except OSError:
+                    continue  # Removed between walk and stat
+                entry = state.get(path)
+                if entry and entry[0] == sig:
+                    continue
+                content_hash = file_hash(path)
+                if entry and entry[1] == content_hash:
+                    entry[0] = sig
+                    continue
+                old_issues = entry[2] if entry else []
+                try:
+                    new_issues = validate_file(path, use_cache)
+                except (OSError, UnicodeDecodeError) as e:
+                    print(f"[WATCH] {path}: {e}", flush=True)
+                    continue
+                state[path] = [sig, content_hash, new_issues]
+                changes.append((path, old_issues, new_issues, entry is None))
+
+            for path in set(state) - set(current):
+                changes.append((path, state.pop(path)[2], [], False))
+
+            if not changes:
+                continue
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            stamp = time.strftime("%H:%M:%S")
+            for path, old_issues, new_issues, is_new in changes:
+                rel_path = os.path.relpath(path, project_root)
+                introduced, resolved = diff_issues(old_issues, new_issues)
+                fails = sum(1 for i in new_issues if i.severity == "FAIL")
+                label = "added" if is_new else ("removed" if path not in state else "changed")
+                print(f"\n[{stamp}] {rel_path} {label} — "
+                      f"{len(introduced)} new, {len(resolved)} resolved, "
+                      f"{fails} failures ({elapsed_ms:.0f}ms)")
+                for issue in introduced:
+                    print(f"  + L{issue.line} {issue.severity} "
+                          f"[{issue.check}] {issue.message}")
+                for issue in resolved:
+                    print(f"  - L{issue.line} {issue.severity} "
+                          f"[{issue.check}] {issue.message}")
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        print("\n[WATCH] stopped")
+
+
+# ---------------------------------------------------------------------------
+# Result Cache — content-hash keyed, persisted under .tmp/
+# ---------------------------------------------------------------------------
+
+# Bump when report semantics change without a source change in this file
+VALIDATOR_VERSION = "3"
+
+# Cache file (relative to project root) and its size bound
+CACHE_FILE = ".tmp/validate_html_cache.json"
+CACHE_MAX_ENTRIES = 5000
+
+# <link> tags and their attributes, for the stylesheets in each cache key
+LINK_TAG_RE = re.compile(r"<link\b[^>]*>", re.I)
+LINK_ATTR_RE = re.compile(r"""([\w-]+)\s*=\s*(["'])(.*?)\2""", re.S)
+
+
+def ruleset_hash() -> str:
+    """Hash of the validator version, the rule set, the rules' source and
+    the site-wide palette sources.
+
+    Any edit to a rule (here or in the contrast engine) changes the source
+    bytes, so stale results from an older rule set are never replayed.
+    CONTRAST verdicts also depend on the Tailwind palette
+    (src/tailwind.config.js, src/tailwind.pages.json) and the variables
+    of generate_css.block_b_variables(), so those files are hashed too;
+    linked stylesheets are covered per page by cache_key().
+    """
+    digest = hashlib.sha256()
+    digest.update(VALIDATOR_VERSION.encode())
+    digest.update("|".join(rule.__name__ for rule in RULES).encode())
+    for source in (__file__, contrast.__file__):
+        with open(os.path.abspath(source), "rb") as f:
+            digest.update(f.read())
+    project_root = contrast.resolve_project_root()
+    palette_sources = (
+        os.path.join(project_root, contrast.TAILWIND_CONFIG),
+        os.path.join(project_root, contrast.PAGE_CONFIGS),
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "generate_css.py"),
+    )
+    for source in palette_sources:
+        digest.update(file_hash(source).encode() if os.path.isfile(source) else b"-")
+    return digest.hexdigest()
+
+
+def linked_stylesheets(abs_path: str) -> list[str]:
+    """Project stylesheets a page links, resolved as the CONTRAST check does."""
+    with open(abs_path, "r", encoding="utf-8", errors="replace") as f:
+        html = f.read()
+    project_root = contrast.resolve_project_root()
+    tailwind_css = os.path.join(project_root, contrast.TAILWIND_CSS)
+    sheets = []
+    for tag in LINK_TAG_RE.findall(html):
+        attrs = {name.lower(): value for name, _, value in LINK_ATTR_RE.findall(tag)}
+        if "stylesheet" not in attrs.get("rel", "").lower():
+            continue
+        path = contrast.find_stylesheet(project_root, attrs.get("href", ""),
+                                        os.path.dirname(abs_path))
+        if path and path != tailwind_css:
+            sheets.append(path)
+    return sheets
+
+
+def cache_key(abs_path: str) -> str:
+    """Result-cache key: the page's content hash plus its linked stylesheets.
+
+    CONTRAST verdicts depend on the stylesheets a page links, so editing
+    one invalidates exactly the pages that link it, and identical pages
+    resolving to different stylesheets do not share results.
+    """
+    content_hash = file_hash(abs_path)
+    sheets = linked_stylesheets(abs_path)
+    if not sheets:
+        return content_hash
+    digest = hashlib.sha256(content_hash.encode())
+    for sheet in sheets:
+        digest.update(file_hash(sheet).encode())
+    return digest.hexdigest()
+
+
+def load_cache(cache_path: str, ruleset: str) -> dict:
+    """Load cached results ({cache_key: [Issue, ...]}).
+
+    Returns an empty cache if the file is missing, unreadable, or was
+    written by a different rule set.
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if data.get("ruleset") != ruleset:
+        return {}
+
+    return {
+        key: [Issue(*issue) for issue in issues]
+        for key, issues in data.get("entries", {}).items()
+    }
+
+
+def save_cache(cache_path: str, ruleset: str, entries: dict) -> None:
+    """Persist cached results atomically, keeping the newest entries."""
+    keys = list(entries)[-CACHE_MAX_ENTRIES:]
+    data = {
+        "ruleset": ruleset,
+        "entries": {key: [list(issue) for issue in entries[key]] for key in keys},
+    }
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, cache_path)
+
+
+def validate_cached(paths: list[str], jobs: int, cache: dict,
+                    use_cache: bool = True) -> tuple[list[list[Issue]], dict]:
+    """Validate files, replaying cached results for unchanged content.
+
+    Byte-identical files linking the same stylesheets (e.g. the copies in
+    axiara-deploy-v1/) share one cache key, so each distinct file body is
+    validated at most once per run. The cache dict is updated in place; entries used in this run
+    are moved to the end so save_cache() keeps them.
+
+    Returns:
+        (per-file issue lists in path order, stats dict)
+    """
+    hashes = [cache_key(path) for path in paths]
+
+    # One representative path per distinct cache key not yet cached
+    pending = {}
+    for path, key in zip(paths, hashes):
+        if key not in cache and key not in pending:
+            pending[key] = path
+
+    fresh = validate_many(list(pending.values()), jobs, use_cache)
+    cache.update(zip(pending.keys(), fresh))
+
+    for key in dict.fromkeys(hashes):
+        cache[key] = cache.pop(key)
+
+    stats = {
+        "files": len(paths),
+        "validated": len(pending),
+        "replayed": len(paths) - len(pending),
+        "unique": len(set(hashes)),
+    }
+    return [cache[key] for key in hashes], stats
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 execution/validate_html.py <filepath>")
-        print("Example: python3 execution/validate_html.py "
-              "src/pages/services/sprint.html")
-        sys.exit(1)
-
-    filepath = sys.argv[1]
+    parser = argparse.ArgumentParser(
+        description="Validate Axiara HTML pages against brand rules.",
+        epilog="Examples: python3 execution/validate_html.py "
+               "src/pages/services/sprint.html | "
+               "python3 execution/validate_html.py . | "
+               "python3 execution/validate_html.py 'services/*.html'"
+    )
+    parser.add_argument(
+        "targets", nargs="+",
+        help="HTML file(s), directories or glob patterns, "
+             "relative to project root"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Worker processes for multi-file runs (default: all cores)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Ignore and do not update the result and IR caches "
+             f"({CACHE_FILE}, .tmp/html_ir/)"
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Constant-memory mode: feed files in chunks and print issues "
+             "as they are found (no cache, no grouped report)"
+    )
+    parser.add_argument(
+        "--format", choices=FORMATS, default="text",
+        help="jsonl/sarif: stream every issue as it is found, in that "
+             "format, instead of the text report (implies --stream)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=STREAM_CHUNK_SIZE,
+        help=f"Characters per read in --stream mode (default: {STREAM_CHUNK_SIZE})"
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Keep running; re-validate files as they change and print "
+             "new/resolved issues"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=WATCH_INTERVAL,
+        help=f"Seconds between polls in --watch mode (default: {WATCH_INTERVAL})"
+    )
+    parser.add_argument(
+        "--since", metavar="REF",
+        help="Only validate pages changed since a git ref, plus pages that "
+             "depend on a changed shared component"
+    )
+    args = parser.parse_args()
+    if args.watch and args.since:
+        parser.error("--watch and --since cannot be combined")
 
     # Resolve relative to project root
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
-    abs_path = os.path.join(project_root, filepath)
 
-    if not os.path.isfile(abs_path):
-        print(f"[ERROR] File not found: {abs_path}")
+    files = collect_targets(args.targets, project_root)
+    if not files:
+        print(f"[ERROR] No .html files found in: {', '.join(args.targets)}")
         sys.exit(1)
 
-    # Read the file
-    with open(abs_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    raw_lines = content.split("\n")
-
-    # Parse HTML
-    parser = AxiaraHTMLParser()
-    parser.feed(content)
-
-    # Run all 9 checks
-    all_issues: list[Issue] = []
-    all_issues.extend(check_structure(parser))
-    all_issues.extend(check_fonts(parser))
-    all_issues.extend(check_css(parser))
-    all_issues.extend(check_emojis(parser))
-    all_issues.extend(check_border_radius(parser, raw_lines))
-    all_issues.extend(check_animations(parser, raw_lines))
-    all_issues.extend(check_headings(parser))
-    all_issues.extend(check_accessibility(parser))
-    all_issues.extend(check_reduced_motion(raw_lines))
-    all_issues.extend(check_responsive_h1(parser))
-    all_issues.extend(check_responsive_grids(parser))
-    all_issues.extend(check_skip_link(parser))
-    all_issues.extend(check_contrast(parser))
-
-    # Print report
-    report = format_report(filepath, all_issues, checks_run=11)
-    print(report)
+    if args.since:
+        files = select_since(files, args.since, project_root,
+                             use_cache=not args.no_cache)
+        if not files:
+            print("  STATUS: ✅ NOTHING TO VALIDATE")
+            sys.exit(0)
+
+    if args.watch:
+        watch(args.targets, project_root, args.jobs, args.interval,
+              use_cache=not args.no_cache)
+        sys.exit(0)
+
+    if args.stream or args.format != "text":
+        emitter = make_emitter(args.format, "validate_html")
+        fails, _ = stream_validate(files, project_root, args.chunk_size, emitter)
+        sys.exit(1 if fails else 0)
+
+    # Single file given directly: keep the detailed per-check report
+    single = (len(args.targets) == 1 and len(files) == 1
+              and os.path.isfile(os.path.join(project_root, args.targets[0])))
+
+    # Replay unchanged files from the content-hash cache
+    cache_path = os.path.join(project_root, CACHE_FILE)
+    ruleset = ruleset_hash()
+    cache = {} if args.no_cache else load_cache(cache_path, ruleset)
+
+    results, stats = validate_cached(files, args.jobs, cache,
+                                     use_cache=not args.no_cache)
+    all_issues = [issue for issues in results for issue in issues]
+
+    if not args.no_cache and stats["validated"]:
+        save_cache(cache_path, ruleset, cache)
+
+    if single:
+        print(format_report(args.targets[0], all_issues))
+    else:
+        rel_paths = [os.path.relpath(path, project_root) for path in files]
+        print(format_site_report(list(zip(rel_paths, results))))
+        print(f"  [CACHE] {stats['validated']} validated, "
+              f"{stats['replayed']} replayed "
+              f"({stats['unique']} distinct of {stats['files']} files)")
 
     # Exit code: 1 if any FAILs, 0 otherwise
     has_fails = any(i.severity == "FAIL" for i in all_issues)